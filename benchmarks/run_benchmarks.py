@@ -0,0 +1,624 @@
+from design.dsp.goertzel import GoertzelTracker
+from design.dsp.graph import NODE_TYPES, BiquadNode, BuildSignalGraph, HarmonicsNode, MeasureNode, PeaksNode, Ref, RegisterNodeType, SineNode, SpectrumNode
+from design.dsp.measurements import MeasureSignal
+from design.dsp.search import FindNearestIndex
+from design.models.plot_controls_model import PlotControlsModel
+from design.sources.file_export import WAV_SAMPLE_FORMATS, IterateChunks, SignalExporter
+from design.sources.file_import import SignalImporter
+from design.sources.shared_ring import SharedRingBuffer
+from design.sources.socket_source import SendFrames, SocketSampleSource
+from design.sources.summary_index import SummaryIndex
+from design.sources.tone_generator import GENERATOR_SAMPLE_RATES, DeadlineScheduler, NullSink, OpenSink, RampedSine
+from design.sources.udp_source import SendSine, UdpSampleReceiver
+from controls import Button, Label, ThemeRegistry, Window
+import dearpygui.dearpygui as dpg
+import multiprocessing
+import tracemalloc
+import numpy as np
+import threading
+import tempfile
+import argparse
+import asyncio
+import struct
+import typing
+import wave
+import time
+import sys
+import os
+
+# Benchmarks of the DSP, source and UI layers, run from the repository root with
+# python -m benchmarks.run_benchmarks [--quick] [name ...]. The summary index and the export run
+# at the sizes they were written for by default, a half GB capture and an hour of signal, and
+# need about 1.5 GB of temporary files. --quick runs them on small sizes
+
+def BenchmarkGoertzel(samples: int = 48000, max_bins: int = 32, repeats: int = 10) -> None:
+    """
+    Compare the goertzel tracker against computing the whole spectrum with rfft for 1 .. max_bins bins
+    """
+
+    sample_rate = 48000.0
+    y_data      = np.random.default_rng(0).standard_normal(samples)
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        np.abs(np.fft.rfft(y_data))
+    rfft_time = (time.perf_counter() - start) / repeats
+
+    print(f"rfft of {samples} samples: {'{:.3f}'.format(rfft_time * 1e3)} ms")
+    for bins in range(1, max_bins + 1):
+        tracker = GoertzelTracker(np.linspace(100, 10000, bins), sample_rate, block_size=samples)
+        start   = time.perf_counter()
+        for _ in range(repeats):
+            tracker.Process(y_data)
+        goertzel_time = (time.perf_counter() - start) / repeats
+
+        print(f"goertzel, {bins:>2} bins: {'{:.3f}'.format(goertzel_time * 1e3)} ms per block "
+              f"({'{:.2f}'.format(rfft_time / goertzel_time)}x rfft)")
+
+def BenchmarkControlCreation(count: int = 10000) -> None:
+    """
+    Create a mix of styled and unstyled controls and report the creation time and how many DearPyGUI items they cost
+    """
+
+    dpg.create_context()
+    window = Window()
+    before = len(dpg.get_all_items())
+
+    start = time.perf_counter()
+    for index in range(count):
+        if index % 2:
+            Label(label="Label", parent=window)
+        else:
+            Button(label="Button", parent=window).ChangeBackgroundColor([36, 183, 199]).BindTheme()
+    elapsed = time.perf_counter() - start
+
+    print(f"Created {count} controls in {'{:.1f}'.format(elapsed * 1e3)} ms, DearPyGUI items {before} -> {len(dpg.get_all_items())}")
+
+    ThemeRegistry.Clear()
+    dpg.destroy_context()
+
+def BenchmarkNearestSample(samples: int = 1_000_000, lookups: int = 100_000) -> None:
+    """
+    Time a single nearest sample lookup on a large buffer, which is what the hover readout pays per frame
+    """
+
+    x_data  = np.linspace(0, 1, samples)
+    targets = np.random.default_rng(0).uniform(-0.1, 1.1, lookups)
+
+    start = time.perf_counter()
+    for target in targets:
+        FindNearestIndex(x_data, target)
+    elapsed = (time.perf_counter() - start) / lookups
+
+    print(f"Nearest sample in {samples} samples: {'{:.2f}'.format(elapsed * 1e6)} us per lookup")
+
+def BenchmarkNotifications(properties: int = 100, frames: int = 20000) -> None:
+    """
+    Compare the per frame cost of polling every bound property against dispatching notifications,
+    both for idle frames and for frames where one property changed
+    """
+
+    # Polling keeps a last seen copy of every property and compares them all each frame
+    events    = [threading.Event() for _ in range(properties)]
+    locks     = [threading.Lock() for _ in range(properties)]
+    values    = [0.0] * properties
+    last_seen = [(False, 0.0)] * properties
+
+    def Poll() -> int:
+        changed = 0
+        for index in range(properties):
+            with locks[index]:
+                current = (events[index].is_set(), values[index])
+            if current != last_seen[index]:
+                last_seen[index] = current
+                changed         += 1
+        return changed
+
+    model   = PlotControlsModel()
+    handled = []
+    names   = [f"property_{index}" for index in range(properties)]
+    for name in names:
+        model.Subscribe(name, handled.append)
+
+    def Time(function: typing.Any, change: bool, notify: bool) -> float:
+        start = time.perf_counter()
+        for frame in range(frames):
+            if change:
+                values[frame % properties] = frame
+                if notify:
+                    model.Notify(names[frame % properties])
+            function()
+        return (time.perf_counter() - start) / frames * 1e6
+
+    for change in (False, True):
+        poll_time     = Time(Poll, change, notify=False)
+        dispatch_time = Time(model.DispatchNotifications, change, notify=True)
+        print(f"{properties} properties, {'one change' if change else 'idle'} per frame: polling {'{:.2f}'.format(poll_time)} us, "
+              f"notifications {'{:.2f}'.format(dispatch_time)} us")
+
+def BenchmarkUdpSource(seconds: float = 2.0, sample_rate: float = 500_000, frame_rate: float = 60.0) -> None:
+    """
+    Run the UDP sender, the receiver and a stand-in for the render loop taking the samples out of the model
+    once per frame, all on one event loop, and report the rates that were sustained
+    """
+
+    async def Run() -> None:
+        model    = PlotControlsModel()
+        receiver = await UdpSampleReceiver(model, sample_rate).Open()
+        received = 0
+
+        async def Consume() -> None:
+            nonlocal received
+            while True:
+                samples, _ = model.TakePublishedSamples()
+                received  += len(samples)
+                await asyncio.sleep(1 / frame_rate)
+
+        receiving = asyncio.ensure_future(receiver.Run())
+        consuming = asyncio.ensure_future(Consume())
+        start     = time.perf_counter()
+        sent      = await SendSine("127.0.0.1", receiver.port, sample_rate=sample_rate, duration=seconds)
+
+        # Let the last packets drain through
+        await asyncio.sleep(0.2)
+        elapsed = time.perf_counter() - start
+        receiving.cancel()
+        consuming.cancel()
+        await asyncio.gather(receiving, consuming, return_exceptions=True)
+
+        print(f"Sent {sent} samples ({'{:.0f}'.format(sent / seconds)} samples/s), received {receiver.samples} "
+              f"({'{:.0f}'.format(receiver.samples / elapsed)} samples/s, {sent - receiver.samples} lost), "
+              f"taken by the frames {received}, dropped by the model {model.GetPublishedDropped()}")
+
+    asyncio.run(Run())
+
+def ProduceRingFrames(name: str, seconds: float, chunk_frames: int, channels: int, rate: float, started: multiprocessing.Event) -> None:
+    """
+    Benchmark producer, writes the same chunk so only the transport is measured. Without a rate it
+    writes as fast as it can, otherwise a chunk is written whenever one falls due
+    """
+
+    ring    = SharedRingBuffer.Attach(name, untrack=False)
+    chunk   = np.random.default_rng(0).standard_normal((chunk_frames, channels)).astype(ring.dtype)
+    written = 0
+
+    started.wait()
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        if rate is None or written + chunk_frames <= (time.perf_counter() - start) * rate:
+            ring.Write(chunk)
+            written += chunk_frames
+
+    ring.Close()
+
+def RunSharedRing(seconds: float, capacity: int, chunk_frames: int, channels: int, rate: float) -> None:
+    """
+    Run a producer process against a consumer copying every frame out, and report the throughput and
+    how much the consumer was lapped by
+    """
+
+    name    = f"ring_benchmark_{multiprocessing.current_process().pid}"
+    ring    = SharedRingBuffer.Create(name, capacity, channels=channels, dtype="<f4", sample_rate=1e6)
+    started = multiprocessing.Event()
+    process = multiprocessing.Process(target=ProduceRingFrames, args=(name, seconds, chunk_frames, channels, rate, started))
+    process.start()
+
+    # Consume with a preallocated destination, as a plot window would
+    window   = np.empty((capacity, channels), dtype=ring.dtype)
+    consumed = 0
+    started.set()
+    start    = time.perf_counter()
+    while process.is_alive() or ring.GetWriteIndex() > ring.read_index:
+        views = ring.Read()
+        for view in views:
+            window[:len(view)] = view
+            consumed          += len(view)
+        del views
+        consumed -= ring.GetOverwritten()
+    elapsed = time.perf_counter() - start
+    process.join()
+
+    written = ring.GetWriteIndex()
+    frame   = channels * ring.dtype.itemsize
+    print(f"{'Unpaced' if rate is None else f'{rate:.0f} frames/s'}: producer wrote {written} frames ({'{:.2f}'.format(written * frame / elapsed / 1e9)} GB/s), consumer read "
+          f"{consumed} ({'{:.2f}'.format(consumed * frame / elapsed / 1e9)} GB/s), dropped {ring.dropped} "
+          f"({'{:.2f}'.format(100 * ring.dropped / max(written, 1))} %)")
+
+    ring.Close()
+
+def BenchmarkSharedRing(seconds: float = 2.0, capacity: int = 1 << 20, chunk_frames: int = 1 << 14, channels: int = 2) -> None:
+    """
+    Run the shared memory ring unpaced and paced at 100M frames/s
+    """
+    for rate in (None, 100e6):
+        RunSharedRing(seconds, capacity, chunk_frames, channels, rate)
+
+def BenchmarkSocketSource(seconds: float = 1.0, address: str = "unix:/tmp/mvc_socket_benchmark.sock") -> None:
+    """
+    Send unpaced frames at a consumer that takes the published samples once per frame, and again with a
+    consumer that stalls so the backpressure policies kick in
+    """
+
+    for policy, frame_rate in (("drop", 60.0), ("drop", 2.0), ("decimate", 2.0)):
+        model  = PlotControlsModel()
+        source = SocketSampleSource(model, address, policy=policy).Start()
+        taken  = 0
+        done   = threading.Event()
+
+        def Consume() -> None:
+            nonlocal taken
+            while not done.is_set():
+                samples, _ = model.TakePublishedSamples()
+                taken     += len(samples)
+                time.sleep(1 / frame_rate)
+
+        consumer = threading.Thread(target=Consume)
+        consumer.start()
+        start    = time.perf_counter()
+        sent     = SendFrames(address, duration=seconds, paced=False)
+        time.sleep(0.3)
+        elapsed  = time.perf_counter() - start
+        done.set()
+        consumer.join()
+        source.Stop()
+
+        print(f"{policy:>8}, consumer at {frame_rate:.0f} fps: sent {sent} frames, {'{:.0f}'.format(source.bytes / elapsed / 1e6)} MB/s, "
+              f"{'{:.0f}'.format(source.frames / elapsed)} frames/s, dropped {source.dropped} "
+              f"({'{:.1f}'.format(100 * source.dropped / max(source.frames, 1))} %), lost {source.lost}, model dropped {model.GetPublishedDropped()}")
+
+def BenchmarkFileImport(samples: int = 400_000, binary_samples: int = 10_000_000) -> None:
+    """
+    Import a CSV and a .npy file, reporting the throughput, how soon the first preview is available
+    and how fast a cancel takes effect
+    """
+
+    directory = tempfile.mkdtemp()
+    csv_path  = os.path.join(directory, "signal.csv")
+    npy_path  = os.path.join(directory, "signal.npy")
+
+    time_data = np.arange(samples) / 48000
+    np.savetxt(csv_path, np.column_stack((time_data, np.sin(2 * np.pi * 1000 * time_data))), delimiter=",", fmt="%.9f", header="time,value", comments="")
+    np.save(npy_path, np.sin(np.arange(binary_samples, dtype=np.float32) * np.float32(0.01)))
+
+    try:
+        for path in (csv_path, npy_path):
+            first    = []
+            importer = SignalImporter(path, on_progress=lambda: first.append(time.perf_counter()) if not first else None).Start()
+            importer.Wait()
+            progress = importer.GetProgress()
+            print(f"{importer.format:>4}: {'{:.0f}'.format(progress['total_bytes'] / 1e6)} MB in {'{:.2f}'.format(progress['elapsed'])} s "
+                  f"({'{:.0f}'.format(progress['bytes_per_s'] / 1e6)} MB/s), {len(importer.GetData())} samples at "
+                  f"{'{:.0f}'.format(importer.sample_rate)} Hz, first preview after {'{:.0f}'.format((first[0] - importer.start_time) * 1e3)} ms")
+
+            # The default files are about one chunk long, smaller chunks give the cancel something to interrupt
+            importer = SignalImporter(path, chunk_bytes=1 << 20).Start()
+            time.sleep(0.005)
+            cancelled = time.perf_counter()
+            importer.Cancel()
+            importer.Wait()
+            print(f"{importer.format:>4}: cancelled at {'{:.0f}'.format(100 * importer.GetProgress()['fraction'])} % "
+                  f"in {'{:.0f}'.format((time.perf_counter() - cancelled) * 1e3)} ms")
+    finally:
+        for path in (csv_path, npy_path):
+            os.remove(path)
+        os.rmdir(directory)
+
+def BenchmarkSummaryIndex(samples: int = 1 << 27, pixels: int = 2000, queries: int = 200) -> None:
+    """
+    Index a float32 capture of samples, time viewport queries at every zoom depth, then append to the capture
+    and rewrite it to show the incremental update and the rebuild of a stale index. The default spans six
+    levels, so the whole capture is drawn from a level above the first
+    """
+
+    directory = tempfile.mkdtemp()
+    path      = os.path.join(directory, "capture.bin")
+    rng       = np.random.default_rng(0)
+
+    chunk = 1 << 22
+    with open(path, "wb") as file:
+        for start in range(0, samples, chunk):
+            n = np.arange(start, min(start + chunk, samples))
+            file.write((np.sin(n * 1e-4) + 0.1 * rng.standard_normal(len(n))).astype("<f4").tobytes())
+
+    try:
+        index   = SummaryIndex(path)
+        started = time.perf_counter()
+        index.Update()
+        elapsed = time.perf_counter() - started
+        print(f"Indexed {samples * 4 / 1e6:.0f} MB in {elapsed:.2f} s ({samples * 4 / elapsed / 1e9:.2f} GB/s), "
+              f"sidecar {os.path.getsize(index.index_path) / 1e6:.1f} MB, {len(index.levels)} levels")
+
+        # Reopening a fresh index costs a stat and a hash of its first 64 KB
+        started = time.perf_counter()
+        index.Close()
+        index   = SummaryIndex(path)
+        print(f"Reopened in {(time.perf_counter() - started) * 1e3:.2f} ms, fresh {index.IsFresh()}")
+
+        for span in (samples, samples // 64, samples // 4096, 1 << 16, 1000):
+            times = []
+            for first in rng.integers(0, samples - span + 1, queries):
+                started = time.perf_counter()
+                x_data, minimum, maximum, mean = index.Query(first, first + span, pixels)
+                times.append(time.perf_counter() - started)
+            times = np.array(times) * 1e3
+            print(f"Query of {span:>10} samples: {len(x_data):>5} entries, {np.mean(times):.3f} ms mean, {np.percentile(times, 99):.3f} ms p99")
+
+        # The whole span must agree with a scan of the capture
+        x_data, minimum, maximum, mean = index.Query(0, samples, pixels)
+        capture = np.memmap(path, dtype="<f4", mode="r")
+        print(f"Full view matches a scan: {np.isclose(minimum.min(), capture.min()) and np.isclose(maximum.max(), capture.max())}")
+        del capture
+
+        with open(path, "ab") as file:
+            file.write(rng.standard_normal(1 << 20).astype("<f4").tobytes())
+        started = time.perf_counter()
+        indexed = index.Update()
+        print(f"Appended {1 << 20} samples, indexed {indexed} in {(time.perf_counter() - started) * 1e3:.1f} ms")
+
+        with open(path, "r+b") as file:
+            file.write(np.ones(16, dtype="<f4").tobytes())
+        index.Refresh()
+        print(f"Rewritten capture: rebuilds {index.rebuilds}, indexed {index.GetIndexed()}")
+        index.Close()
+    finally:
+        for name in os.listdir(directory):
+            os.remove(os.path.join(directory, name))
+        os.rmdir(directory)
+
+def FindWavData(path: str) -> int:
+    """
+    Find the offset of the data chunk of a WAV file
+    """
+
+    with open(path, "rb") as file:
+        file.seek(12)
+        while True:
+            chunk_id, size = struct.unpack("<4sI", file.read(8))
+            if chunk_id == b"data":
+                return file.tell()
+            file.seek(size + size % 2, os.SEEK_CUR)
+
+def BenchmarkFileExport(seconds: float = 3600.0, sample_rate: float = 48000.0, csv_seconds: float = 10.0) -> None:
+    """
+    Export seconds of a 48 kHz float32 capture from a memory map to every format, reporting the throughput and
+    the peak of the allocations made on the way. The files are read back and compared with the capture
+    """
+
+    directory    = tempfile.mkdtemp()
+    capture_path = os.path.join(directory, "capture.bin")
+    samples      = int(seconds * sample_rate)
+
+    # The capture is written in pieces as well so the benchmark itself stays small
+    with open(capture_path, "wb") as file:
+        for start in range(0, samples, 1 << 22):
+            index = np.arange(start, min(start + (1 << 22), samples), dtype=np.float64)
+            file.write((0.9 * np.sin(2 * np.pi * 1000 * index / sample_rate)).astype("<f4").tobytes())
+    capture = np.memmap(capture_path, dtype="<f4", mode="r")
+
+    # The signals are made on demand since the chunk generator can only be consumed once
+    exports = [("wav", sample_format, "<f4", lambda: capture) for sample_format in WAV_SAMPLE_FORMATS]
+    exports.append(("npy", "pcm16", "<f4", lambda: capture))
+    exports.append(("npy", "pcm16", "<i2", lambda: (np.rint(chunk * 32767).astype("<i2") for chunk in IterateChunks(capture, 1 << 16))))
+    exports.append(("csv", "pcm16", "<f4", lambda: capture[:int(csv_seconds * sample_rate)]))
+
+    try:
+        for format, sample_format, dtype, signal in exports:
+            path = os.path.join(directory, f"export.{format}")
+
+            # Tracing slows the allocations down, so the export is timed and traced in separate runs
+            tracemalloc.start()
+            SignalExporter(path, signal(), sample_rate, sample_format=sample_format, dtype=dtype).Export()
+            peak     = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            exporter = SignalExporter(path, signal(), sample_rate, sample_format=sample_format, dtype=dtype).Export()
+
+            progress = exporter.GetProgress()
+            name     = sample_format if format == "wav" else dtype if format == "npy" else "text"
+            print(f"{format:>4} {name:>7}: {progress['samples']} samples, {'{:.1f}'.format(os.path.getsize(path) / 1e6)} MB in {'{:.2f}'.format(progress['elapsed'])} s "
+                  f"({'{:.1f}'.format(progress['samples_per_s'] / 1e6)} M samples/s), peak allocations {'{:.1f}'.format(peak / 1e6)} MB")
+
+            # Read the start of the file back
+            reference = np.asarray(capture[:1 << 16], dtype=np.float64)
+            if format == "wav" and sample_format != "float32":
+                with wave.open(path, "rb") as reader:
+                    assert reader.getnframes() == samples and reader.getframerate() == int(sample_rate)
+                    raw = np.frombuffer(reader.readframes(1 << 16), dtype=np.uint8).reshape(-1, reader.getsampwidth())
+                width  = raw.shape[1]
+                padded = np.zeros((len(raw), 4), dtype=np.uint8)
+                padded[:, 4 - width:] = raw
+                back   = padded.view("<i4").ravel().astype(np.float64) / float(1 << 31)
+                assert np.max(np.abs(back - reference)) <= 1.0 / (1 << (8 * width - 1))
+            elif format == "wav":
+                back = np.memmap(path, dtype="<f4", mode="r", offset=FindWavData(path), shape=(samples,))
+                assert np.array_equal(back[:1 << 16], capture[:1 << 16])
+                del back
+            elif format == "npy":
+                back = np.load(path, mmap_mode="r")
+                assert back.shape == (samples,) and back.dtype == np.dtype(dtype)
+                assert np.max(np.abs(back[:1 << 16] / (32767 if dtype == "<i2" else 1) - reference)) <= 1 / 32767
+                del back
+            else:
+                importer = SignalImporter(path).Start()
+                importer.Wait()
+                assert abs(importer.sample_rate - sample_rate) < 1e-3 * sample_rate
+                assert np.max(np.abs(importer.GetData()[:1 << 16] - reference)) < 1e-6
+            os.remove(path)
+
+        # A cancelled export leaves nothing behind, small chunks keep the default capture from finishing first
+        path     = os.path.join(directory, "cancelled.wav")
+        exporter = SignalExporter(path, capture, sample_rate, chunk_samples=1 << 12).Start()
+        time.sleep(0.005)
+        exporter.Cancel()
+        exporter.Wait()
+        print(f"Cancelled at {'{:.0f}'.format(100 * exporter.GetProgress()['fraction'])} %, file removed: {not os.path.exists(path)}")
+    finally:
+        del capture
+        for name in os.listdir(directory):
+            os.remove(os.path.join(directory, name))
+        os.rmdir(directory)
+
+def BenchmarkToneGenerator(seconds: float = 1.0) -> None:
+    """
+    Run the scheduler at 48 and 96 kHz into a null sink, a WAV file and a local socket source, then with a sink
+    that stalls now and then to show the underruns being caught, and check that the ramps do not click
+    """
+
+    directory  = tempfile.mkdtemp()
+    address    = f"unix:{os.path.join(directory, 'generator.sock')}"
+    frequency  = [440.0]
+    parameters = lambda: (0.5, 0.0, 0.0, frequency[0])
+
+    class StallingSink(NullSink):
+
+        """
+        Sleeps for longer than the lead every stall_every chunks
+        """
+
+        def __init__(self, stall: float, stall_every: int) -> None:
+            self.stall       = stall
+            self.stall_every = stall_every
+            self.written     = 0
+
+        def Write(self, chunk: np.ndarray) -> None:
+            self.written += 1
+            if self.written % self.stall_every == 0:
+                time.sleep(self.stall)
+
+    try:
+        for sample_rate in GENERATOR_SAMPLE_RATES:
+            model  = PlotControlsModel()
+            source = SocketSampleSource(model, address).Start()
+            sinks  = {
+                "null":   lambda: NullSink(),
+                "wav":    lambda: OpenSink(os.path.join(directory, "generator.wav"), sample_rate, 512),
+                "socket": lambda: OpenSink(address, sample_rate, 512),
+                "stall":  lambda: StallingSink(0.05, 50),
+            }
+
+            for name, sink in sinks.items():
+                scheduler = DeadlineScheduler(sink(), parameters, sample_rate=sample_rate, chunk_samples=512).Run(seconds)
+                timings   = scheduler.GetTimings()
+                print(f"{sample_rate} Hz {name:>6}: {scheduler.chunks} chunks of {'{:.2f}'.format(scheduler.period * 1e3)} ms, underruns {scheduler.underruns}, "
+                      f"generate p50 {'{:.3f}'.format(timings['generate_ms_p50'])} p99 {'{:.3f}'.format(timings['generate_ms_p99'])} ms, "
+                      f"chunk p99 {'{:.3f}'.format(timings['chunk_ms_p99'])} ms, slack min {'{:.2f}'.format(timings['slack_ms_min'])} ms")
+
+            time.sleep(0.1)
+            source.Stop()
+            print(f"{sample_rate} Hz socket source received {source.frames} frames, lost {source.lost}")
+
+        # A step in frequency, phase and height applied at once and ramped, the largest step between samples shows a click
+        for ramped in (False, True):
+            generator = RampedSine(48000, 512)
+            generator.Reset(0.5, 0.0, 0.0, 1000.0)
+            chunks    = [generator.Generate().copy() for _ in range(8)]
+            (generator.SetTarget if ramped else generator.Reset)(0.5, 0.5, np.pi, 4400.0)
+            chunks   += [generator.Generate().copy() for _ in range(8)]
+            output    = np.concatenate(chunks)
+            print(f"Step to 4400 Hz, pi phase and 0.5 height {'ramped' if ramped else 'at once'}: largest step between samples "
+                  f"{'{:.3f}'.format(np.abs(np.diff(output)).max())} (4400 Hz alone moves up to {'{:.3f}'.format(0.5 * 2 * np.pi * 4400 / 48000)})")
+    finally:
+        for name in os.listdir(directory):
+            os.remove(os.path.join(directory, name))
+        os.rmdir(directory)
+
+def BenchmarkGraph(samples: int = 200_000, repeats: int = 5) -> None:
+    """
+    Evaluate the signal graph after no change, a filter change and a frequency change, compare it with the
+    chain run in full every time and show the timing reports. A custom node is registered on the way
+    """
+
+    @RegisterNodeType("rms_db")
+    def RmsDbNode(measurements: dict) -> float:
+        """
+        Custom measurement, the RMS level in dBFS
+        """
+        return 20 * np.log10(max(measurements["rms"], 1e-12))
+
+    graph = BuildSignalGraph()
+    graph.AddNode("level", "rms_db", measurements=Ref("measurements"))
+    graph.SetParameter("samples", samples)
+    graph.SetParameter("frequency", 50.0)
+    graph.SetParameter("filter_type", "Low Pass")
+    graph.Evaluate()
+
+    def Chain(frequency: float, cutoff: float) -> None:
+        signal   = SineNode(samples, 1.0, 0.0, 0.0, frequency)
+        filtered = BiquadNode(signal["y"], signal["sample_rate"], "Low Pass", cutoff)
+        spectrum = SpectrumNode(filtered, signal["sample_rate"])
+        RmsDbNode(MeasureNode(filtered, signal["sample_rate"]))
+        HarmonicsNode(spectrum["magnitude"])
+        PeaksNode(spectrum["freqs"], spectrum["magnitude"])
+
+    def Time(function: typing.Any) -> float:
+        began = time.perf_counter()
+        for repeat in range(repeats):
+            function(repeat)
+
+        return (time.perf_counter() - began) / repeats * 1e3
+
+    unchanged = Time(lambda repeat: graph.Evaluate())
+    cutoff    = Time(lambda repeat: (graph.SetParameter("cutoff", 100.0 + repeat), graph.Evaluate()))
+    report    = graph.FormatTimingReport()
+    frequency = Time(lambda repeat: (graph.SetParameter("frequency", 60.0 + repeat), graph.Evaluate()))
+    chain     = Time(lambda repeat: Chain(60.0 + repeat, 100.0 + repeat))
+
+    # The graph has to give what the chain gives
+    expected = MeasureSignal(BiquadNode(SineNode(samples, 1.0, 0.0, 0.0, 60.0 + repeats - 1)["y"], samples - 1, "Low Pass", 100.0 + repeats - 1), samples - 1)
+    assert graph.Get("measurements") == expected
+
+    print(f"{samples} samples: unchanged {'{:.3f}'.format(unchanged)} ms, cutoff changed {'{:.1f}'.format(cutoff)} ms, "
+          f"frequency changed {'{:.1f}'.format(frequency)} ms, full chain {'{:.1f}'.format(chain)} ms, level {'{:.2f}'.format(graph.Get('level'))} dBFS")
+    print("After a cutoff change:")
+    print(report)
+    print("After a frequency change:")
+    print(graph.FormatTimingReport())
+
+    del NODE_TYPES["rms_db"]
+
+# Sizes --quick runs the long benchmarks on
+QUICK_ARGUMENTS = {
+    "summary": {"samples": 1 << 23},
+    "export":  {"seconds": 120.0},
+}
+
+BENCHMARKS = {
+    "goertzel": BenchmarkGoertzel,
+    "controls": BenchmarkControlCreation,
+    "search":   BenchmarkNearestSample,
+    "notify":   BenchmarkNotifications,
+    "udp":      BenchmarkUdpSource,
+    "ring":     BenchmarkSharedRing,
+    "socket":   BenchmarkSocketSource,
+    "import":   BenchmarkFileImport,
+    "summary":  BenchmarkSummaryIndex,
+    "export":   BenchmarkFileExport,
+    "generate": BenchmarkToneGenerator,
+    "graph":    BenchmarkGraph,
+}
+
+def main() -> int:
+
+    parser = argparse.ArgumentParser(description="Run the benchmarks, all of them when no name is given")
+    parser.add_argument("names",             nargs="*",    metavar="name",     help=f"One of {', '.join(BENCHMARKS)}")
+    parser.add_argument("--quick",           action="store_true",              help="Run the summary index and the export on small sizes")
+    parser.add_argument("--summary-samples", default=None, type=int,           help="Samples in the capture the summary index benchmark indexes")
+    parser.add_argument("--export-seconds",  default=None, type=float,         help="Seconds of signal the export benchmark writes")
+    args   = parser.parse_args()
+
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"Unknown benchmark: {', '.join(unknown)}")
+
+    arguments = {name: dict(QUICK_ARGUMENTS.get(name, {})) if args.quick else {} for name in BENCHMARKS}
+    if args.summary_samples is not None:
+        arguments["summary"]["samples"] = args.summary_samples
+    if args.export_seconds is not None:
+        arguments["export"]["seconds"] = args.export_seconds
+
+    for name in args.names or BENCHMARKS:
+        print(f"== {name}")
+        BENCHMARKS[name](**arguments[name])
+
+    return 0
+
+if __name__ == "__main__": sys.exit(main())
@@ -4,7 +4,14 @@
 #************************************************************************************
 from __future__ import annotations
 import dearpygui.dearpygui as dpg
+import numpy as np
+import collections
+import threading
+import asyncio
 import typing
+import bisect
+import weakref
+import time
 
 def SetGlobalFont(font_file_path: str, font_size: int) -> None:
     """
@@ -78,6 +85,28 @@ class Mouse():
         Get the mouse drag delta
         """
         return dpg.get_mouse_drag_delta()
+
+    @staticmethod
+    def GetPlotMousePosition() -> 'list[float]':
+        """
+        Get the mouse position in the data coordinates of the last hovered plot
+        """
+        return dpg.get_plot_mouse_pos()
+
+    @staticmethod
+    def RegisterMouseMoveEventHandler(user_data: typing.Any = None, callback: typing.Any = None) -> None:
+        with dpg.handler_registry():
+            dpg.add_mouse_move_handler(user_data=user_data, callback=callback)
+
+    @staticmethod
+    def RegisterMouseClickEventHandler(button: int = -1, user_data: typing.Any = None, callback: typing.Any = None) -> None:
+        with dpg.handler_registry():
+            dpg.add_mouse_click_handler(button=button, user_data=user_data, callback=callback)
+
+    @staticmethod
+    def RegisterMouseWheelEventHandler(user_data: typing.Any = None, callback: typing.Any = None) -> None:
+        with dpg.handler_registry():
+            dpg.add_mouse_wheel_handler(user_data=user_data, callback=callback)
     
 class Keyboard():
 
@@ -100,6 +129,413 @@ class Keyboard():
         with dpg.handler_registry():
             dpg.add_key_release_handler(key=key, user_data=user_data, callback=callback)
 
+class ThemeRegistry():
+
+    """
+    Interns the DearPyGUI themes built from the controls style sets, so every control
+    with the same styles is bound to one theme object
+    """
+
+    themes: 'dict[tuple, int]' = {}
+    keys:   'dict[int, tuple]' = {}
+    users:  'dict[int, int]'   = {}
+
+    @staticmethod
+    def MakeKey(theme_styles: dict) -> tuple:
+        """
+        Build a hashable key for a style set that does not depend on the order the styles were set in
+        """
+        return tuple(sorted((component, tuple(sorted(entries.items()))) for component, entries in theme_styles.items()))
+
+    @staticmethod
+    def Acquire(theme_styles: dict) -> int:
+        """
+        Get the theme for a style set, creating it the first time the style set is seen, every
+        acquired theme must be released again once the control no longer uses it
+        """
+        key   = ThemeRegistry.MakeKey(theme_styles)
+        theme = ThemeRegistry.themes.get(key)
+
+        # A theme can be missing if the DearPyGUI context was recreated
+        if theme is None or not dpg.does_item_exist(theme):
+            theme = ThemeRegistry.themes[key] = ThemeRegistry.CreateTheme(theme_styles)
+            ThemeRegistry.keys[theme]  = key
+            ThemeRegistry.users[theme] = 0
+
+        ThemeRegistry.users[theme] += 1
+
+        return theme
+
+    @staticmethod
+    def Release(theme: int) -> None:
+        """
+        Drop one user of a theme, the theme is deleted when nobody uses it anymore
+        """
+        if theme not in ThemeRegistry.users:
+            return
+
+        ThemeRegistry.users[theme] -= 1
+        if ThemeRegistry.users[theme] > 0:
+            return
+
+        del ThemeRegistry.users[theme]
+        del ThemeRegistry.themes[ThemeRegistry.keys.pop(theme)]
+        if dpg.does_item_exist(theme):
+            dpg.delete_item(theme)
+
+    @staticmethod
+    def CreateTheme(theme_styles: dict) -> int:
+        """
+        Create the DearPyGUI theme, components and styles for a style set
+        """
+        theme = dpg.add_theme()
+        for (item_type, enabled_state), entries in theme_styles.items():
+            component = dpg.add_theme_component(item_type, enabled_state=enabled_state, parent=theme)
+            for (kind, target), (values, category) in entries.items():
+                if kind == "color":
+                    dpg.add_theme_color(target, values, category=category, parent=component)
+                else:
+                    dpg.add_theme_style(target, *values, category=category, parent=component)
+
+        return theme
+
+    @staticmethod
+    def Clear() -> None:
+        """
+        Forget every interned theme, needed when the DearPyGUI context is destroyed
+        """
+        ThemeRegistry.themes.clear()
+        ThemeRegistry.keys.clear()
+        ThemeRegistry.users.clear()
+
+class ControlRegistry():
+
+    """
+    Maps DearPyGUI tags to the control wrapping them, the controls are held weakly so the
+    registry never keeps a control alive
+    """
+
+    controls: 'weakref.WeakValueDictionary[typing.Any, Control]' = weakref.WeakValueDictionary()
+
+    @staticmethod
+    def Find(tag: typing.Any) -> typing.Optional[Control]:
+        """
+        Find the control for a DearPyGUI tag, e.g. the sender of a callback
+        """
+        return ControlRegistry.controls.get(tag)
+
+    @staticmethod
+    def Count() -> int:
+        """
+        Get how many controls are registered
+        """
+        return len(ControlRegistry.controls)
+
+class ValueBinder():
+
+    """
+    Retained mode layer in front of dpg.set_value. Values are queued per tag and only the ones that differ
+    from what was last pushed are written, in one batch when Flush is called right before a frame is rendered.
+    Values are compared by a key, which defaults to the value itself, arrays should pass a cheap key instead
+    (e.g. a version number) since comparing them would cost as much as writing them
+    """
+
+    pushed:  'dict[typing.Any, typing.Any]' = {}
+    pending: 'dict[typing.Any, tuple]'      = {}
+    writes:  int                            = 0
+    skipped: int                            = 0
+
+    @staticmethod
+    def Bind(tag: typing.Any, value: typing.Any, key: typing.Any = None) -> bool:
+        """
+        Queue a value for the item, returns false when the item already shows it
+        """
+
+        key = value if key is None else key
+        if tag in ValueBinder.pushed and ValueBinder.pushed[tag] == key:
+
+            # Setting a value back within the same frame cancels the queued write
+            ValueBinder.pending.pop(tag, None)
+            ValueBinder.skipped += 1
+            return False
+
+        ValueBinder.pending[tag] = (value, key)
+
+        return True
+
+    @staticmethod
+    def Flush() -> int:
+        """
+        Write every queued value to DearPyGUI and return how many writes were made
+        """
+
+        for tag, (value, key) in ValueBinder.pending.items():
+            dpg.set_value(tag, value)
+            ValueBinder.pushed[tag] = key
+
+        count = len(ValueBinder.pending)
+        ValueBinder.pending.clear()
+        ValueBinder.writes += count
+
+        return count
+
+    @staticmethod
+    def Remember(tag: typing.Any, key: typing.Any) -> None:
+        """
+        Record that the item already shows the value for key, e.g. after it was created with it
+        """
+        ValueBinder.pending.pop(tag, None)
+        ValueBinder.pushed[tag] = key
+
+    @staticmethod
+    def Forget(tag: typing.Any) -> None:
+        """
+        Drop everything known about an item, needed when it is deleted or written to directly
+        """
+        ValueBinder.pushed.pop(tag, None)
+        ValueBinder.pending.pop(tag, None)
+
+    @staticmethod
+    def Clear() -> None:
+        """
+        Forget every item, needed when the DearPyGUI context is destroyed
+        """
+        ValueBinder.pushed.clear()
+        ValueBinder.pending.clear()
+
+class FrameGovernor():
+
+    """
+    Paces a render loop to a target frame rate. Between frames the loop sleeps on an event until shortly
+    before the deadline and spins the rest of the way for precision. Without input or changes for idle_after
+    seconds the loop drops to idle_fps, Wake (safe to call from any thread) ends the sleep right away and
+    returns to the full rate. Wake calls made by the render thread itself are ignored since its own frame
+    already handles them. EndFrameAsync does the same for a loop running on asyncio, where the sleep is an
+    await so other tasks run in it and a wake from the loop's own tasks ends it as well
+    """
+
+    def __init__(self, target_fps: float = 60.0, idle_fps: float = 10.0, idle_after: float = 1.0,
+                 spin_time: float = 0.001, history: int = 120) -> None:
+        self.target_fps    = target_fps
+        self.idle_fps      = idle_fps
+        self.idle_after    = idle_after
+        self.spin_time     = spin_time
+        self.render_thread = threading.get_ident()
+        self.wake_event    = threading.Event()
+        self.async_wake    = None
+        self.async_loop    = None
+        self.sleeping      = False
+        self.last_activity = time.perf_counter()
+        self.frame_start   = None
+        self.cpu_start     = None
+        self.busy_times    = collections.deque(maxlen=history)
+        self.cpu_times     = collections.deque(maxlen=history)
+        self.frame_times   = collections.deque(maxlen=history)
+
+    def Wake(self, *args: typing.Any) -> None:
+        """
+        Mark activity and cut the current sleep short, extra arguments let it be used as a DearPyGUI callback
+        """
+        if threading.get_ident() != self.render_thread:
+            self.last_activity = time.perf_counter()
+            if self.async_loop is not None:
+                self.async_loop.call_soon_threadsafe(self.async_wake.set)
+            else:
+                self.wake_event.set()
+
+        # Tasks sharing the event loop run on the render thread while it awaits the next frame
+        elif self.sleeping and self.async_wake is not None:
+            self.last_activity = time.perf_counter()
+            self.async_wake.set()
+
+    def IsIdle(self) -> bool:
+        """
+        Has nothing happened for idle_after seconds
+        """
+        return time.perf_counter() - self.last_activity > self.idle_after
+
+    def BeginFrame(self) -> None:
+        """
+        Mark the start of a frame, call it at the top of every loop iteration
+        """
+        now = time.perf_counter()
+        if self.frame_start is not None:
+            self.frame_times.append(now - self.frame_start)
+
+        self.render_thread = threading.get_ident()
+        self.frame_start   = now
+        self.cpu_start     = time.process_time()
+
+    def EndFrame(self, active: bool = False) -> None:
+        """
+        Record what the frame cost and sleep until the next one is due, active frames count as activity
+        """
+
+        deadline = self.__FinishFrame(active)
+
+        # Sleep on the event so a wake interrupts it, then wait out the last stretch at the full rate
+        timeout = deadline - time.perf_counter() - self.spin_time
+        if timeout > 0 and self.wake_event.wait(timeout):
+            deadline = min(deadline, self.frame_start + 1 / self.target_fps)
+        self.wake_event.clear()
+
+        while time.perf_counter() < deadline:
+            time.sleep(0)
+
+    async def EndFrameAsync(self, active: bool = False) -> None:
+        """
+        Record what the frame cost and await the next frame, the event loop runs the other tasks meanwhile
+        """
+
+        # The event belongs to the loop it was created on
+        if self.async_loop is not asyncio.get_running_loop():
+            self.async_loop = asyncio.get_running_loop()
+            self.async_wake = asyncio.Event()
+
+        deadline = self.__FinishFrame(active)
+        timeout  = deadline - time.perf_counter()
+
+        self.sleeping = True
+        try:
+            if timeout > 0:
+                await asyncio.wait_for(self.async_wake.wait(), timeout)
+
+                # Woken early, the next frame still keeps to the full rate
+                await asyncio.sleep(max(self.frame_start + 1 / self.target_fps - time.perf_counter(), 0))
+            else:
+                await asyncio.sleep(0)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self.sleeping = False
+            self.async_wake.clear()
+
+    def __FinishFrame(self, active: bool) -> float:
+        """
+        Record the cost of the frame and get the time the next one is due
+        """
+
+        now = time.perf_counter()
+        self.busy_times.append(now - self.frame_start)
+        self.cpu_times.append(time.process_time() - self.cpu_start)
+        if active:
+            self.last_activity = now
+
+        return self.frame_start + 1 / (self.idle_fps if self.IsIdle() else self.target_fps)
+
+    def GetStats(self) -> dict:
+        """
+        Get the frame rate and what the recent frames cost, cpu counts every thread of the process
+        """
+
+        if not self.frame_times or not self.cpu_times:
+            return {}
+
+        cpu_times = np.asarray(self.cpu_times) * 1e3
+
+        return {
+            "fps"        : len(self.frame_times) / sum(self.frame_times),
+            "busy_ms"    : float(np.mean(self.busy_times) * 1e3),
+            "cpu_ms"     : float(cpu_times.mean()),
+            "cpu_ms_p95" : float(np.percentile(cpu_times, 95)),
+            "idle"       : self.IsIdle()
+        }
+
+class CommandQueue():
+
+    """
+    Marshals view updates from any thread onto the render thread. Posting appends to a deque, which is
+    atomic in CPython so producers never take a lock. Drain runs on the render thread, takes a bounded
+    batch and only runs the newest command per target so a producer outpacing the frame rate costs one
+    update per item and frame
+    """
+
+    def __init__(self, batch_size: int = 4096, on_post: typing.Any = None, history: int = 1000) -> None:
+        self.batch_size = batch_size
+        self.on_post    = on_post
+        self.commands   = collections.deque()
+        self.latencies  = collections.deque(maxlen=history)
+        self.depths     = collections.deque(maxlen=history)
+        self.executed   = 0
+        self.collapsed  = 0
+
+    def Post(self, target: typing.Any, function: typing.Any, *args: typing.Any, **kwargs: typing.Any) -> None:
+        """
+        Queue function(*args, **kwargs) to run on the render thread, a later post for the same target replaces it
+        """
+        self.commands.append((target, time.perf_counter(), function, args, kwargs))
+        if self.on_post is not None:
+            self.on_post()
+
+    def PostValue(self, control: Control, value: typing.Any) -> None:
+        """
+        Queue a new value for a control, e.g. the text of a label
+        """
+        self.Post((control.tag, "value"), control.BindValue, value)
+
+    def PostLineSeries(self, plot: Plot, x_data: list, y_data: list) -> None:
+        """
+        Queue new data for the line series of a plot
+        """
+        self.Post((plot.tag, "line"), plot.PlotLineSeriesData, x_data=x_data, y_data=y_data)
+
+    def PostAxisLimits(self, plot: Plot, axis: str, min: float, max: float) -> None:
+        """
+        Queue new limits for the "x" or "y" axis of a plot
+        """
+        self.Post((plot.tag, axis), plot.SetXAxisLimits if axis == "x" else plot.SetYAxisLimits, min, max)
+
+    def GetDepth(self) -> int:
+        """
+        Number of commands waiting
+        """
+        return len(self.commands)
+
+    def Drain(self) -> int:
+        """
+        Run at most batch_size queued commands, newest per target, and return how many ran
+        """
+
+        depth = len(self.commands)
+        if depth == 0:
+            return 0
+        self.depths.append(depth)
+
+        # Only the newest command per target survives, its position is the target's first post
+        batch = {}
+        for _ in range(min(depth, self.batch_size)):
+            target, posted, function, args, kwargs = self.commands.popleft()
+            if target in batch:
+                self.collapsed += 1
+                posted          = batch[target][0]
+            batch[target] = (posted, function, args, kwargs)
+
+        now = time.perf_counter()
+        for posted, function, args, kwargs in batch.values():
+            function(*args, **kwargs)
+            self.latencies.append(now - posted)
+
+        self.executed += len(batch)
+
+        return len(batch)
+
+    def GetStats(self) -> dict:
+        """
+        Get the queue depth seen at recent drains and how long commands waited before they ran,
+        a collapsed command counts from its target's oldest post in the batch
+        """
+
+        latencies = np.asarray(self.latencies) * 1e3
+
+        return {
+            "depth"          : len(self.commands),
+            "max_depth"      : max(self.depths, default=0),
+            "latency_ms"     : float(latencies.mean()) if len(latencies) else 0.0,
+            "latency_ms_p95" : float(np.percentile(latencies, 95)) if len(latencies) else 0.0,
+            "executed"       : self.executed,
+            "collapsed"      : self.collapsed
+        }
+
 class Control():
 
     """
@@ -107,9 +543,10 @@ class Control():
     """
 
     def __init__(self, parent: Control) -> None:
-        self.tag             = None
-        self.theme           = dpg.add_theme()
+        self.__tag           = None
+        self.theme           = None
         self.theme_component = None
+        self.theme_styles    = {}
         self.parent          = parent
         self.children        = []
 
@@ -117,11 +554,60 @@ class Control():
         if self.parent is not None and isinstance(self.parent, Control):
             self.parent.children.append(self)
 
+    @property
+    def tag(self) -> typing.Any:
+        """
+        The DearPyGUI tag of the control, setting it registers the control for lookups by tag
+        """
+        return self.__tag
+
+    @tag.setter
+    def tag(self, tag: typing.Any) -> None:
+        if self.__tag is not None and ControlRegistry.controls.get(self.__tag) is self:
+            del ControlRegistry.controls[self.__tag]
+
+        self.__tag = tag
+        if tag is not None:
+            ControlRegistry.controls[tag] = self
+
     def Destroy(self) -> Control:
         """
-        Destroy the control
+        Destroy the control and everything below it, the python wrappers are unregistered and their
+        themes released in one pass over the subtree, DearPyGUI then deletes the items recursively
         """
-        dpg.delete_item(self.tag)
+
+        # Walk the subtree without recursion, a control can be listed twice so it is tracked by id
+        stack   = [self]
+        visited = set()
+        while stack:
+            control = stack.pop()
+            if id(control) in visited:
+                continue
+
+            visited.add(id(control))
+            stack.extend(control.children)
+
+            # Release the theme and drop the links between the wrappers
+            if control.theme is not None:
+                ThemeRegistry.Release(control.theme)
+                control.theme = None
+
+            control.children = []
+            if control is not self:
+                ValueBinder.Forget(control.tag)
+                control.parent = None
+                control.tag    = None
+
+        # Detach from the parent so the wrappers can be collected
+        if isinstance(self.parent, Control) and self in self.parent.children:
+            self.parent.children.remove(self)
+        self.parent = None
+
+        tag      = self.tag
+        self.tag = None
+        if tag is not None and dpg.does_item_exist(tag):
+            dpg.delete_item(tag)
+            ValueBinder.Forget(tag)
 
         return self
 
@@ -169,6 +655,12 @@ class Control():
         """
         return dpg.is_item_shown(self.tag)
 
+    def IsHovered(self) -> bool:
+        """
+        Is the mouse over the control
+        """
+        return dpg.is_item_hovered(self.tag)
+
     def GetPosition(self) -> 'list[int]':
         """
         Get the position of the control on the screen
@@ -206,6 +698,16 @@ class Control():
         Set the value of the control
         """
         dpg.set_value(self.tag, value=value)
+        ValueBinder.Forget(self.tag)
+
+        return self
+
+    def BindValue(self, value: typing.Any, key: typing.Any = None) -> Control:
+        """
+        Set the value of the control through the ValueBinder, the write is skipped when the control
+        already shows the value and otherwise deferred until the next flush
+        """
+        ValueBinder.Bind(self.tag, value, key=key)
 
         return self
     
@@ -245,9 +747,9 @@ class Control():
         """
         Change padding for the item
         """
-        dpg.add_theme_style(dpg.mvStyleVar_WindowPadding, window_pad[0],   window_pad[1],   category=dpg.mvThemeCat_Core, parent=self.theme_component)
-        dpg.add_theme_style(dpg.mvStyleVar_FramePadding,  frame_pad[0],    frame_pad[1],    category=dpg.mvThemeCat_Core, parent=self.theme_component)
-        dpg.add_theme_style(dpg.mvStyleVar_ItemSpacing,   item_spacing[0], item_spacing[1], category=dpg.mvThemeCat_Core, parent=self.theme_component)
+        self.AddThemeStyle(dpg.mvStyleVar_WindowPadding, window_pad[0],   window_pad[1],   category=dpg.mvThemeCat_Core)
+        self.AddThemeStyle(dpg.mvStyleVar_FramePadding,  frame_pad[0],    frame_pad[1],    category=dpg.mvThemeCat_Core)
+        self.AddThemeStyle(dpg.mvStyleVar_ItemSpacing,   item_spacing[0], item_spacing[1], category=dpg.mvThemeCat_Core)
 
         return self
     
@@ -255,14 +757,48 @@ class Control():
         """
         Change the rounding of the item
         """
-        dpg.add_theme_style(dpg.mvStyleVar_FrameRounding, frame_rounding, category=dpg.mvThemeCat_Core, parent=self.theme_component)
+        self.AddThemeStyle(dpg.mvStyleVar_FrameRounding, frame_rounding, category=dpg.mvThemeCat_Core)
 
         return self
     
+    def AddThemeStyle(self, target: int, *values: float, category: int = dpg.mvThemeCat_Core) -> Control:
+        """
+        Record a theme style for the current theme component, nothing is created in DearPyGUI until the theme is bound
+        """
+        self.__SetThemeEntry(("style", target), (values, category))
+
+        return self
+
+    def AddThemeColor(self, target: int, color: 'list[int]', category: int = dpg.mvThemeCat_Core) -> Control:
+        """
+        Record a theme color for the current theme component, nothing is created in DearPyGUI until the theme is bound
+        """
+        self.__SetThemeEntry(("color", target), (tuple(color), category))
+
+        return self
+
+    def __SetThemeEntry(self, key: tuple, value: tuple) -> None:
+        """
+        Store a style entry, setting the same style twice replaces the old value instead of stacking items
+        """
+        component = self.theme_component if self.theme_component is not None else (dpg.mvAll, True)
+        self.theme_styles.setdefault(component, {})[key] = value
+
+        # Bound themes are shared with other controls so they are never edited, bind the theme of the new style set instead
+        if self.theme is not None:
+            self.BindTheme()
+
     def BindTheme(self) -> Control:
         """
-        Binds the theme to the item
+        Binds the theme to the item, controls with identical styles share the same theme
         """
+
+        # Acquire before releasing so a theme shared by the old and new style set is not deleted in between
+        theme = ThemeRegistry.Acquire(self.theme_styles)
+        if self.theme is not None:
+            ThemeRegistry.Release(self.theme)
+
+        self.theme = theme
         dpg.bind_item_theme(self.tag, self.theme)
 
         return self
@@ -294,7 +830,7 @@ class Menu(Control):
 
     def __init__(self, label: str = None, indent: int = -1, parent: Control = None) -> None:
         super().__init__(parent=parent)
-        self.theme_component = dpg.add_theme_component(dpg.mvMenu, parent=self.theme)
+        self.theme_component = (dpg.mvMenu, True)
         self.tag             = dpg.add_menu(
             label=label,
             indent=indent,
@@ -305,6 +841,7 @@ class Menu(Control):
         """
         Add menu item to the menu option
         """
+        # Create a menu item control on the fly, it adds itself as child to this control
         menu_item_control     = Control(parent=self)
         menu_item_control.tag = dpg.add_menu_item(
             label=label,
@@ -313,16 +850,13 @@ class Menu(Control):
             user_data=user_data
         )
 
-        # Create a menu item control on the fly and add it as child to this control
-        self.children.append(menu_item_control)
-
         return self
     
     def AddBorder(self, border_size: float = 0.6) -> Menu:
         """
         Add a border to the menu selection list
         """
-        dpg.add_theme_style(dpg.mvStyleVar_PopupBorderSize, border_size, category=dpg.mvThemeCat_Core, parent=self.theme_component)
+        self.AddThemeStyle(dpg.mvStyleVar_PopupBorderSize, border_size, category=dpg.mvThemeCat_Core)
 
         return self
 
@@ -388,7 +922,7 @@ class CollapseHeader(Control):
                  closable: bool = False, default_open: bool = False, open_on_double_click: bool = False,
                  open_on_arrow: bool = False, leaf: bool = False, bullet: bool = False) -> None:
         super().__init__(parent=parent)
-        self.theme_component = dpg.add_theme_component(dpg.mvCollapsingHeader, parent=self.theme)
+        self.theme_component = (dpg.mvCollapsingHeader, True)
         self.tag             = dpg.add_collapsing_header(
             label=label,
             indent=indent,
@@ -418,7 +952,7 @@ class Window(Control):
                  popup: bool = False, no_saved_settings: bool = False, 
                  no_open_over_existing_popup: bool = True, on_close: typing.Any = None) -> None:
         super().__init__(parent=None)
-        self.theme_component = dpg.add_theme_component(dpg.mvWindowAppItem, parent=self.theme)
+        self.theme_component = (dpg.mvWindowAppItem, True)
         self.tag             = dpg.add_window(
             label=label,
             width=width,
@@ -455,7 +989,7 @@ class Window(Control):
         """
         Add a border to the window
         """
-        dpg.add_theme_style(dpg.mvStyleVar_WindowBorderSize, border_size, category=dpg.mvThemeCat_Core, parent=self.theme_component)
+        self.AddThemeStyle(dpg.mvStyleVar_WindowBorderSize, border_size, category=dpg.mvThemeCat_Core)
 
         return self
 
@@ -463,7 +997,7 @@ class Window(Control):
         """
         Changes the color of the window
         """
-        dpg.add_theme_color(dpg.mvThemeCol_WindowBg, color, category=dpg.mvThemeCat_Core, parent=self.theme_component)
+        self.AddThemeColor(dpg.mvThemeCol_WindowBg, color, category=dpg.mvThemeCat_Core)
 
         return self
 
@@ -480,7 +1014,7 @@ class ChildWindow(Control):
                  autosize_y: bool = False, no_scrollbar: bool = False, horizontal_scrollbar: bool = False) -> None:
         super().__init__(parent=parent)
         self.misc_data       = []
-        self.theme_component = dpg.add_theme_component(dpg.mvChildWindow, parent=self.theme)
+        self.theme_component = (dpg.mvChildWindow, True)
         self.tag             = dpg.add_child_window(
             label=label,
             width=width,
@@ -507,7 +1041,7 @@ class ChildWindow(Control):
         """
         Change the background color of the window
         """
-        dpg.add_theme_color(dpg.mvThemeCol_ChildBg, color, category=dpg.mvThemeCat_Core, parent=self.theme_component)
+        self.AddThemeColor(dpg.mvThemeCol_ChildBg, color, category=dpg.mvThemeCat_Core)
 
         return self
     
@@ -515,7 +1049,7 @@ class ChildWindow(Control):
         """
         Changes the color of the windows border
         """
-        dpg.add_theme_color(dpg.mvThemeCol_Border, color, category=dpg.mvThemeCat_Core, parent=self.theme_component)
+        self.AddThemeColor(dpg.mvThemeCol_Border, color, category=dpg.mvThemeCat_Core)
 
         return self
     
@@ -540,7 +1074,7 @@ class Button(Control):
                  arrow: bool = False, direction: int = 0) -> None:
         super().__init__(parent=parent)
         self.payload_type    = payload_type
-        self.theme_component = dpg.add_theme_component(dpg.mvButton, parent=self.theme)
+        self.theme_component = (dpg.mvButton, True)
         self.tag             = dpg.add_button(
             label=label,
             width=width,
@@ -561,7 +1095,7 @@ class Button(Control):
         """
         Add a border to the button
         """
-        dpg.add_theme_style(dpg.mvStyleVar_FrameBorderSize, border_size, category=dpg.mvThemeCat_Core, parent=self.theme_component)
+        self.AddThemeStyle(dpg.mvStyleVar_FrameBorderSize, border_size, category=dpg.mvThemeCat_Core)
 
         return self
     
@@ -569,7 +1103,7 @@ class Button(Control):
         """
         Change the color of the background of the button
         """
-        dpg.add_theme_color(dpg.mvThemeCol_Button, color, category=dpg.mvThemeCat_Core, parent=self.theme_component)
+        self.AddThemeColor(dpg.mvThemeCol_Button, color, category=dpg.mvThemeCat_Core)
 
         return self
     
@@ -598,7 +1132,7 @@ class Group(Control):
                  drag_callback: typing.Any = None, drop_callback: typing.Any = None, 
                  user_data: typing.Any = None, payload_type: str = '$$DPG_PAYLOAD') -> None:
         super().__init__(parent=parent)
-        self.theme_component = dpg.add_theme_component(dpg.mvGroup, parent=self.theme)
+        self.theme_component = (dpg.mvGroup, True)
         self.tag             = dpg.add_group(
             label=label,
             width=width,
@@ -623,7 +1157,7 @@ class Label(Control):
                  parent: Control = None, drag_callback: typing.Any = None,
                  drop_callback: typing.Any = None, user_data: typing.Any = None) -> None:
         super().__init__(parent=parent)
-        self.theme_component = dpg.add_theme_component(dpg.mvText, parent=self.theme)
+        self.theme_component = (dpg.mvText, True)
         self.tag             = dpg.add_text(
             default_value=label,
             label=label,
@@ -686,8 +1220,8 @@ class Plot(Control):
                  horizontal_mod: int = dpg.internal_dpg.mvKey_Alt,
                  vertical_mod: int = dpg.internal_dpg.mvKey_Shift) -> None:
         super().__init__(parent=parent)
-        self.candle_theme_component = dpg.add_theme_component(dpg.mvCandleSeries, parent=self.theme)
-        self.line_theme_component   = dpg.add_theme_component(dpg.mvLineSeries, parent=self.theme)
+        self.candle_theme_component = (dpg.mvCandleSeries, True)
+        self.line_theme_component   = (dpg.mvLineSeries, True)
         self.tag                    = dpg.add_plot(
             label=label,
             width=width,
@@ -732,17 +1266,47 @@ class Plot(Control):
         self.x_axis = dpg.add_plot_axis(dpg.mvXAxis, label=x_label, time=x_time, parent=self.tag, lock_max=x_lock_max, lock_min=x_lock_min, no_gridlines=x_no_gridlines)
         self.y_axis = dpg.add_plot_axis(dpg.mvYAxis, label=y_label, time=y_time, parent=self.tag, lock_max=y_lock_max, lock_min=y_lock_min, no_gridlines=y_no_gridlines)
 
-        self.plot_series = None
+        self.plot_series      = None
+        self.marker_series    = None
+        self.annotations      = []
+        self.hover_annotation = None
 
-    def PlotLineSeriesData(self, x_data: list, y_data: list) -> Plot:
+        # Data bounds of every series as (x_min, x_max, y_min, y_max), taken once when the data is
+        # uploaded so auto-fitting never has to scan the series again
+        self.series_bounds = {}
+        self.fit_limits    = {"x": None, "y": None}
+
+    def PlotLineSeriesData(self, x_data: list, y_data: list, x_range: 'tuple[float, float]' = None,
+                           y_range: 'tuple[float, float]' = None) -> Plot:
         """
-        Configure the line series plot
+        Configure the line series plot, callers that already know the data range (e.g. streaming)
+        can pass it in so the series is not scanned
         """
         
         if self.plot_series is not None:
             dpg.delete_item(self.plot_series)
+            ValueBinder.Forget(self.plot_series)
 
         self.plot_series = dpg.add_line_series(x=x_data, y=y_data, parent=self.x_axis)
+        self.SetSeriesBounds("line", x_range or Plot.ComputeDataRange(x_data), y_range or Plot.ComputeDataRange(y_data))
+
+        return self
+
+    def BindLineSeriesData(self, x_data: list, y_data: list, key: typing.Any, x_range: 'tuple[float, float]' = None,
+                           y_range: 'tuple[float, float]' = None) -> Plot:
+        """
+        Update the line series through the ValueBinder, the existing series is kept and its data is only
+        written when key changed. The key stands in for the data, e.g. the parameters that produced it
+        """
+
+        if self.plot_series is None:
+            self.PlotLineSeriesData(x_data=x_data, y_data=y_data, x_range=x_range, y_range=y_range)
+            ValueBinder.Remember(self.plot_series, key)
+
+            return self
+
+        if ValueBinder.Bind(self.plot_series, [x_data, y_data], key=key):
+            self.SetSeriesBounds("line", x_range or Plot.ComputeDataRange(x_data), y_range or Plot.ComputeDataRange(y_data))
 
         return self
     
@@ -752,11 +1316,164 @@ class Plot(Control):
         """
         if self.plot_series is not None:
             dpg.delete_item(self.plot_series)
+            ValueBinder.Forget(self.plot_series)
 
         self.plot_series = dpg.add_candle_series(dates=dates, opens=opens, closes=closes, lows=lows, highs=highs, parent=self.y_axis)
 
+        # The lows and highs bound every candle
+        low, high = Plot.ComputeDataRange(lows), Plot.ComputeDataRange(highs)
+        self.SetSeriesBounds("line", Plot.ComputeDataRange(dates), (low[0], high[1]) if low and high else None)
+
         return self
     
+    def PlotMarkerSeriesData(self, x_data: list, y_data: list) -> Plot:
+        """
+        Configure the scatter series used to mark points of interest on top of the line series
+        """
+        if self.marker_series is not None:
+            dpg.delete_item(self.marker_series)
+
+        self.marker_series = dpg.add_scatter_series(x=x_data, y=y_data, parent=self.y_axis)
+        self.SetSeriesBounds("marker", Plot.ComputeDataRange(x_data), Plot.ComputeDataRange(y_data))
+
+        return self
+
+    @staticmethod
+    def ComputeDataRange(data: list, percentile: float = None) -> 'tuple[float, float]':
+        """
+        Get the (min, max) of the data, or the (percentile, 100 - percentile) limits for a range that
+        ignores outliers. The percentiles use np.partition which is O(n) instead of a full sort.
+        Returns None for empty data
+        """
+
+        data = np.asarray(data, dtype=np.float64).ravel()
+        if len(data) == 0:
+            return None
+
+        if not percentile:
+            return float(data.min()), float(data.max())
+
+        # Select both order statistics with one partition
+        low       = int(np.floor(len(data) * percentile / 100))
+        high      = len(data) - 1 - low
+        partition = np.partition(data, (low, high))
+
+        return float(partition[low]), float(partition[high])
+
+    def SetSeriesBounds(self, series: str, x_range: 'tuple[float, float]', y_range: 'tuple[float, float]') -> Plot:
+        """
+        Store the data range of a series for auto-fitting, empty series are dropped
+        """
+        if x_range is None or y_range is None:
+            self.series_bounds.pop(series, None)
+        else:
+            self.series_bounds[series] = (x_range[0], x_range[1], y_range[0], y_range[1])
+
+        return self
+
+    def GetDataBounds(self) -> 'tuple[float, float, float, float]':
+        """
+        Get the union of the bounds of every series as (x_min, x_max, y_min, y_max), None without data
+        """
+        if not self.series_bounds:
+            return None
+
+        bounds = list(self.series_bounds.values())
+
+        return min(b[0] for b in bounds), max(b[1] for b in bounds), min(b[2] for b in bounds), max(b[3] for b in bounds)
+
+    def AutoFitXAxis(self, margin: float = 0.0, hysteresis: float = 0.25) -> Plot:
+        """
+        Fit the x axis to the cached data bounds, see AutoFitYAxis
+        """
+        bounds = self.GetDataBounds()
+        if bounds is not None:
+            self.__AutoFitAxis("x", bounds[0], bounds[1], margin, hysteresis)
+
+        return self
+
+    def AutoFitYAxis(self, margin: float = 0.05, hysteresis: float = 0.25) -> Plot:
+        """
+        Fit the y axis to the cached data bounds. The limits grow as soon as the data leaves them but
+        only shrink once the data spans less than (1 - hysteresis) of them, so noisy data does not
+        make the axis jitter
+        """
+        bounds = self.GetDataBounds()
+        if bounds is not None:
+            self.__AutoFitAxis("y", bounds[2], bounds[3], margin, hysteresis)
+
+        return self
+
+    def __AutoFitAxis(self, axis: str, low: float, high: float, margin: float, hysteresis: float) -> None:
+        """
+        Apply the hysteresis rule to one axis and only touch DearPyGUI when the limits change
+        """
+
+        # A flat line still gets a visible range around it
+        padding = (high - low) * margin if high > low else max(abs(high), 1.0) * max(margin, 0.05)
+        low    -= padding
+        high   += padding
+
+        current = self.fit_limits[axis]
+        if current is not None:
+            inside    = current[0] <= low and high <= current[1]
+            too_large = (high - low) < (1 - hysteresis) * (current[1] - current[0])
+            if inside and not too_large:
+                return
+
+        self.fit_limits[axis] = (low, high)
+        if axis == "x":
+            self.SetXAxisLimits(low, high)
+        else:
+            self.SetYAxisLimits(low, high)
+
+    def AddAnnotation(self, label: str, x: float, y: float, offset: 'list[float]' = [0, -15],
+                      color: 'list[int]' = [36, 183, 199, 255]) -> Plot:
+        """
+        Add a text annotation anchored to a point on the plot
+        """
+        self.annotations.append(dpg.add_plot_annotation(label=label, default_value=(x, y), offset=offset, color=color, parent=self.tag))
+
+        return self
+
+    def ClearAnnotations(self) -> Plot:
+        """
+        Remove all of the annotations from the plot
+        """
+        for annotation in self.annotations:
+            dpg.delete_item(annotation)
+
+        self.annotations.clear()
+
+        return self
+
+    def GetMousePosition(self) -> 'list[float]':
+        """
+        Get the mouse position in plot coordinates, only meaningful while the plot is hovered
+        """
+        return dpg.get_plot_mouse_pos()
+
+    def ShowHoverAnnotation(self, label: str, x: float, y: float, color: 'list[int]' = [255, 255, 255, 255]) -> Plot:
+        """
+        Show a single annotation that follows the mouse, it is created once and moved afterwards
+        """
+        if self.hover_annotation is None:
+            self.hover_annotation = dpg.add_plot_annotation(label=label, default_value=(x, y), offset=[10, -10], color=color, parent=self.tag)
+        else:
+            dpg.set_value(self.hover_annotation, [x, y, 0, 0])
+            dpg.configure_item(self.hover_annotation, label=label, show=True)
+
+        return self
+
+    def HideHoverAnnotation(self) -> Plot:
+        """
+        Hide the annotation that follows the mouse
+        """
+        if self.hover_annotation is not None:
+            dpg.hide_item(self.hover_annotation)
+
+        return self
+
     def FitXAxis(self) -> Plot:
         """
         Auto fits the x axis to the plot
@@ -781,6 +1498,18 @@ class Plot(Control):
 
         return self
     
+    def GetXAxisLimits(self) -> 'list[float]':
+        """
+        Get the x axis limits currently shown
+        """
+        return dpg.get_axis_limits(self.x_axis)
+
+    def GetYAxisLimits(self) -> 'list[float]':
+        """
+        Get the y axis limits currently shown
+        """
+        return dpg.get_axis_limits(self.y_axis)
+
     def SetYAxisLimits(self, min: float, max: float) -> Plot:
         """
         Set x axis limits
@@ -809,7 +1538,7 @@ class Plot(Control):
         """
         Set the color of the line on plot
         """
-        dpg.add_theme_color(dpg.mvPlotCol_Line, color, category=dpg.mvThemeCat_Plots, parent=self.theme_component)
+        self.AddThemeColor(dpg.mvPlotCol_Line, color, category=dpg.mvThemeCat_Plots)
 
         return self
     
@@ -817,10 +1546,100 @@ class Plot(Control):
         """
         Adds a border to the legend
         """
-        dpg.add_theme_style(dpg.mvStyleVar_PopupBorderSize, border_size, category=dpg.mvThemeCat_Core, parent=self.theme_component)
+        self.AddThemeStyle(dpg.mvStyleVar_PopupBorderSize, border_size, category=dpg.mvThemeCat_Core)
 
         return self
 
+class ItemCollection():
+
+    """
+    Ordered set of string items kept on the python side, the listbox and combobox use it as the
+    source of truth so DearPyGUI only has to be told about the final list once per batch
+    """
+
+    def __init__(self, items: 'list[str]' = []) -> None:
+        self.__items         = dict.fromkeys(items)
+        self.__search_items  = None
+        self.__search_text   = None
+        self.__search_starts = None
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __contains__(self, item: str) -> bool:
+        return item in self.__items
+
+    def GetItems(self) -> 'list[str]':
+        """
+        Get the items in insertion order
+        """
+        return list(self.__items)
+
+    def Add(self, items: 'list[str]') -> bool:
+        """
+        Add the items that are not empty and not already present, returns true if anything changed
+        """
+        count = len(self.__items)
+        self.__items.update((item, None) for item in items if len(item) > 0)
+
+        return self.__Changed(count)
+
+    def Remove(self, items: 'list[str]') -> bool:
+        """
+        Remove the items that are present, returns true if anything changed
+        """
+        count = len(self.__items)
+        for item in items:
+            self.__items.pop(item, None)
+
+        return self.__Changed(count)
+
+    def Filter(self, text: str) -> 'list[str]':
+        """
+        Get the items containing the text, ignoring case. The items are searched as one joined
+        string so the scan runs in C and only the matches are touched from python
+        """
+
+        if len(text) == 0:
+            return self.GetItems()
+
+        if self.__search_text is None:
+            self.__BuildSearchIndex()
+
+        needle   = text.lower()
+        starts   = self.__search_starts
+        matches  = []
+        position = self.__search_text.find(needle)
+        while position != -1:
+            index = bisect.bisect_right(starts, position) - 1
+            matches.append(self.__search_items[index])
+
+            # Continue from the next item so every item is reported once
+            position = self.__search_text.find(needle, starts[index + 1])
+
+        return matches
+
+    def __Changed(self, count: int) -> bool:
+        """
+        Drop the search index if the item count changed
+        """
+        if count == len(self.__items):
+            return False
+
+        self.__search_text = None
+
+        return True
+
+    def __BuildSearchIndex(self) -> None:
+        """
+        Join the lower case items with a separator that can not be typed and remember where every item starts
+        """
+        self.__search_items  = self.GetItems()
+        self.__search_text   = "\0".join(self.__search_items).lower() + "\0"
+        self.__search_starts = [0]
+        for item in self.__search_items:
+            self.__search_starts.append(self.__search_starts[-1] + len(item) + 1)
+
 class ListBox(Control):
 
     """
@@ -833,7 +1652,9 @@ class ListBox(Control):
                  user_data: typing.Any = None, payload_type: str = '$$DPG_PAYLOAD') -> None:
         super().__init__(parent=parent)
         self.payload_type    = payload_type
-        self.theme_component = dpg.add_theme_component(dpg.mvListbox, parent=self.theme)
+        self.items           = ItemCollection(items)
+        self.filter_text     = ''
+        self.theme_component = (dpg.mvListbox, True)
         self.tag             = dpg.add_listbox(
             items=items,
             num_items=num_items,
@@ -852,27 +1673,58 @@ class ListBox(Control):
         """
         Add an item to the listbox
         """
+        return self.AddItems([item])
 
-        config      = dpg.get_item_configuration(self.tag)
-        items: list = config["items"]
-        if len(item) > 0 and item not in items:
-            items.append(item)
-            dpg.configure_item(self.tag, items=items)
-
-        return self
-    
     def DeleteFromListBox(self, item: str) -> ListBox:
         """
         Delete an item from the listbox
         """
+        return self.RemoveItems([item])
+
+    def AddItems(self, items: 'list[str]') -> ListBox:
+        """
+        Add many items to the listbox with a single update of the control
+        """
+        if self.items.Add(items):
+            self.__Refresh()
+
+        return self
+
+    def RemoveItems(self, items: 'list[str]') -> ListBox:
+        """
+        Remove many items from the listbox with a single update of the control
+        """
+        if self.items.Remove(items):
+            self.__Refresh()
+
+        return self
+
+    def GetItems(self) -> 'list[str]':
+        """
+        Get every item in the listbox, including the ones hidden by the filter
+        """
+        return self.items.GetItems()
 
-        config      = dpg.get_item_configuration(self.tag)
-        items: list = config["items"]
-        if len(items) > 0 and item in items:
-            items.remove(item)
-            dpg.configure_item(self.tag, items=items)
+    def FilterItems(self, text: str) -> 'list[str]':
+        """
+        Get the items containing the text, ignoring case
+        """
+        return self.items.Filter(text)
+
+    def ShowFilteredItems(self, text: str) -> ListBox:
+        """
+        Only show the items containing the text, an empty text shows every item
+        """
+        self.filter_text = text
+        self.__Refresh()
 
         return self
+
+    def __Refresh(self) -> None:
+        """
+        Push the visible items to DearPyGUI
+        """
+        dpg.configure_item(self.tag, items=self.items.Filter(self.filter_text))
     
     def GetSelectedItem(self) -> str:
         """
@@ -909,8 +1761,8 @@ class InputTextBox(Control):
                  scientific: bool = False, on_enter: bool = False) -> None:
         super().__init__(parent=parent)
         self.payload_type    = payload_type
-        self.theme_component = dpg.add_theme_component(dpg.mvInputText, parent=self.theme)
-        self.disabled_theme  = dpg.add_theme_component(dpg.mvInputText, parent=self.theme, enabled_state=False)
+        self.theme_component = (dpg.mvInputText, True)
+        self.disabled_theme  = (dpg.mvInputText, False)
         self.tag             = dpg.add_input_text(
             label=label,
             width=width,
@@ -948,7 +1800,7 @@ class InputTextBox(Control):
         """
         Add a border to the button
         """
-        dpg.add_theme_style(dpg.mvStyleVar_FrameBorderSize, border_size, category=dpg.mvThemeCat_Core, parent=self.theme_component)
+        self.AddThemeStyle(dpg.mvStyleVar_FrameBorderSize, border_size, category=dpg.mvThemeCat_Core)
 
         return self
     
@@ -956,8 +1808,8 @@ class InputTextBox(Control):
         """
         Change the rounding of the control
         """
-        dpg.add_theme_style(dpg.mvStyleVar_FrameRounding, frame_rounding, category=dpg.mvThemeCat_Core, parent=self.theme_component)
-        dpg.add_theme_style(dpg.mvStyleVar_GrabRounding,  grab_rounding,  category=dpg.mvThemeCat_Core, parent=self.theme_component)
+        self.AddThemeStyle(dpg.mvStyleVar_FrameRounding, frame_rounding, category=dpg.mvThemeCat_Core)
+        self.AddThemeStyle(dpg.mvStyleVar_GrabRounding,  grab_rounding,  category=dpg.mvThemeCat_Core)
 
         return self
     
@@ -999,7 +1851,7 @@ class DateSelect(Control):
                  level: int = 0, pos: 'list[int]' = [], parent: Control = None, callback: typing.Any = None, 
                  user_data: typing.Any = None) -> None:
         super().__init__(parent=parent)
-        self.theme_component = dpg.add_theme_component(dpg.mvDatePicker, parent=self.theme)
+        self.theme_component = (dpg.mvDatePicker, True)
         self.tag             = dpg.add_date_picker(
             label=label,
             default_value=default_value,
@@ -1060,7 +1912,7 @@ class TimeSelect(Control):
                  user_data: typing.Any = None) -> None:
         super().__init__(parent=parent)
         self.hour24          = hour24
-        self.theme_component = dpg.add_theme_component(dpg.mvTimePicker, parent=self.theme)
+        self.theme_component = (dpg.mvTimePicker, True)
         self.tag             = dpg.add_time_picker(
             label=label,
             default_value=default_value,
@@ -1123,7 +1975,9 @@ class ComboBox(Control):
                  drag_callback: typing.Any = None, user_data: typing.Any = None, 
                  payload_type: str = '$$DPG_PAYLOAD') -> None:
         super().__init__(parent=parent)
-        self.theme_component = dpg.add_theme_component(dpg.mvCombo, parent=self.theme)
+        self.items           = ItemCollection(items)
+        self.filter_text     = ''
+        self.theme_component = (dpg.mvCombo, True)
         self.tag             = dpg.add_combo(
             items=items,
             default_value=default_value,
@@ -1141,27 +1995,58 @@ class ComboBox(Control):
         """
         Add an item to the combobox
         """
+        return self.AddItems([item])
 
-        config      = dpg.get_item_configuration(self.tag)
-        items: list = config["items"]
-        if len(item) > 0 and item not in items:
-            items.append(item)
-            dpg.configure_item(self.tag, items=items)
-
-        return self
-    
     def DeleteFromComboBox(self, item: str) -> ComboBox:
         """
         Delete an item from the combobox
         """
+        return self.RemoveItems([item])
+
+    def AddItems(self, items: 'list[str]') -> ComboBox:
+        """
+        Add many items to the combobox with a single update of the control
+        """
+        if self.items.Add(items):
+            self.__Refresh()
+
+        return self
+
+    def RemoveItems(self, items: 'list[str]') -> ComboBox:
+        """
+        Remove many items from the combobox with a single update of the control
+        """
+        if self.items.Remove(items):
+            self.__Refresh()
 
-        config      = dpg.get_item_configuration(self.tag)
-        items: list = config["items"]
-        if len(items) > 0 and item in items:
-            items.remove(item)
-            dpg.configure_item(self.tag, items=items)
+        return self
+
+    def GetItems(self) -> 'list[str]':
+        """
+        Get every item in the combobox, including the ones hidden by the filter
+        """
+        return self.items.GetItems()
+
+    def FilterItems(self, text: str) -> 'list[str]':
+        """
+        Get the items containing the text, ignoring case
+        """
+        return self.items.Filter(text)
+
+    def ShowFilteredItems(self, text: str) -> ComboBox:
+        """
+        Only show the items containing the text, an empty text shows every item
+        """
+        self.filter_text = text
+        self.__Refresh()
 
         return self
+
+    def __Refresh(self) -> None:
+        """
+        Push the visible items to DearPyGUI
+        """
+        dpg.configure_item(self.tag, items=self.items.Filter(self.filter_text))
     
     def SetSelectedItem(self, selected_item: str) -> ComboBox:
         """
@@ -1181,7 +2066,7 @@ class ComboBox(Control):
         """
         Add a border to the combobox
         """
-        dpg.add_theme_style(dpg.mvStyleVar_PopupBorderSize, border_size, category=dpg.mvThemeCat_Core, parent=self.theme_component)
+        self.AddThemeStyle(dpg.mvStyleVar_PopupBorderSize, border_size, category=dpg.mvThemeCat_Core)
 
         return self
     
@@ -1194,7 +2079,7 @@ class CheckBox(Control):
     def __init__(self, default_value: bool = False, label: str = None, pos: 'list[int]' = [], 
                  parent: Control = None, callback: typing.Any = None, user_data: typing.Any = None) -> None:
         super().__init__(parent=parent)
-        self.theme_component = dpg.add_theme_component(dpg.mvCheckbox, parent=self.theme)
+        self.theme_component = (dpg.mvCheckbox, True)
         self.tag             = dpg.add_checkbox(
             default_value=default_value,
             label=label,
@@ -1244,12 +2129,10 @@ class TableRow(Control):
         """
         Add an empty entry into the column for the row
         """
+        # Create a table cell control on the fly, it adds itself as child to this control
         table_cell_control     = Control(parent=self)
         table_cell_control.tag = dpg.add_table_cell(label=label, height=height, parent=self.tag)
 
-        # Create a table cell control on the fly and add it as child to this control
-        self.children.append(table_cell_control)
-
         return self
 
 class TableColumn(Control):
@@ -1310,7 +2193,7 @@ class Table(Control):
                  no_pad_outerX: bool = False, no_pad_innerX: bool = False, scrollX: bool = False,
                  scrollY: bool = False, no_saved_settings: bool = False) -> None:
         super().__init__(parent=parent)
-        self.theme_component = dpg.add_theme_component(dpg.mvTable, parent=self.theme)
+        self.theme_component = (dpg.mvTable, True)
         self.tag             = dpg.add_table(
             label=label,
             width=width,
@@ -1398,10 +2281,205 @@ class Table(Control):
         """
         Change padding for the control
         """
-        dpg.add_theme_style(dpg.mvStyleVar_CellPadding, cell_padding[0], cell_padding[1], category=dpg.mvThemeCat_Core, parent=self.theme_component)
+        self.AddThemeStyle(dpg.mvStyleVar_CellPadding, cell_padding[0], cell_padding[1], category=dpg.mvThemeCat_Core)
 
         return self
     
+class DataTable(Table):
+
+    """
+    Data Table Control, a table bound to NumPy columns which only creates DearPyGUI items for the rows
+    in view. The table sits in a scrolling child window, a spacer row above and below the pool of visible
+    rows keeps the scrollbar sized for the whole data set, and every frame the pool is refilled from the
+    data at the current scroll position
+    """
+
+    def __init__(self, columns: 'list[str]', visible_rows: int = 30, row_height: int = 20,
+                 formats: 'dict[str, str]' = {}, label: str = None, width: int = 0, height: int = 0,
+                 pos: 'list[int]' = [], parent: Control = None, sortable: bool = False,
+                 row_background: bool = False, borders_innerH: bool = False, borders_outerH: bool = False,
+                 borders_innerV: bool = False, borders_outerV: bool = False) -> None:
+
+        # DearPyGUI only exposes the scroll position of windows, so the scrolling is done by a child window
+        self.container = ChildWindow(width=width, height=height, pos=pos, parent=parent, border=False)
+
+        # The clipper assumes every row has the same height, which the spacer rows break, so it stays off
+        super().__init__(
+            label=label,
+            parent=self.container,
+            callback=self.__SortCallback if sortable else None,
+            sortable=sortable,
+            row_background=row_background,
+            borders_innerH=borders_innerH,
+            borders_outerH=borders_outerH,
+            borders_innerV=borders_innerV,
+            borders_outerV=borders_outerV
+        )
+        self.column_names = list(columns)
+        self.formats      = formats
+        self.visible_rows = visible_rows
+        self.row_height   = row_height
+        self.data         = {}
+        self.row_count    = 0
+        self.order        = None
+        self.inverse      = None
+        self.sort_spec    = None
+        self.first_row    = 0
+        self.dirty        = True
+
+        # Map the column tags back to the column names for the sort callback
+        self.column_tags = {}
+        for name in self.column_names:
+            self.column_tags[self.AddColumn(label=name).tag] = name
+
+        # Create the pool of rows that will be reused for whatever part of the data is in view
+        self.top_spacer    = self.AddRow(height=0)
+        self.cells         = []
+        for _ in range(self.visible_rows):
+            row = self.AddRow(height=self.row_height)
+            self.cells.append([Label(label='', parent=row) for _ in self.column_names])
+        self.bottom_spacer = self.AddRow(height=0)
+
+    def SetData(self, data: typing.Any) -> DataTable:
+        """
+        Bind the table to a dict of equally long NumPy columns or to a structured array,
+        the arrays are referenced and never copied. A column missing from the data shows the row index
+        """
+        if hasattr(data, "dtype") and data.dtype.names is not None:
+            data = {name: data[name] for name in data.dtype.names}
+
+        self.data      = {name: data.get(name) for name in self.column_names}
+        self.row_count = min((len(column) for column in self.data.values() if column is not None), default=0)
+        self.__ApplySort()
+
+        return self
+
+    def GetRowCount(self) -> int:
+        """
+        Get the number of rows in the bound data
+        """
+        return self.row_count
+
+    def SortByColumn(self, name: str, descending: bool = False) -> DataTable:
+        """
+        Sort the rows by a column, only an index array is computed and the rows in view are refilled.
+        The sort is kept and applied again whenever new data is bound
+        """
+        self.sort_spec = (name, descending)
+        self.__ApplySort()
+
+        return self
+
+    def ClearSort(self) -> DataTable:
+        """
+        Show the rows in the order of the data again
+        """
+        self.sort_spec = None
+        self.__ApplySort()
+
+        return self
+
+    def __ApplySort(self) -> None:
+        """
+        Compute the display order from the sort spec
+        """
+        self.order   = None
+        self.inverse = None
+        self.dirty   = True
+        if self.sort_spec is None or self.row_count == 0:
+            return
+
+        name, descending = self.sort_spec
+        column           = self.data[name][:self.row_count] if self.data[name] is not None else np.arange(self.row_count)
+        self.order       = np.argsort(column, kind="stable")
+        if descending:
+            self.order = self.order[::-1]
+
+        # The display row of every data row, so jumping to a data row is a lookup instead of a search
+        self.inverse             = np.empty_like(self.order)
+        self.inverse[self.order] = np.arange(self.row_count)
+
+    def ScrollToRow(self, row: int) -> DataTable:
+        """
+        Scroll so that the row (in display order) is the first row in view
+        """
+        dpg.set_y_scroll(self.container.tag, row * self.row_height)
+        self.__Materialize(row)
+
+        return self
+
+    def ScrollToDataRow(self, data_row: int) -> DataTable:
+        """
+        Scroll so that a row of the bound data is the first row in view, wherever the sort put it
+        """
+        if self.inverse is not None:
+            data_row = int(self.inverse[data_row])
+
+        return self.ScrollToRow(data_row)
+
+    def Update(self) -> DataTable:
+        """
+        Refill the rows in view if the table was scrolled or the data changed, call this once per frame
+        """
+        # Clamp before comparing, near the end of the data the scroll maps past the last full page
+        first = self.__ClampFirstRow(dpg.get_y_scroll(self.container.tag) // self.row_height)
+        if first != self.first_row or self.dirty:
+            self.__Materialize(first)
+
+        return self
+
+    def __ClampFirstRow(self, first: float) -> int:
+        """
+        Clamp a first row so that the pool of visible rows never runs past the end of the data
+        """
+        return min(max(int(first), 0), max(self.row_count - self.visible_rows, 0))
+
+    def __Materialize(self, first: int) -> None:
+        """
+        Write the rows starting at first into the pool of visible rows and resize the spacers
+        """
+
+        first = self.__ClampFirstRow(first)
+        last  = min(first + self.visible_rows, self.row_count)
+        rows  = self.order[first:last] if self.order is not None else np.arange(first, last)
+
+        # Only the rows in view are gathered from the data
+        for column, name in enumerate(self.column_names):
+            text   = self.formats.get(name, "{}")
+            values = self.data[name][rows] if self.data[name] is not None else rows
+            for row, value in enumerate(values):
+                self.cells[row][column].SetValue(text.format(value))
+
+        for row in range(last - first, self.visible_rows):
+            for cell in self.cells[row]:
+                cell.SetValue('')
+
+        top    = first * self.row_height
+        bottom = (self.row_count - last) * self.row_height
+        dpg.configure_item(self.top_spacer.tag, height=top, show=top > 0)
+        dpg.configure_item(self.bottom_spacer.tag, height=bottom, show=bottom > 0)
+
+        self.first_row = first
+        self.dirty     = False
+
+    def Destroy(self) -> DataTable:
+        """
+        Destroy the table together with the child window it scrolls in
+        """
+        self.container.Destroy()
+
+        return self
+
+    def __SortCallback(self, sender: typing.Any, sort_specs: typing.Any) -> None:
+        """
+        Sort the rows when a column header is clicked
+        """
+        if sort_specs is None or len(sort_specs) == 0:
+            self.ClearSort()
+        else:
+            column, direction = sort_specs[0]
+            self.SortByColumn(self.column_tags[column], descending=direction < 0)
+
 class LoadingIndicator(Control):
 
     """
@@ -1429,6 +2507,33 @@ class LoadingIndicator(Control):
             secondary_color=secondary_color
         )
 
+class FileDialog(Control):
+
+    """
+    File Dialog Control, creates a hidden file dialog, the callback receives the chosen path as app_data["file_path_name"]
+    """
+
+    def __init__(self, label: str = None, width: int = 700, height: int = 400, extensions: 'list[str]' = [],
+                 default_path: str = "", default_filename: str = "", directory_selector: bool = False,
+                 modal: bool = True, callback: typing.Any = None, user_data: typing.Any = None) -> None:
+        super().__init__(parent=None)
+        self.tag = dpg.add_file_dialog(
+            label=label,
+            width=width,
+            height=height,
+            default_path=default_path,
+            default_filename=default_filename,
+            directory_selector=directory_selector,
+            modal=modal,
+            show=False,
+            callback=callback,
+            user_data=user_data
+        )
+
+        # Filters listed in the dialog, the first one is selected
+        for extension in extensions:
+            dpg.add_file_extension(extension, parent=self.tag)
+
 class Slider(Control):
 
     """
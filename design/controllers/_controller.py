@@ -2,6 +2,11 @@ from __future__ import annotations
 from design.views.plot_controls_view import PlotControlsView
 from design.models.plot_controls_model import PlotControlsModel
 from design.controllers.plot_controls_controller import PlotControlsController
+from design.sources.udp_source import UdpSampleReceiver, SendSine
+from design.sources.shared_ring import SharedRingSource
+from design.sources.socket_source import SocketSampleSource
+from design.sources.tone_generator import DeadlineScheduler, ModelSink, OpenSink
+import asyncio
 
 class MainController():
 
@@ -12,12 +17,66 @@ class MainController():
     2. Get data from the Model and pass it to the View (for displaying)
     """
 
-    def __init__(self) -> None:
+    def __init__(self, udp_demo: bool = False, shared_memory: str = None, socket: str = None, socket_policy: str = "drop",
+                 generate: str = None, generate_rate: int = 48000) -> None:
 
         # Create the model, view and controller here
         self.plot_controls_view       = PlotControlsView()
         self.plot_controls_model      = PlotControlsModel()
         self.plot_controls_controller = PlotControlsController(self.plot_controls_view, self.plot_controls_model)
 
+        # Changes made off the render thread, e.g. by the DearPyGUI callbacks, wake the main loop
+        self.plot_controls_model.AddNotifyListener(self.plot_controls_view.governor.Wake)
+
         # Run the main event handler to also render the GUI elements
-        self.plot_controls_view.Run(self.plot_controls_controller.UpdatePlotCallback)
\ No newline at end of file
+        if udp_demo:
+            asyncio.run(self.RunUdpDemo())
+        elif shared_memory is not None:
+            asyncio.run(self.RunSharedMemory(shared_memory))
+        elif socket is not None:
+            self.RunSocket(socket, socket_policy)
+        elif generate is not None:
+            self.RunGenerator(generate, generate_rate)
+        else:
+            self.plot_controls_view.Run(self.plot_controls_controller.UpdatePlotCallback, self.plot_controls_controller.IsFrameDirty)
+
+    async def RunUdpDemo(self, sample_rate: float = 500_000) -> None:
+        """
+        Render on an event loop alongside a local UDP sender and the receiver publishing its samples into the model
+        """
+        receiver = await UdpSampleReceiver(self.plot_controls_model, sample_rate).Open()
+        await self.plot_controls_view.RunAsync(self.plot_controls_controller.UpdatePlotCallback, self.plot_controls_controller.IsFrameDirty,
+                                               tasks=[receiver.Run(), SendSine(receiver.host, receiver.port, sample_rate=sample_rate)])
+
+    async def RunSharedMemory(self, name: str) -> None:
+        """
+        Render on an event loop while streaming the shared memory ring of an external producer into the model
+        """
+        source                         = SharedRingSource(self.plot_controls_model, name)
+        self.plot_controls_view.source = source
+        await self.plot_controls_view.RunAsync(self.plot_controls_controller.UpdatePlotCallback, self.plot_controls_controller.IsFrameDirty,
+                                               tasks=[source.Run()])
+
+    def RunSocket(self, address: str, policy: str) -> None:
+        """
+        Render while a background thread receives framed samples from a local socket
+        """
+        source                        = SocketSampleSource(self.plot_controls_model, address, policy=policy).Start()
+        self.plot_controls_view.source = source
+        try:
+            self.plot_controls_view.Run(self.plot_controls_controller.UpdatePlotCallback, self.plot_controls_controller.IsFrameDirty)
+        finally:
+            source.Stop()
+
+    def RunGenerator(self, sink: str, sample_rate: int, chunk_samples: int = 512) -> None:
+        """
+        Render while the sliders drive an audio rate sine written into the sink on a deadline, the chunks are
+        also published into the model so the plots follow what is generated
+        """
+        scheduler = DeadlineScheduler([OpenSink(sink, sample_rate, chunk_samples), ModelSink(self.plot_controls_model, sample_rate)],
+                                      self.plot_controls_controller.GetGeneratorParameters, sample_rate=sample_rate, chunk_samples=chunk_samples).Start()
+        self.plot_controls_view.source = scheduler
+        try:
+            self.plot_controls_view.Run(self.plot_controls_controller.UpdatePlotCallback, self.plot_controls_controller.IsFrameDirty)
+        finally:
+            scheduler.Stop()
\ No newline at end of file
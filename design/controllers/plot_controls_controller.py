@@ -1,6 +1,19 @@
 from design.views.plot_controls_view import PlotControlsView
 from design.models.plot_controls_model import PlotControlsModel
+from design.dsp.biquad_filter import BiquadFilter, DesignButterworth
+from design.dsp.goertzel import GoertzelTracker
+from design.dsp.graph import BuildSignalGraph, ProcessingGraph, Ref
+from design.dsp.measurements import MeasureHarmonics, MeasureSignal, RunningStatistics, SlidingRange
+from design.dsp.peaks import PEAK_DTYPE
+from design.dsp.search import FindNearestIndex
+from design.dsp.spectrum import ComputeMagnitudeSpectrum, ComputeZoomSpectrum
+from design.sources.file_export import SignalExporter
+from design.sources.file_import import DetectFormat, SignalImporter
+from design.sources.summary_index import SummaryIndex
 import numpy as np
+import typing
+import time
+import os
 
 class PlotControlsController():
 
@@ -12,6 +25,103 @@ class PlotControlsController():
         self.plot_controls_view  = plot_controls_view
         self.plot_controls_model = plot_controls_model
 
+        # Filter stage state, the coefficients are only redesigned when the key changes
+        self.filter_order = 4
+        self.filter_key   = None
+        self.filter       = None
+
+        # Streaming state, the phase accumulator keeps successive chunks continuous
+        self.stream_frame_rate = 60
+        self.stream_active     = False
+        self.stream_phase      = 0.0
+        self.stream_y_data     = None
+        self.stream_statistics = RunningStatistics()
+        self.stream_range      = None
+
+        # Y range of the time plot data, only measured again when the data or the fit mode changed
+        self.time_y_range      = None
+        self.time_range_robust = False
+
+        # Samples published by external sources scroll through a display buffer of external_window samples
+        self.external_window      = 1 << 16
+        self.external_active      = False
+        self.external_sample_rate = None
+        self.external_x_data      = None
+        self.external_y_data      = None
+        self.external_statistics  = RunningStatistics()
+
+        # File import running in the background, its envelope is previewed while it loads. Raw binary and
+        # .npy files carry no sample rate so import_sample_rate is assumed, and the spectrum and measurements
+        # of an imported signal are taken over its first import_analysis_samples samples
+        self.import_sample_rate      = 48000.0
+        self.import_analysis_samples = 1 << 20
+        self.importer                = None
+        self.import_version          = None
+        self.import_recording        = None
+
+        # Raw binary and .npy captures are browsed through their summary index instead, the time plot
+        # queries the visible range at its pixel width whenever the view or the index moved
+        self.capture_index    = None
+        self.capture_key      = None
+        self.capture_analysed = False
+
+        # Export running in the background and the format picked from the file menu, an open capture or a
+        # completed import is exported whole and otherwise the time plot data is
+        self.exporter       = None
+        self.export_options = ("wav", "pcm16")
+
+        # Goertzel tracker for the slider frequency and its harmonics, rebuilt when the key changes
+        self.tone_tracker     = None
+        self.tone_tracker_key = None
+
+        # Visible band the zoom spectrum was last evaluated over and the data shown for it
+        self.zoom_band = None
+        self.zoom_data = None
+
+        # Plot and readout of the last hover update, the view is only written when they change
+        self.hover_plot    = None
+        self.hover_readout = None
+
+        # The inspector tables are only bound to the model arrays again after they changed
+        self.inspector_dirty = True
+
+        # Key of the parameters that produced the last measured buffer, measurements are
+        # only taken again when it changes
+        self.signal_key = None
+
+        # One-shot buffers that are built in one go come from the generator chain as a processing graph, so a
+        # slider change only runs the nodes after it (a cutoff change only filters again). Sliced and streamed
+        # buffers are built outside of it since their filter state carries over between chunks. graph_key is
+        # the key of the last buffer the graph built
+        self.signal_graph = BuildSignalGraph(self.plot_controls_view.length_of_plot, order=self.filter_order)
+        self.graph_key    = None
+
+        # Analysis stage of the generated signal as a processing graph, the spectrum, its peaks and the
+        # harmonic measurements only run again after the signal or the sample rate changed
+        self.analysis_graph = ProcessingGraph().AddParameter("signal").AddParameter("sample_rate")
+        self.analysis_graph.AddNode("spectrum", "spectrum", signal=Ref("signal"), sample_rate=Ref("sample_rate"))
+        self.analysis_graph.AddNode("peaks", "peaks", freqs=Ref("spectrum.freqs"), magnitude=Ref("spectrum.magnitude"), max_peaks=self.plot_controls_view.max_peaks)
+        self.analysis_graph.AddNode("harmonics", "harmonics", magnitude=Ref("spectrum.magnitude"))
+
+        # Progressive synthesis, while a slider is dragged a preview sized to the frame budget is drawn
+        # and once no drag callback arrived for drag_settle_time the full resolution buffer is built
+        # in slices over several frames. The throughput estimate sizes both the preview and the slices
+        self.drag_settle_time           = 0.15
+        self.frame_budget               = 0.006
+        self.preview_min_samples        = 2 * self.plot_controls_view.plot_window_width
+        self.drag_time                  = None
+        self.seconds_per_sample         = 2e-8
+        self.preview_seconds_per_sample = 1e-7
+        self.synthesis                  = None
+        self.synthesis_job              = None
+        self.tracked_key                = None
+
+        # Frame scheduling, the model notifies the controller when an input changed and frames
+        # without changes are skipped unless something has to follow the data or the mouse
+        self.frame_dirty      = True
+        self.continuous_frame = False
+        self.plot_controls_model.Subscribe(PlotControlsModel.INPUT_FIELDS, self.ModelChangedCallback)
+
         # Set the callbacks for the controls
         self.plot_controls_view.generate_waveform_button.SetCallback(self.GenWaveformButtonCallback)
         self.plot_controls_view.clear_plot_button.SetCallback(self.ClearPlotButtonCallback)
@@ -21,6 +131,23 @@ class PlotControlsController():
         self.plot_controls_view.phase_slider.SetCallback(self.PhaseSliderCallback)
         self.plot_controls_view.frequency_slider.SetCallback(self.FrequencySliderCallback)
         self.plot_controls_view.normalize_freq.SetCallback(self.NormalizeFreqCheckboxCallback)
+        self.plot_controls_view.stream_waveform.SetCallback(self.StreamWaveformCheckboxCallback)
+        self.plot_controls_view.filter_combo.SetCallback(self.FilterComboCallback)
+        self.plot_controls_view.cutoff_slider.SetCallback(self.CutoffSliderCallback)
+        self.plot_controls_view.zoom_spectrum.SetCallback(self.ZoomSpectrumCheckboxCallback)
+        self.plot_controls_view.sample_inspector.SetCallback(self.SampleInspectorCheckboxCallback)
+        self.plot_controls_view.robust_fit.SetCallback(self.RobustFitCheckboxCallback)
+        self.plot_controls_view.time_jump_input.SetCallback(self.TimeJumpCallback)
+        self.plot_controls_view.time_jump_button.SetCallback(self.TimeJumpCallback)
+        self.plot_controls_view.freq_jump_input.SetCallback(self.FreqJumpCallback)
+        self.plot_controls_view.freq_jump_button.SetCallback(self.FreqJumpCallback)
+        self.plot_controls_view.import_button.SetCallback(self.ImportButtonCallback)
+        self.plot_controls_view.cancel_import_button.SetCallback(self.CancelImportCallback)
+        self.plot_controls_view.import_dialog.SetCallback(self.ImportFileCallback)
+        self.plot_controls_view.export_dialog.SetCallback(self.ExportFileCallback)
+        self.plot_controls_view.cancel_export_item.SetCallback(self.CancelExportCallback)
+        for item in self.plot_controls_view.export_menu_items:
+            item.SetCallback(self.ExportMenuCallback)
 
         # Initialize the model values here
         self.plot_controls_model.SetResolutionSliderValue(self.plot_controls_view.resolution_slider.GetValue())
@@ -30,6 +157,34 @@ class PlotControlsController():
         self.plot_controls_model.SetFrequencySliderValue(self.plot_controls_view.frequency_slider.GetValue())
         self.plot_controls_model.SetAngularLabel(2 * np.pi * self.plot_controls_view.frequency_slider.GetValue())
         self.plot_controls_model.SetPeriodLabel(1 / self.plot_controls_view.frequency_slider.GetValue())
+        self.plot_controls_model.SetFilterTypeValue(self.plot_controls_view.filter_combo.GetSelectedItem())
+        self.plot_controls_model.SetFilterCutoffSliderValue(self.plot_controls_view.cutoff_slider.GetValue())
+
+    def ModelChangedCallback(self, fields: typing.Set[str]) -> None:
+        """
+        Called once per frame with every model input that changed since the last frame
+        """
+        model                 = self.plot_controls_model
+        self.frame_dirty      = True
+        self.continuous_frame = (model.IsGenWaveformButtonPressed() and (model.IsStreamWaveformChecked() or model.IsZoomSpectrumChecked())) \
+                                or model.IsSampleInspectorChecked()
+
+    def IsFrameDirty(self) -> bool:
+        """
+        Dispatch the model notifications and decide whether this frame has work to do. Streaming, the zoom
+        spectrum, the sample inspector and a running import follow the data or the view every frame, the
+        hover readout only while a plot is hovered
+        """
+
+        self.plot_controls_model.DispatchNotifications()
+
+        view  = self.plot_controls_view
+        dirty = self.frame_dirty or self.continuous_frame or self.IsSynthesisPending() or self.importer is not None or self.hover_plot is not None \
+                or (self.capture_index is not None and self.capture_index.IsUpdating()) or self.exporter is not None \
+                or view.time_plot.IsHovered() or view.freq_plot.IsHovered()
+        self.frame_dirty = False
+
+        return dirty
 
     def UpdatePlotCallback(self) -> None:
         """
@@ -46,9 +201,47 @@ class PlotControlsController():
             # Actually clear the plot here
             self.plot_controls_view.time_plot.PlotLineSeriesData(x_data=[], y_data=[])
             self.plot_controls_model.SetTimePlotData(x_data=[], y_data=[])
+            self.time_y_range = None
+
+            self.plot_controls_view.freq_plot.PlotLineSeriesData(x_data=[], y_data=[])
+            self.plot_controls_model.SetFreqPlotData(x_data=[], y_data=[])
+            self.UpdateMeasurementLabels({})
+            self.UpdateSpectralPeaks(np.zeros(0, dtype=PEAK_DTYPE))
+            self.UpdateToneTrackerLabels(np.zeros(0), np.zeros(0))
+
+            # Start the next stream from a clean state
+            self.ResetStream()
+            self.ResetExternal()
+            self.CancelImportCallback()
+            self.CloseCapture()
+            self.import_recording = None
+            self.signal_key       = None
+            self.inspector_dirty  = True
+
+        # Samples published by external sources take over the plots while they arrive
+        if self.plot_controls_model.GetPublishedBacklog() > 0:
+            self.UpdatePublishedSamples()
+
+        # Preview a file import while it loads
+        if self.importer is not None:
+            self.UpdateImport()
+
+        # Draw the visible part of an indexed capture
+        if self.capture_index is not None:
+            self.UpdateCapture()
+
+        # Report the progress of an export
+        if self.exporter is not None:
+            self.UpdateExport()
+
+        # Slider drags only steer the one-shot synthesis
+        if not self.plot_controls_model.IsGenWaveformButtonPressed() or self.plot_controls_model.IsStreamWaveformChecked():
+            self.drag_time     = None
+            self.synthesis_job = None
 
         # If the generate waveform is set start populating the plots
-        if self.plot_controls_model.IsGenWaveformButtonPressed():
+        began = time.perf_counter()
+        if self.plot_controls_model.IsGenWaveformButtonPressed() and not self.external_active:
 
             # Add the algorithm stuff here
             #*****************************************************************
@@ -56,39 +249,805 @@ class PlotControlsController():
             # Sample Rate        : Rate at which you sample a signal (like the period) (measured in second per samples)
             # Sampling Frequency : The inverse of the sampling rate                    (measured in samples per second)
 
-            samples   = self.plot_controls_model.GetResolutionSliderValue()
-            x_data    = np.linspace(0, self.plot_controls_view.length_of_plot, samples, endpoint=True)
-            amplitude = self.plot_controls_model.GetAmplitudeSliderValue()
-            height    = self.plot_controls_model.GetHeightSliderValue()
-            phase     = self.plot_controls_model.GetPhaseSliderValue()
-            frequency = self.plot_controls_model.GetFrequencySliderValue()
+            samples     = self.plot_controls_model.GetResolutionSliderValue()
+            sample_rate = max(samples - 1, 1) / self.plot_controls_view.length_of_plot
+            amplitude   = self.plot_controls_model.GetAmplitudeSliderValue()
+            height      = self.plot_controls_model.GetHeightSliderValue()
+            phase       = self.plot_controls_model.GetPhaseSliderValue()
+            frequency   = self.plot_controls_model.GetFrequencySliderValue()
             if self.plot_controls_model.IsNormalizeFreqChecked():
-                y_data = [(amplitude * np.sin(((2 * np.pi * frequency * x) / samples) + phase)) + height for x in x_data]
+                signal_frequency = frequency / samples
             else:
                 # Digital representation of what would be an analog signal, where samples represents the
                 # total number of inputs into my function
-                y_data = [(amplitude * np.sin(((2 * np.pi * frequency * x)) + phase)) + height for x in x_data]
+                signal_frequency = frequency
+
+            if self.plot_controls_model.IsStreamWaveformChecked():
+                x_data       = np.linspace(0, self.plot_controls_view.length_of_plot, samples, endpoint=True)
+                y_data       = self.StreamChunk(samples, sample_rate, amplitude, height, phase, signal_frequency)
+                measurements = self.stream_statistics.GetMeasurements(sample_rate)
+                data_changed = True
+                analyze      = True
+            else:
+                # The buffer shown may be a preview while a slider is dragged or the full buffer is still being built
+                self.stream_active                      = False
+                x_data, y_data, sample_rate, signal_key = self.SynthesizeSignal(samples, amplitude, height, phase, signal_frequency)
+                samples                                 = len(y_data)
+                data_changed                            = signal_key != self.signal_key
+                analyze                                 = data_changed and not self.IsPreview(signal_key)
+                measurements                            = MeasureSignal(y_data, sample_rate) if analyze else None
+                self.signal_key                         = signal_key
+                if analyze and signal_key != self.tracked_key:
+                    self.UpdateToneTracker(y_data, sample_rate, signal_frequency, samples, reset=True)
             #*****************************************************************
 
-            # Actually update the plot here
-            self.plot_controls_view.time_plot.PlotLineSeriesData(x_data=x_data, y_data=y_data)
-            self.plot_controls_model.SetTimePlotData(x_data=x_data, y_data=y_data)
+            # Streamed data keeps its range per chunk, percentile limits need the whole buffer
+            robust = self.plot_controls_model.IsRobustFitChecked()
+            if self.plot_controls_model.IsStreamWaveformChecked() and not robust:
+                self.time_y_range = self.stream_range.GetRange()
+            elif data_changed or robust != self.time_range_robust:
+                self.time_y_range = self.plot_controls_view.time_plot.ComputeDataRange(y_data, self.plot_controls_view.fit_percentile if robust else None)
+            self.time_range_robust = robust
+
+            # Actually update the plot here, the series is only written again when the data changed
+            # and the y axis follows the amplitude and height from the cached range
+            time_key = ("stream", self.stream_statistics.count) if self.stream_active else self.signal_key
+            self.plot_controls_view.time_plot.BindLineSeriesData(x_data=x_data, y_data=y_data, key=time_key, x_range=(0, self.plot_controls_view.length_of_plot), y_range=self.time_y_range)
+            self.plot_controls_view.time_plot.AutoFitYAxis()
+            self.plot_controls_model.SetTimePlotData(x_data=x_data, y_data=y_data, sample_rate=sample_rate)
+
+            # The spectrum and the measurements are only refreshed when the data changed, a drag preview
+            # is only drawn and analyzed once the full resolution buffer is ready
+            if data_changed:
+                self.inspector_dirty = True
+            if analyze:
+
+                # The stream buffer is scrolled in place, so the graph is told it changed
+                self.analysis_graph.SetParameter("sample_rate", sample_rate)
+                if not self.analysis_graph.SetParameter("signal", y_data) and self.stream_active:
+                    self.analysis_graph.Touch("signal")
+                analysis                 = self.analysis_graph.Evaluate("spectrum", "peaks", "harmonics")
+                freq_x_data, freq_y_data = analysis["spectrum"]["freqs"], analysis["spectrum"]["magnitude"]
+                self.plot_controls_model.SetFreqPlotData(x_data=freq_x_data, y_data=freq_y_data)
+                if not self.plot_controls_model.IsZoomSpectrumChecked():
+                    self.plot_controls_view.freq_plot.PlotLineSeriesData(x_data=freq_x_data, y_data=freq_y_data)
+                    self.plot_controls_view.freq_plot.FitXAxis().FitYAxis()
+                self.UpdateSpectralPeaks(analysis["peaks"])
+
+                measurements["thd"], measurements["snr"] = analysis["harmonics"]["thd"], analysis["harmonics"]["snr"]
+                self.plot_controls_model.SetMeasurements(measurements)
+                self.UpdateMeasurementLabels(measurements)
+                self.UpdateStageStats(synthesized=not self.stream_active and self.signal_key == self.graph_key)
+
+            # The zoom spectrum follows the visible band of the frequency plot
+            if self.plot_controls_model.IsZoomSpectrumChecked() and (analyze or not data_changed):
+                self.UpdateZoomSpectrum(y_data, sample_rate, analyze)
 
             # Update the labels with new data
             angular_freq = 2 * np.pi * frequency
             period       = 1 / frequency
-            self.plot_controls_view.angular_label.SetValue(f"Angular Freq: {'{:.3f}'.format(angular_freq)}")
+            self.plot_controls_view.angular_label.BindValue(f"Angular Freq: {'{:.3f}'.format(angular_freq)}")
             self.plot_controls_model.SetAngularLabel(angular_freq)
-            self.plot_controls_view.period_label.SetValue(f"Period: {'{:.3f}'.format(period)}")
+            self.plot_controls_view.period_label.BindValue(f"Period: {'{:.3f}'.format(period)}")
             self.plot_controls_model.SetPeriodLabel(period)
 
+            # Drag previews are sized from what a whole preview frame costs
+            if data_changed and not self.stream_active and self.IsPreview(self.signal_key):
+                self.preview_seconds_per_sample = self.__Smooth(self.preview_seconds_per_sample, samples, time.perf_counter() - began)
+
+        # Keep the rows in view of the sample inspector up to date
+        self.UpdateSampleInspector()
+
+        # Follow the mouse on the plots, once per frame however many mouse events arrived
+        self.UpdateHoverReadout()
+
+    def IsDragging(self) -> bool:
+        """
+        Has a slider drag callback arrived within the settle time
+        """
+        return self.drag_time is not None and time.perf_counter() - self.drag_time < self.drag_settle_time
+
+    def SynthesizeSignal(self, samples: int, amplitude: float, height: float, phase: float,
+                         frequency: float) -> typing.Tuple[np.ndarray, np.ndarray, float, tuple]:
+        """
+        Synthesize and filter the one-shot buffer, returns (x_data, y_data, sample_rate, key). While a slider
+        is dragged a preview with as many samples as fit in the frame budget is returned. Otherwise the full
+        buffer is built in budget sized slices, the last complete buffer is returned until it is finished
+        """
+
+        filter_key = (self.plot_controls_model.GetFilterTypeValue(), self.plot_controls_model.GetFilterCutoffSliderValue()) if self.IsFilterEnabled() else None
+        parameters = (amplitude, height, phase, frequency, filter_key)
+        budget     = max(int(self.frame_budget / self.seconds_per_sample), self.preview_min_samples)
+
+        # Slices are a power of two long so they keep the same length between frames
+        budget     = 1 << (budget.bit_length() - 1)
+
+        if self.IsDragging():
+            self.synthesis_job = None
+            preview            = min(samples, max(int(self.frame_budget / self.preview_seconds_per_sample), self.preview_min_samples))
+            key                = (preview, preview < samples) + parameters
+            if self.synthesis is None or self.synthesis[3] != key:
+                self.synthesis = self.__SynthesizeRange(preview, key, amplitude, height, phase, frequency)
+
+            return self.synthesis
+
+        self.drag_time = None
+        key            = (samples, False) + parameters
+        if self.synthesis is not None and self.synthesis[3] == key:
+            return self.synthesis
+
+        # Small buffers are built in one go
+        if samples <= budget:
+            self.synthesis = self.__SynthesizeRange(samples, key, amplitude, height, phase, frequency)
+            return self.synthesis
+
+        # Start over whenever the parameters changed under a running job
+        if self.synthesis_job is None or self.synthesis_job["key"] != key:
+            x_data             = np.linspace(0, self.plot_controls_view.length_of_plot, samples, endpoint=True)
+            sample_rate        = max(samples - 1, 1) / self.plot_controls_view.length_of_plot
+            self.synthesis_job = {"key": key, "x_data": x_data, "y_data": np.empty(samples), "sample_rate": sample_rate, "position": 0}
+
+        # The filter state carries over between slices so the result matches a single pass
+        job         = self.synthesis_job
+        start, stop = job["position"], min(job["position"] + budget, samples)
+        began       = time.perf_counter()
+        segment     = (amplitude * np.sin((2 * np.pi * frequency * job["x_data"][start:stop]) + phase)) + height
+
+        job["y_data"][start:stop] = self.ApplyFilterStage(segment, job["sample_rate"], reset=start == 0)
+        job["position"]           = stop
+
+        # The goertzel tracker is fed as the slices arrive so the finished buffer does not have to be scanned
+        self.UpdateToneTracker(job["y_data"][start:stop], job["sample_rate"], frequency, samples, reset=start == 0)
+        self.seconds_per_sample = self.__Smooth(self.seconds_per_sample, stop - start, time.perf_counter() - began)
+
+        if stop == samples:
+            self.synthesis     = (job["x_data"], job["y_data"], job["sample_rate"], key)
+            self.synthesis_job = None
+            self.tracked_key   = key
+        elif self.synthesis is None:
+
+            # Nothing was drawn yet, show a preview while the job runs
+            preview        = min(samples, self.preview_min_samples)
+            self.synthesis = self.__SynthesizeRange(preview, (preview, True) + parameters, amplitude, height, phase, frequency)
+
+        return self.synthesis
+
+    def IsSynthesisPending(self) -> bool:
+        """
+        Does the one-shot buffer still need frames, either to settle a drag or to finish a sliced job
+        """
+        return self.drag_time is not None or self.synthesis_job is not None
+
+    def __SynthesizeRange(self, samples: int, key: tuple, amplitude: float, height: float, phase: float,
+                          frequency: float) -> typing.Tuple[np.ndarray, np.ndarray, float, tuple]:
+        """
+        Synthesize and filter a whole buffer of samples points in one go through the signal graph, only the
+        nodes downstream of the parameters that changed run
+        """
+
+        graph = self.signal_graph
+        for name, value in (("samples", samples), ("amplitude", amplitude), ("height", height), ("phase", phase), ("frequency", frequency)):
+            graph.SetParameter(name, value)
+
+        # A disabled filter keeps its last cutoff so toggling it does not synthesize the sine again
+        graph.SetParameter("filter_type", self.plot_controls_model.GetFilterTypeValue() if self.IsFilterEnabled() else "None")
+        if self.IsFilterEnabled():
+            graph.SetParameter("cutoff", self.plot_controls_model.GetFilterCutoffSliderValue())
+
+        output         = graph.Evaluate("signal", "filtered")
+        self.graph_key = key
+
+        return output["signal"]["x"], output["filtered"], output["signal"]["sample_rate"], key
+
+    def __Smooth(self, estimate: float, samples: int, elapsed: float) -> float:
+        """
+        Blend a new measurement into a cost per sample estimate, only buffers large enough to time reliably count
+        """
+        if samples < 10000:
+            return estimate
+
+        return 0.7 * estimate + 0.3 * (elapsed / samples)
+
+    @staticmethod
+    def IsPreview(key: tuple) -> bool:
+        """
+        Was the buffer with this key synthesized as a drag preview
+        """
+        return key is not None and key[1]
+
+    def StreamChunk(self, samples: int, sample_rate: float, amplitude: float, height: float,
+                    phase: float, frequency: float) -> np.ndarray:
+        """
+        Generate one frame worth of new samples, continuing from the previous chunk, and scroll
+        them into the display buffer
+        """
+
+        # Entering streaming mode or changing the resolution restarts the display buffer
+        if not self.stream_active or self.stream_y_data is None or len(self.stream_y_data) != samples:
+            self.ResetStream()
+            self.stream_y_data = np.full(samples, height, dtype=np.float64)
+            self.stream_range  = SlidingRange(samples)
+            self.stream_range.Update(self.stream_y_data)
+            self.stream_active = True
+
+        # The phase accumulator is advanced per sample so frequency changes never cause a jump
+        chunk_size        = min(max(1, int(round(sample_rate / self.stream_frame_rate))), samples)
+        phase_step        = 2 * np.pi * frequency / sample_rate
+        chunk_phase       = self.stream_phase + phase_step * np.arange(chunk_size)
+        self.stream_phase = (self.stream_phase + phase_step * chunk_size) % (2 * np.pi)
+        chunk             = (amplitude * np.sin(chunk_phase + phase)) + height
+        chunk             = self.ApplyFilterStage(chunk, sample_rate, reset=False)
+        self.stream_statistics.Update(chunk)
+        self.stream_range.Update(chunk)
+        self.UpdateToneTracker(chunk, sample_rate, frequency, samples, reset=False)
+
+        # Scroll the new chunk in from the right
+        self.stream_y_data[:-chunk_size] = self.stream_y_data[chunk_size:]
+        self.stream_y_data[-chunk_size:] = chunk
+
+        return self.stream_y_data
+
+    def UpdatePublishedSamples(self) -> None:
+        """
+        Scroll everything published since the last frame into the display buffer and refresh the plots
+        and the measurements once for the whole batch
+        """
+
+        samples, sample_rate = self.plot_controls_model.TakePublishedSamples()
+        if len(samples) == 0:
+            return
+
+        view    = self.plot_controls_view
+        started = not self.external_active or sample_rate != self.external_sample_rate
+        if started:
+            self.ResetExternal()
+            self.external_active      = True
+            self.external_sample_rate = sample_rate
+            self.external_x_data      = np.arange(self.external_window) / sample_rate
+            self.external_y_data      = np.zeros(self.external_window)
+            view.time_plot.SetXAxisLimits(0, self.external_x_data[-1])
+
+        # Every sample counts towards the measurements but only the newest can still be seen
+        self.external_statistics.Update(samples)
+        samples = samples[-self.external_window:]
+        self.external_y_data[:-len(samples)] = self.external_y_data[len(samples):]
+        self.external_y_data[-len(samples):] = samples
+
+        key = ("external", self.external_statistics.count)
+        view.time_plot.BindLineSeriesData(x_data=self.external_x_data, y_data=self.external_y_data, key=key)
+        view.time_plot.AutoFitYAxis()
+        self.plot_controls_model.SetTimePlotData(x_data=self.external_x_data, y_data=self.external_y_data, sample_rate=sample_rate)
+
+        freq_x_data, freq_y_data = ComputeMagnitudeSpectrum(self.external_y_data, sample_rate)
+        view.freq_plot.BindLineSeriesData(x_data=freq_x_data, y_data=freq_y_data, key=key)
+        if started:
+            view.freq_plot.FitXAxis().FitYAxis()
+        self.plot_controls_model.SetFreqPlotData(x_data=freq_x_data, y_data=freq_y_data)
+
+        measurements                             = self.external_statistics.GetMeasurements(sample_rate)
+        measurements["thd"], measurements["snr"] = MeasureHarmonics(freq_y_data)
+        self.plot_controls_model.SetMeasurements(measurements)
+        self.UpdateMeasurementLabels(measurements)
+        self.inspector_dirty = True
+
+    def UpdateImport(self) -> None:
+        """
+        Show the import progress and the envelope loaded so far, once the import ended show the spectrum
+        and the measurements of the imported signal
+        """
+
+        view     = self.plot_controls_view
+        importer = self.importer
+        progress = importer.GetProgress()
+        running  = importer.IsRunning()
+
+        # The preview is redrawn only when another chunk arrived, a cancelled import leaves the plots alone
+        if progress["version"] != self.import_version and not importer.IsCancelled():
+            if self.import_version is None:
+                view.time_plot.SetXAxisLimits(0, max(progress["expected"], 1) / importer.sample_rate)
+            self.import_version = progress["version"]
+
+            x_data, y_data = importer.GetEnvelope()
+            view.time_plot.BindLineSeriesData(x_data=x_data, y_data=y_data, key=("import", id(importer), self.import_version))
+            view.time_plot.AutoFitYAxis()
+            self.plot_controls_model.SetTimePlotData(x_data=x_data, y_data=y_data)
+
+        if running:
+            view.import_label.BindValue(f"Import: {'{:.0f}'.format(100 * progress['fraction'])} % of "
+                                        f"{'{:.1f}'.format(progress['total_bytes'] / 1e6)} MB, {'{:.0f}'.format(progress['bytes_per_s'] / 1e6)} MB/s")
+            return
+
+        self.importer = None
+        view.import_indicator.Hide()
+        view.cancel_import_button.Hide()
+        if importer.error is not None:
+            view.import_label.BindValue(f"Import failed: {importer.error}")
+            return
+        if importer.IsCancelled():
+            view.import_label.BindValue(f"Import cancelled at {'{:.0f}'.format(100 * progress['fraction'])} %")
+            return
+
+        data                  = importer.GetData()
+        sample_rate           = importer.sample_rate
+        self.import_recording = (data, sample_rate)
+        view.time_plot.SetXAxisLimits(0, max(len(data), 1) / sample_rate)
+        view.import_label.BindValue(f"Import: {len(data)} samples at {'{:.0f}'.format(sample_rate)} Hz in {'{:.2f}'.format(progress['elapsed'])} s")
+
+        # Only the start of a long signal is analysed, a memory mapped import is read here for the first time
+        segment                  = np.asarray(data[:self.import_analysis_samples], dtype=np.float64)
+        freq_x_data, freq_y_data = ComputeMagnitudeSpectrum(segment, sample_rate)
+        view.freq_plot.BindLineSeriesData(x_data=freq_x_data, y_data=freq_y_data, key=("import", id(importer)))
+        view.freq_plot.FitXAxis().FitYAxis()
+        self.plot_controls_model.SetFreqPlotData(x_data=freq_x_data, y_data=freq_y_data)
+
+        measurements = MeasureSignal(segment, sample_rate)
+        if measurements:
+            measurements["thd"], measurements["snr"] = MeasureHarmonics(freq_y_data)
+        self.plot_controls_model.SetMeasurements(measurements)
+        self.UpdateMeasurementLabels(measurements)
+        self.inspector_dirty = True
+
+    def OpenCapture(self, path: str) -> None:
+        """
+        Open the summary index of a raw binary or .npy capture and bring it up to date in the background,
+        a fresh index is used as is so even huge captures open at once
+        """
+
+        view = self.plot_controls_view
+        self.CloseCapture()
+        try:
+            self.capture_index = SummaryIndex(path).StartUpdate(on_progress=self.CaptureProgressCallback)
+        except (OSError, ValueError) as error:
+            view.import_label.BindValue(f"Import failed: {error}")
+            return
+
+        self.capture_key      = None
+        self.capture_analysed = False
+        view.time_plot.SetXAxisLimits(0, max(self.capture_index.samples, 1) / self.import_sample_rate)
+
+    def CloseCapture(self) -> None:
+        """
+        Stop indexing and release the capture
+        """
+        if self.capture_index is not None:
+            self.capture_index.Close()
+            self.capture_index = None
+            self.plot_controls_view.import_indicator.Hide()
+            self.plot_controls_view.cancel_import_button.Hide()
+
+    def CaptureProgressCallback(self) -> None:
+        """
+        Called from the indexing thread after every chunk, the next frame draws what was added
+        """
+        self.frame_dirty = True
+        self.plot_controls_view.governor.Wake()
+
+    def UpdateCapture(self) -> None:
+        """
+        Query the summary index for the visible samples at the width of the time plot, only when the view, the
+        width or the indexed samples changed, and show how far the indexing got
+        """
+
+        view        = self.plot_controls_view
+        index       = self.capture_index
+        sample_rate = self.import_sample_rate
+        updating    = index.IsUpdating()
+
+        # Before the first render the plot has no limits yet, the whole capture is shown then
+        low, high = view.time_plot.GetXAxisLimits()
+        if high <= low:
+            low, high = 0, index.samples / sample_rate
+        first  = int(np.floor(low * sample_rate))
+        last   = int(np.ceil(high * sample_rate)) + 1
+        pixels = max(view.time_plot.GetWidth(), 1)
+
+        key = (first, last, pixels, index.GetIndexed(), index.samples)
+        if key != self.capture_key:
+            self.capture_key = key
+
+            x_data, minimum, maximum, _ = index.Query(first, last, pixels)
+            x_data                      = np.repeat(x_data / sample_rate, 2)
+            y_data                      = np.column_stack((minimum, maximum)).ravel()
+            view.time_plot.BindLineSeriesData(x_data=x_data, y_data=y_data, key=("capture", key))
+            self.plot_controls_model.SetTimePlotData(x_data=x_data, y_data=y_data)
+
+        if updating:
+            view.import_indicator.Show()
+            view.cancel_import_button.Show()
+            view.import_label.BindValue(f"Indexing: {'{:.0f}'.format(100 * index.GetProgress())} % of {index.samples} samples")
+            return
+
+        view.import_indicator.Hide()
+        view.cancel_import_button.Hide()
+        view.import_label.BindValue(f"Capture: {index.samples} samples, {'{:.0f}'.format(100 * index.GetProgress())} % indexed")
+
+        # The spectrum and the measurements are taken over the start of the capture once
+        if not self.capture_analysed:
+            self.capture_analysed    = True
+            segment                  = np.asarray(index.capture[:self.import_analysis_samples], dtype=np.float64)
+            freq_x_data, freq_y_data = ComputeMagnitudeSpectrum(segment, sample_rate)
+            view.freq_plot.BindLineSeriesData(x_data=freq_x_data, y_data=freq_y_data, key=("capture", index.path))
+            view.freq_plot.FitXAxis().FitYAxis()
+            view.time_plot.AutoFitYAxis()
+            self.plot_controls_model.SetFreqPlotData(x_data=freq_x_data, y_data=freq_y_data)
+
+            measurements = MeasureSignal(segment, sample_rate)
+            if measurements:
+                measurements["thd"], measurements["snr"] = MeasureHarmonics(freq_y_data)
+            self.plot_controls_model.SetMeasurements(measurements)
+            self.UpdateMeasurementLabels(measurements)
+            self.inspector_dirty = True
+
+    def GetExportSignal(self) -> typing.Tuple[typing.Any, float]:
+        """
+        Get the signal to export with its sample rate: the open capture, the last completed import or the time plot
+        data with the sample rate it was plotted at. None when there is nothing to export, which includes an import
+        preview or a capture envelope in the time plot since those are not samples
+        """
+
+        if self.capture_index is not None:
+            return self.capture_index.capture, self.import_sample_rate
+        if self.import_recording is not None:
+            return self.import_recording
+
+        _, y_data   = self.plot_controls_model.GetTimePlotData()
+        sample_rate = self.plot_controls_model.GetTimePlotSampleRate()
+        if sample_rate is None or y_data is None or len(y_data) == 0:
+            return None, None
+
+        return np.asarray(y_data, dtype=np.float64), sample_rate
+
+    def GetGeneratorParameters(self) -> typing.Tuple[float, float, float, float]:
+        """
+        Get the amplitude, height, phase and frequency of the sliders for the audio rate generator, called from its thread
+        """
+        return (self.plot_controls_model.GetAmplitudeSliderValue(), self.plot_controls_model.GetHeightSliderValue(),
+                self.plot_controls_model.GetPhaseSliderValue(), self.plot_controls_model.GetFrequencySliderValue())
+
+    def UpdateExport(self) -> None:
+        """
+        Show the export progress and how it ended
+        """
+
+        view     = self.plot_controls_view
+        exporter = self.exporter
+        progress = exporter.GetProgress()
+        if exporter.IsRunning():
+            view.export_label.BindValue(f"Export: {'{:.0f}'.format(100 * progress['fraction'])} % of {progress['total_samples']} samples")
+            return
+
+        self.exporter = None
+        if exporter.error is not None:
+            view.export_label.BindValue(f"Export failed: {exporter.error}")
+        elif exporter.IsCancelled():
+            view.export_label.BindValue(f"Export cancelled at {'{:.0f}'.format(100 * progress['fraction'])} %")
+        else:
+            clipped = f", {progress['clipped']} clipped" if progress["clipped"] else ""
+            view.export_label.BindValue(f"Export: {progress['samples']} samples to {os.path.basename(exporter.path)} in {'{:.2f}'.format(progress['elapsed'])} s{clipped}")
+
+    def ResetExternal(self) -> None:
+        """
+        Drop the display buffer of the external sources and give the plots back to the generator
+        """
+        if self.external_active:
+            self.plot_controls_view.time_plot.SetXAxisLimits(0, self.plot_controls_view.length_of_plot)
+            self.signal_key = None
+
+        self.external_active      = False
+        self.external_sample_rate = None
+        self.external_x_data      = None
+        self.external_y_data      = None
+        self.external_statistics.Reset()
+
+    def ResetStream(self) -> None:
+        """
+        Reset the stream phase, display buffer and filter state
+        """
+        self.stream_active = False
+        self.stream_phase  = 0.0
+        self.stream_y_data = None
+        self.stream_statistics.Reset()
+        if self.tone_tracker is not None:
+            self.tone_tracker.Reset()
+        if self.filter is not None:
+            self.filter.Reset()
+
+    def UpdateStageStats(self, synthesized: bool = False) -> None:
+        """
+        Show which nodes ran in the last evaluation of the analysis graph, and of the signal graph when it
+        synthesized the analysed buffer, and what they cost
+        """
+        graphs = [self.signal_graph, self.analysis_graph] if synthesized else [self.analysis_graph]
+        stages = [f"{entry['name']} {'{:.2f}'.format(entry['ms'])} ms" for graph in graphs for entry in graph.GetTimingReport() if entry["ran"]]
+        self.plot_controls_view.stage_stats_label.BindValue(f"Stages: {', '.join(stages) if stages else 'cached'}")
+
+    def UpdateMeasurementLabels(self, measurements: dict) -> None:
+        """
+        Show the measurements in the view, missing values are shown as a dash
+        """
+
+        def Format(key: str, unit: str = "") -> str:
+            value = measurements.get(key)
+            return "-" if value is None else f"{'{:.3f}'.format(value)}{unit}"
+
+        self.plot_controls_view.rms_label.BindValue(f"RMS: {Format('rms')}")
+        self.plot_controls_view.mean_label.BindValue(f"Mean: {Format('mean')}")
+        self.plot_controls_view.peak_to_peak_label.BindValue(f"Peak-to-Peak: {Format('peak_to_peak')}")
+        self.plot_controls_view.zero_cross_label.BindValue(f"Zero Cross Freq: {Format('zero_cross', ' Hz')}")
+        self.plot_controls_view.thd_label.BindValue(f"THD: {Format('thd', ' dB')}")
+        self.plot_controls_view.snr_label.BindValue(f"SNR: {Format('snr', ' dB')}")
+
+    def UpdateSpectralPeaks(self, peaks: np.ndarray) -> None:
+        """
+        Store the spectral peaks in the model and mark them on the frequency plot and in the peak table
+        """
+
+        self.plot_controls_model.SetSpectralPeaks(peaks)
+
+        # Mark and annotate every peak on the plot
+        freq_plot = self.plot_controls_view.freq_plot
+        freq_plot.PlotMarkerSeriesData(x_data=peaks["frequency"].tolist(), y_data=peaks["magnitude"].tolist())
+        freq_plot.ClearAnnotations()
+        for peak in peaks:
+            freq_plot.AddAnnotation(label=f"{'{:.2f}'.format(peak['frequency'])} Hz", x=peak["frequency"], y=peak["magnitude"])
+
+        # Fill the table, rows without a peak are shown as a dash
+        for row, cells in enumerate(self.plot_controls_view.peak_table_cells):
+            if row < len(peaks):
+                cells[1].BindValue(f"{'{:.3f}'.format(peaks[row]['frequency'])} Hz")
+                cells[2].BindValue(f"{'{:.3f}'.format(peaks[row]['magnitude'])}")
+            else:
+                cells[1].BindValue("-")
+                cells[2].BindValue("-")
+
+    def UpdateSampleInspector(self) -> None:
+        """
+        Bind the inspector tables to the model arrays when they changed and refill the rows in view,
+        nothing is copied so this stays cheap for very large buffers
+        """
+
+        if not self.plot_controls_model.IsSampleInspectorChecked():
+            return
+
+        if self.inspector_dirty:
+            time_x_data, time_y_data = self.plot_controls_model.GetTimePlotData()
+            freq_x_data, freq_y_data = self.plot_controls_model.GetFreqPlotData()
+            self.plot_controls_view.time_table.SetData({"X": np.asarray(time_x_data if time_x_data is not None else []), "Y": np.asarray(time_y_data if time_y_data is not None else [])})
+            self.plot_controls_view.freq_table.SetData({"Frequency": np.asarray(freq_x_data if freq_x_data is not None else []), "Magnitude": np.asarray(freq_y_data if freq_y_data is not None else [])})
+            self.inspector_dirty = False
+
+        self.plot_controls_view.time_table.Update()
+        self.plot_controls_view.freq_table.Update()
+
+    def JumpToValue(self, table: typing.Any, sorted_data: typing.Any, text: str) -> None:
+        """
+        Scroll a table to the sample closest to the typed value with a binary search on the sorted data
+        """
+
+        try:
+            value = float(text)
+        except ValueError:
+            return
+
+        row = FindNearestIndex(sorted_data, value)
+        if row >= 0:
+            table.ScrollToDataRow(row)
+
+    def UpdateHoverReadout(self) -> None:
+        """
+        Show the sample nearest to the mouse on the hovered plot, the lookup is a binary search on the
+        x data already held by the model so it costs microseconds even for very large buffers
+        """
+
+        view = self.plot_controls_view
+        if view.time_plot.IsHovered():
+            plot           = view.time_plot
+            x_data, y_data = self.plot_controls_model.GetTimePlotData()
+        elif view.freq_plot.IsHovered():
+            plot = view.freq_plot
+
+            # The zoomed plot shows its own bins rather than the full spectrum
+            if self.plot_controls_model.IsZoomSpectrumChecked() and self.zoom_data is not None:
+                x_data, y_data = self.zoom_data
+            else:
+                x_data, y_data = self.plot_controls_model.GetFreqPlotData()
+        else:
+            plot           = None
+            x_data, y_data = None, None
+
+        index = FindNearestIndex(x_data, plot.GetMousePosition()[0]) if plot is not None else -1
+
+        # Leaving a plot or clearing its data hides the annotation once
+        if self.hover_plot is not None and (plot is not self.hover_plot or index < 0):
+            self.hover_plot.HideHoverAnnotation()
+            view.hover_label.BindValue("Cursor: -")
+            self.hover_readout = None
+        self.hover_plot = plot if index >= 0 else None
+
+        if index < 0:
+            return
+
+        x, y    = float(x_data[index]), float(y_data[index])
+        readout = (index, x, y)
+        if readout == self.hover_readout:
+            return
+
+        self.hover_readout = readout
+        text               = f"[{index}] x: {'{:.6f}'.format(x)}, y: {'{:.6f}'.format(y)}"
+        plot.ShowHoverAnnotation(label=text, x=x, y=y)
+        view.hover_label.BindValue(f"Cursor: {text}")
+
+    def UpdateZoomSpectrum(self, y_data: np.ndarray, sample_rate: float, data_changed: bool) -> None:
+        """
+        Evaluate the spectrum over the visible band of the frequency plot with the chirp-Z transform,
+        it is only recomputed when the data or the x axis limits changed
+        """
+
+        start, stop = self.plot_controls_view.freq_plot.GetXAxisLimits()
+        band        = (max(start, 0.0), min(stop, sample_rate / 2))
+        if band[1] <= band[0]:
+
+            # Nothing sensible is visible yet (e.g. before the first frame), show the whole band
+            band = (0.0, sample_rate / 2)
+        if not data_changed and band == self.zoom_band:
+            return
+
+        self.zoom_band           = band
+        freq_x_data, freq_y_data = ComputeZoomSpectrum(y_data, sample_rate, band[0], band[1], self.plot_controls_view.zoom_bins)
+        self.zoom_data           = (freq_x_data, freq_y_data)
+        self.plot_controls_view.freq_plot.PlotLineSeriesData(x_data=freq_x_data, y_data=freq_y_data)
+
+    def UpdateToneTracker(self, y_data: np.ndarray, sample_rate: float, frequency: float, samples: int, reset: bool) -> None:
+        """
+        Feed the goertzel tracker and show its magnitudes whenever a block of samples was completed
+        """
+
+        # Track the fundamental and the harmonics that are still below nyquist
+        frequencies = frequency * np.arange(1, self.plot_controls_view.tracked_harmonics + 1)
+        frequencies = frequencies[frequencies < sample_rate / 2]
+        key         = (tuple(frequencies), sample_rate, samples)
+        if key != self.tone_tracker_key:
+            self.tone_tracker     = GoertzelTracker(frequencies, sample_rate, block_size=samples)
+            self.tone_tracker_key = key
+        elif reset:
+            self.tone_tracker.Reset()
+
+        if self.tone_tracker.Process(y_data):
+            self.UpdateToneTrackerLabels(self.tone_tracker.frequencies, self.tone_tracker.GetMagnitudes())
+
+    def UpdateToneTrackerLabels(self, frequencies: np.ndarray, magnitudes: np.ndarray) -> None:
+        """
+        Show the tracked magnitudes, harmonics above nyquist are shown as a dash
+        """
+        for harmonic, label in enumerate(self.plot_controls_view.tone_tracker_labels):
+            if harmonic < len(magnitudes):
+                label.BindValue(f"H{harmonic + 1} {'{:.3f}'.format(frequencies[harmonic])} Hz: {'{:.3f}'.format(magnitudes[harmonic])}")
+            else:
+                label.BindValue(f"H{harmonic + 1}: -")
+
+    def IsFilterEnabled(self) -> bool:
+        """
+        Is a filter stage selected
+        """
+        return self.plot_controls_model.GetFilterTypeValue() not in (None, "None")
+
+    def ApplyFilterStage(self, y_data: np.ndarray, sample_rate: float, reset: bool) -> np.ndarray:
+        """
+        Run the data through the selected biquad filter, reset clears the state first
+        so a full regeneration does not inherit the tail of the previous one
+        """
+
+        if not self.IsFilterEnabled():
+            return y_data
+
+        filter_type = self.plot_controls_model.GetFilterTypeValue()
+
+        # Keep the cutoff below nyquist so the design stays stable
+        cutoff = min(self.plot_controls_model.GetFilterCutoffSliderValue(), 0.45 * sample_rate)
+        key    = (filter_type, cutoff, sample_rate, self.filter_order)
+        if key != self.filter_key:
+            self.filter     = BiquadFilter(DesignButterworth(filter_type, cutoff, sample_rate, self.filter_order))
+            self.filter_key = key
+        elif reset:
+            self.filter.Reset()
+
+        return self.filter.Process(y_data)
+
     def GenWaveformButtonCallback(self) -> None:
         """
-        Set the generate waveform button event in the model class
+        Set the generate waveform button event in the model class, the generator takes the plots back from an import
         """
+        self.CancelImportCallback()
+        self.CloseCapture()
+        self.import_recording = None
         if not self.plot_controls_model.IsGenWaveformButtonPressed():
             self.plot_controls_model.SetGenWaveformButtonPress()
 
+    def ImportButtonCallback(self) -> None:
+        """
+        Open the file dialog to pick the signal file to import
+        """
+        self.plot_controls_view.import_dialog.Show()
+
+    def ImportFileCallback(self, sender: typing.Any, app_data: dict) -> None:
+        """
+        Start importing the chosen file in the background, the import takes the plots over from the generator.
+        CSV files are loaded by the importer, raw binary and .npy captures are opened through their summary index
+        """
+
+        view = self.plot_controls_view
+        self.CancelImportCallback()
+        self.plot_controls_model.ClearGenWaveformButtonPress()
+        self.ResetStream()
+        self.signal_key       = None
+        self.import_recording = None
+
+        # Captures that can be memory mapped are browsed through their summary index
+        if DetectFormat(app_data["file_path_name"]) != "csv":
+            self.OpenCapture(app_data["file_path_name"])
+            return
+
+        self.CloseCapture()
+        try:
+            self.importer = SignalImporter(app_data["file_path_name"], sample_rate=self.import_sample_rate, on_progress=view.governor.Wake).Start()
+        except (OSError, ValueError) as error:
+            view.import_label.BindValue(f"Import failed: {error}")
+            return
+
+        self.import_version = None
+        view.import_indicator.Show()
+        view.cancel_import_button.Show()
+
+    def CancelImportCallback(self) -> None:
+        """
+        Cancel the running import, the next frame reports it. Indexing a capture stops and resumes the next time it is opened
+        """
+        if self.importer is not None:
+            self.importer.Cancel()
+        if self.capture_index is not None:
+            self.capture_index.StopUpdate()
+
+    def ExportMenuCallback(self, sender: typing.Any, app_data: typing.Any, user_data: tuple) -> None:
+        """
+        Remember the format of the chosen export menu item and open the file dialog
+        """
+        self.export_options = user_data
+        self.plot_controls_view.export_dialog.Show()
+
+    def ExportFileCallback(self, sender: typing.Any, app_data: dict) -> None:
+        """
+        Start exporting to the chosen file in the background, the extension of the format is added when missing
+        """
+
+        view                  = self.plot_controls_view
+        format, sample_format = self.export_options
+        path                  = app_data["file_path_name"]
+        if os.path.splitext(path)[1].lower() != f".{format}":
+            path += f".{format}"
+
+        # A cancelled export may still be removing its file, the next one waits until it is reported
+        if self.exporter is not None:
+            view.export_label.BindValue("Export: another export is still running")
+            return
+
+        signal, sample_rate = self.GetExportSignal()
+        if signal is None:
+            view.export_label.BindValue("Export: no sampled signal to export")
+            return
+
+        try:
+            self.exporter = SignalExporter(path, signal, sample_rate, format=format, sample_format=sample_format or "pcm16",
+                                           on_progress=view.governor.Wake).Start()
+        except (OSError, ValueError) as error:
+            view.export_label.BindValue(f"Export failed: {error}")
+
+    def CancelExportCallback(self) -> None:
+        """
+        Cancel the running export, the exporter removes the partial file and the next frame reports it
+        """
+        if self.exporter is not None:
+            self.exporter.Cancel()
+
     def ClearPlotButtonCallback(self) -> None:
         """
         Set the generate waveform button event in the model class
@@ -98,9 +1057,11 @@ class PlotControlsController():
 
     def ResolutionSliderCallback(self) -> None:
         """
-        Get the resolution slider value from the view class and store it in the model class
+        Get the resolution slider value from the view class and store it in the model class, dragging
+        it switches the synthesis to the coarse preview
         """
         self.plot_controls_model.SetResolutionSliderValue(self.plot_controls_view.resolution_slider.GetValue())
+        self.drag_time = time.perf_counter()
 
     def AmplitudeSliderCallback(self) -> None:
         """
@@ -122,15 +1083,11 @@ class PlotControlsController():
 
     def FrequencySliderCallback(self) -> None:
         """
-        Get the frequency slider value from the view class and store it in the model class
-        """
-        self.plot_controls_model.SetFrequencySliderValue(self.plot_controls_view.frequency_slider.GetValue())
-
-    def FrequencySliderCallback(self) -> None:
-        """
-        Get the frequency slider value from the view class and store it in the model class
+        Get the frequency slider value from the view class and store it in the model class, dragging
+        it switches the synthesis to the coarse preview
         """
         self.plot_controls_model.SetFrequencySliderValue(self.plot_controls_view.frequency_slider.GetValue())
+        self.drag_time = time.perf_counter()
 
     def NormalizeFreqCheckboxCallback(self) -> None:
         """
@@ -139,4 +1096,77 @@ class PlotControlsController():
         if not self.plot_controls_model.IsNormalizeFreqChecked():
             self.plot_controls_model.SetNormalizeFreqCheck()
         else:
-            self.plot_controls_model.ClearNormalizeFreqCheck()
\ No newline at end of file
+            self.plot_controls_model.ClearNormalizeFreqCheck()
+
+    def StreamWaveformCheckboxCallback(self) -> None:
+        """
+        Set the stream waveform checkbox event in the model class
+        """
+        if not self.plot_controls_model.IsStreamWaveformChecked():
+            self.plot_controls_model.SetStreamWaveformCheck()
+        else:
+            self.plot_controls_model.ClearStreamWaveformCheck()
+
+        # The one-shot buffer has to be measured and drawn again after streaming
+        self.signal_key = None
+
+    def FilterComboCallback(self) -> None:
+        """
+        Get the selected filter type from the view class and store it in the model class
+        """
+        self.plot_controls_model.SetFilterTypeValue(self.plot_controls_view.filter_combo.GetSelectedItem())
+
+    def CutoffSliderCallback(self) -> None:
+        """
+        Get the filter cutoff slider value from the view class and store it in the model class
+        """
+        self.plot_controls_model.SetFilterCutoffSliderValue(self.plot_controls_view.cutoff_slider.GetValue())
+
+    def ZoomSpectrumCheckboxCallback(self) -> None:
+        """
+        Set the zoom spectrum checkbox event in the model class, the measured key is dropped so the
+        next frame redraws the spectrum in the newly selected mode
+        """
+        if not self.plot_controls_model.IsZoomSpectrumChecked():
+            self.plot_controls_model.SetZoomSpectrumCheck()
+        else:
+            self.plot_controls_model.ClearZoomSpectrumCheck()
+
+        self.zoom_band  = None
+        self.zoom_data  = None
+        self.signal_key = None
+
+    def SampleInspectorCheckboxCallback(self) -> None:
+        """
+        Set the sample inspector checkbox event in the model class and show or hide the inspector window
+        """
+        if not self.plot_controls_model.IsSampleInspectorChecked():
+            self.plot_controls_model.SetSampleInspectorCheck()
+            self.plot_controls_view.inspector_window.Show()
+            self.inspector_dirty = True
+        else:
+            self.plot_controls_model.ClearSampleInspectorCheck()
+            self.plot_controls_view.inspector_window.Hide()
+
+    def RobustFitCheckboxCallback(self) -> None:
+        """
+        Set the robust fit checkbox event in the model class
+        """
+        if not self.plot_controls_model.IsRobustFitChecked():
+            self.plot_controls_model.SetRobustFitCheck()
+        else:
+            self.plot_controls_model.ClearRobustFitCheck()
+
+    def TimeJumpCallback(self) -> None:
+        """
+        Jump the time table of the sample inspector to the typed x value
+        """
+        self.UpdateSampleInspector()
+        self.JumpToValue(self.plot_controls_view.time_table, self.plot_controls_view.time_table.data.get("X"), self.plot_controls_view.time_jump_input.GetText())
+
+    def FreqJumpCallback(self) -> None:
+        """
+        Jump the spectrum table of the sample inspector to the typed frequency
+        """
+        self.UpdateSampleInspector()
+        self.JumpToValue(self.plot_controls_view.freq_table, self.plot_controls_view.freq_table.data.get("Frequency"), self.plot_controls_view.freq_jump_input.GetText())
\ No newline at end of file
@@ -0,0 +1,124 @@
+import numpy as np
+
+# SciPy is optional, when it is installed the sections are run through its compiled
+# sosfilt routine, otherwise we fall back to the NumPy recurrence below
+try:
+    from scipy import signal as scipy_signal
+except ImportError:
+    scipy_signal = None
+
+FILTER_TYPES = ("None", "Low Pass", "High Pass", "Band Pass", "Notch")
+
+def DesignBiquad(filter_type: str, cutoff: float, sample_rate: float, q: float = 0.7071067811865476) -> np.ndarray:
+    """
+    Design a single second-order section using the RBJ audio EQ cookbook formulas,
+    the returned row is normalized so that a0 is 1 and laid out as [b0, b1, b2, a0, a1, a2]
+    """
+
+    w0    = 2 * np.pi * cutoff / sample_rate
+    cos0  = np.cos(w0)
+    alpha = np.sin(w0) / (2 * q)
+
+    if filter_type == "Low Pass":
+        b = [(1 - cos0) / 2, 1 - cos0, (1 - cos0) / 2]
+    elif filter_type == "High Pass":
+        b = [(1 + cos0) / 2, -(1 + cos0), (1 + cos0) / 2]
+    elif filter_type == "Band Pass":
+        b = [alpha, 0.0, -alpha]
+    elif filter_type == "Notch":
+        b = [1.0, -2 * cos0, 1.0]
+    else:
+        raise ValueError(f"Unknown filter type: {filter_type}")
+
+    a = [1 + alpha, -2 * cos0, 1 - alpha]
+
+    return np.array(b + a, dtype=np.float64) / a[0]
+
+def DesignButterworth(filter_type: str, cutoff: float, sample_rate: float, order: int = 4) -> np.ndarray:
+    """
+    Design a cascade of biquads with butterworth Q values, order must be even since
+    every section contributes two poles
+    """
+
+    if order < 2 or order % 2 != 0:
+        raise ValueError(f"Butterworth order must be an even number >= 2, got {order}")
+
+    # Each conjugate pole pair of an order N butterworth filter maps to one section
+    sections = order // 2
+    q_values = 1 / (2 * np.sin((2 * np.arange(sections) + 1) * np.pi / (2 * order)))
+
+    return np.vstack([DesignBiquad(filter_type, cutoff, sample_rate, q) for q in q_values])
+
+class BiquadFilter():
+
+    """
+    Cascade of second-order sections (direct form II transposed) whose state survives
+    between calls to Process, so a signal fed in chunks matches the signal fed in one go
+    """
+
+    def __init__(self, sos: np.ndarray, channels: int = 1) -> None:
+        self.__sos      = np.atleast_2d(np.asarray(sos, dtype=np.float64))
+        self.__channels = channels
+        self.__state    = None
+
+        if self.__sos.shape[1] != 6:
+            raise ValueError(f"Second-order sections must have 6 coefficients, got {self.__sos.shape[1]}")
+
+        self.Reset()
+
+    def GetSections(self) -> np.ndarray:
+        """
+        Get the second-order section coefficients
+        """
+        return self.__sos
+
+    def GetState(self) -> np.ndarray:
+        """
+        Get the filter state, shaped (sections, 2, channels)
+        """
+        return self.__state
+
+    def Reset(self) -> None:
+        """
+        Zero the filter state
+        """
+        self.__state = np.zeros((self.__sos.shape[0], 2, self.__channels), dtype=np.float64)
+
+    def Process(self, chunk: np.ndarray) -> np.ndarray:
+        """
+        Filter a chunk shaped (samples,) or (samples, channels) and keep the state for the next chunk
+        """
+
+        data  = np.asarray(chunk, dtype=np.float64)
+        is_1d = data.ndim == 1
+        if is_1d:
+            data = data[:, np.newaxis]
+
+        if data.shape[1] != self.__channels:
+            raise ValueError(f"Expected {self.__channels} channels, got {data.shape[1]}")
+
+        if scipy_signal is not None:
+            output, self.__state = scipy_signal.sosfilt(self.__sos, data, axis=0, zi=self.__state)
+        else:
+            output = self.__ProcessNumpy(data)
+
+        return output[:, 0] if is_1d else output
+
+    def __ProcessNumpy(self, data: np.ndarray) -> np.ndarray:
+        """
+        Run the direct form II transposed recurrence, one sample at a time but vectorized across channels
+        """
+
+        output = data.copy()
+        for section, (b0, b1, b2, _, a1, a2) in enumerate(self.__sos):
+            z1, z2 = self.__state[section]
+            for n in range(output.shape[0]):
+                x         = output[n]
+                y         = b0 * x + z1
+                z1        = b1 * x - a1 * y + z2
+                z2        = b2 * x - a2 * y
+                output[n] = y
+            self.__state[section, 0] = z1
+            self.__state[section, 1] = z2
+
+        return output
@@ -0,0 +1,100 @@
+import numpy as np
+
+def GoertzelMagnitudes(y_data: np.ndarray, sample_rate: float, frequencies: np.ndarray) -> np.ndarray:
+    """
+    Evaluate the amplitude of a handful of frequencies over a whole buffer in O(N * k)
+    """
+
+    tracker = GoertzelTracker(frequencies, sample_rate, block_size=len(y_data))
+    tracker.Process(y_data)
+
+    return tracker.GetMagnitudes()
+
+class GoertzelTracker():
+
+    """
+    Tracks the amplitude of a set of frequencies over consecutive blocks of block_size samples. The goertzel
+    recurrence s[n] = x[n] + 2cos(w) s[n - 1] - s[n - 2] ends a block on |X| with X = sum x[n] e^(-jwn), but its two
+    term state becomes ill conditioned close to DC and nyquist, so the same state is carried as X itself: one
+    complex value per bin, kept between chunks so blocks may span any number of calls to Process. Samples are
+    taken sub_block at a time, one matrix product with a fixed (sub_block, 2 * bins) kernel sums every sub block
+    for all bins at once and a phase per sub block moves the sums to where the sub blocks start in the block
+    """
+
+    def __init__(self, frequencies: np.ndarray, sample_rate: float, block_size: int, sub_block: int = 256) -> None:
+        self.frequencies  = np.atleast_1d(np.asarray(frequencies, dtype=np.float64))
+        self.sample_rate  = sample_rate
+        self.block_size   = max(int(block_size), 1)
+        self.sub_block    = max(int(sub_block), 1)
+        self.__cycles     = self.frequencies / sample_rate
+        self.__magnitudes = np.zeros(len(self.frequencies))
+
+        # The real and imaginary parts of e^(-jwn) over one sub block, side by side
+        angles        = 2 * np.pi * np.outer(np.arange(self.sub_block), self.__cycles)
+        self.__kernel = np.hstack((np.cos(angles), -np.sin(angles)))
+
+        self.Reset()
+
+    def Reset(self) -> None:
+        """
+        Clear the running sums and start a new block
+        """
+        self.__sums  = np.zeros(len(self.frequencies), dtype=np.complex128)
+        self.__count = 0
+
+    def GetMagnitudes(self) -> np.ndarray:
+        """
+        Get the amplitudes measured over the last completed block
+        """
+        return self.__magnitudes
+
+    def Process(self, chunk: np.ndarray) -> bool:
+        """
+        Feed new samples to the tracker, returns true when at least one block was completed
+        """
+
+        chunk     = np.asarray(chunk, dtype=np.float64)
+        completed = False
+        start     = 0
+        while start < len(chunk):
+
+            # Never step over a block boundary
+            length = min(len(chunk) - start, self.block_size - self.__count)
+            self.__Advance(chunk[start:start + length])
+            start += length
+
+            if self.__count == self.block_size:
+                self.__FinishBlock()
+                completed = True
+
+        return completed
+
+    def __Advance(self, segment: np.ndarray) -> None:
+        """
+        Add a segment to the running sums of every bin
+        """
+
+        length = len(segment)
+        if length == 0:
+            return
+
+        # Zeros after the segment add nothing, so it is padded to whole sub blocks
+        bins            = len(self.frequencies)
+        blocks          = -(-length // self.sub_block)
+        padded          = np.zeros(blocks * self.sub_block)
+        padded[:length] = segment
+
+        # Sum every sub block for all bins in one product, then turn each sum to the phase its sub block starts at
+        sums   = padded.reshape(blocks, self.sub_block) @ self.__kernel
+        starts = self.__count + np.arange(blocks) * self.sub_block
+        phases = np.exp(-2j * np.pi * np.outer(starts, self.__cycles))
+
+        self.__sums  += np.sum((sums[:, :bins] + 1j * sums[:, bins:]) * phases, axis=0)
+        self.__count += length
+
+    def __FinishBlock(self) -> None:
+        """
+        Convert the running sums into amplitudes and start the next block
+        """
+        self.__magnitudes = 2 * np.abs(self.__sums) / self.block_size
+        self.Reset()
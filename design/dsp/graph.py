@@ -0,0 +1,345 @@
+from design.dsp.biquad_filter import BiquadFilter, DesignButterworth
+from design.dsp.measurements import MeasureHarmonics, MeasureSignal
+from design.dsp.peaks import FindSpectralPeaks
+from design.dsp.spectrum import ComputeMagnitudeSpectrum
+from typing import List
+import numpy as np
+import inspect
+import typing
+import time
+
+# Node types by name. A type is a function called with the inputs of the node as keyword arguments, or a
+# class which is instantiated once per node and then called the same way, for nodes that keep state
+NODE_TYPES = {}
+
+def RegisterNodeType(name: str, function: typing.Any = None) -> typing.Any:
+    """
+    Register a node type under a name, usable as a decorator with the name only
+    """
+
+    if function is None:
+        return lambda function: RegisterNodeType(name, function)
+    if name in NODE_TYPES:
+        raise ValueError(f"Node type {name} is already registered")
+
+    NODE_TYPES[name] = function
+
+    return function
+
+class Ref():
+
+    """
+    Reference to the output of an earlier node as "node" or "node.field", where field picks an entry of a
+    dict output. Node inputs are constants unless they are wrapped in a Ref, so strings can be passed as is
+    """
+
+    def __init__(self, reference: str) -> None:
+        source, _, field = reference.partition(".")
+        self.source      = source
+        self.field       = field or None
+
+    def __repr__(self) -> str:
+        return f"Ref({self.source}.{self.field})" if self.field else f"Ref({self.source})"
+
+class GraphNode():
+
+    """
+    A parameter or a processing node of a ProcessingGraph. Inputs are (source, field) references to earlier
+    nodes, where field picks an entry of a dict output, or constants. The output is cached with the versions
+    of the sources it was computed from, and the node version moves on whenever the output was replaced
+    """
+
+    def __init__(self, name: str, type: str = None, function: typing.Any = None, inputs: dict = None, constants: dict = None) -> None:
+        self.name      = name
+        self.type      = type
+        self.function  = function
+        self.inputs    = inputs or {}
+        self.constants = constants or {}
+        self.output    = None
+        self.version   = 0
+        self.key       = None
+
+        # Timing, ran tells whether the last evaluation ran the node or used the cache
+        self.ran        = False
+        self.runs       = 0
+        self.hits       = 0
+        self.last_time  = 0.0
+        self.total_time = 0.0
+
+    def IsParameter(self) -> bool:
+        """
+        Is the node a parameter set from outside
+        """
+        return self.function is None
+
+class ProcessingGraph():
+
+    """
+    Small dataflow graph of parameters and processing nodes. Nodes are added after the nodes they read so the
+    graph is acyclic by construction and the order they were added in is a topological order. Evaluate only
+    runs the nodes whose sources changed version since they last ran, everything else is served from the
+    cache, and every evaluation records the time each node took for GetTimingReport
+    """
+
+    def __init__(self) -> None:
+        self.nodes      = {}
+        self.evaluation = 0
+
+    def AddParameter(self, name: str, value: typing.Any = None) -> "ProcessingGraph":
+        """
+        Add a parameter node holding a value
+        """
+
+        self.__CheckName(name)
+        node             = GraphNode(name)
+        node.output      = value
+        node.version     = 1
+        self.nodes[name] = node
+
+        return self
+
+    def SetParameter(self, name: str, value: typing.Any) -> bool:
+        """
+        Set a parameter, the nodes reading it run again on the next evaluation. Arrays are compared by identity
+        and anything else by value, returns whether the parameter changed
+        """
+
+        node = self.nodes[name]
+        if not node.IsParameter():
+            raise ValueError(f"{name} is a processing node, not a parameter")
+
+        if isinstance(value, np.ndarray) or isinstance(node.output, np.ndarray):
+            changed = value is not node.output
+        else:
+            changed = type(value) is not type(node.output) or value != node.output
+        if changed:
+            node.output   = value
+            node.version += 1
+
+        return changed
+
+    def Touch(self, name: str) -> None:
+        """
+        Mark a parameter as changed without setting it, for arrays that were updated in place
+        """
+        self.nodes[name].version += 1
+
+    def AddNode(self, name: str, type: str, **inputs: typing.Any) -> "ProcessingGraph":
+        """
+        Add a node of a registered type. Ref inputs read an earlier node, any other value (strings included)
+        is passed to the node as a constant
+        """
+
+        self.__CheckName(name)
+        if type not in NODE_TYPES:
+            raise ValueError(f"Unknown node type: {type}")
+
+        references, constants = {}, {}
+        for argument, value in inputs.items():
+            if isinstance(value, Ref):
+                if value.source not in self.nodes:
+                    raise ValueError(f"Node {name} reads {value.source}, which has to be added first")
+                references[argument] = (value.source, value.field)
+            else:
+                constants[argument] = value
+
+        function         = NODE_TYPES[type]
+        function         = function() if inspect.isclass(function) else function
+        self.nodes[name] = GraphNode(name, type=type, function=function, inputs=references, constants=constants)
+
+        return self
+
+    def Evaluate(self, *names: str) -> dict:
+        """
+        Bring the named nodes up to date, or every node nothing reads from when no names are given, and
+        return their outputs by name
+        """
+
+        if not names:
+            read  = {source for node in self.nodes.values() for source, _ in node.inputs.values()}
+            names = [name for name in self.nodes if name not in read]
+
+        # Only the nodes the requested ones depend on take part, in the order they were added
+        needed = set()
+        stack  = list(names)
+        while stack:
+            name = stack.pop()
+            if name not in needed:
+                needed.add(name)
+                stack.extend(source for source, _ in self.nodes[name].inputs.values())
+
+        self.evaluation += 1
+        for node in self.nodes.values():
+            node.ran = False
+            if node.name not in needed or node.IsParameter():
+                continue
+
+            key = tuple(self.nodes[source].version for source, _ in node.inputs.values())
+            if key == node.key:
+                node.hits += 1
+                continue
+
+            arguments = {argument: self.Get(f"{source}.{field}" if field else source) for argument, (source, field) in node.inputs.items()}
+            began     = time.perf_counter()
+            output    = node.function(**arguments, **node.constants)
+            elapsed   = time.perf_counter() - began
+
+            node.output      = output
+            node.key         = key
+            node.version    += 1
+            node.ran         = True
+            node.runs       += 1
+            node.last_time   = elapsed
+            node.total_time += elapsed
+
+        return {name: self.nodes[name].output for name in names}
+
+    def Get(self, reference: str) -> typing.Any:
+        """
+        Get the cached output of a node as "node" or "node.field", without evaluating anything
+        """
+
+        name, _, field = reference.partition(".")
+        output         = self.nodes[name].output
+
+        return output[field] if field else output
+
+    def GetTimingReport(self) -> List[dict]:
+        """
+        Get the timing of every processing node, slowest in the last evaluation first. share is the part of
+        the last evaluation the node took
+        """
+
+        nodes = [node for node in self.nodes.values() if not node.IsParameter()]
+        total = sum(node.last_time for node in nodes if node.ran)
+
+        report = [{
+            "name":     node.name,
+            "type":     node.type,
+            "ran":      node.ran,
+            "ms":       node.last_time * 1e3 if node.ran else 0.0,
+            "share":    node.last_time / total if node.ran and total > 0 else 0.0,
+            "runs":     node.runs,
+            "hits":     node.hits,
+            "total_ms": node.total_time * 1e3,
+        } for node in nodes]
+
+        return sorted(report, key=lambda entry: (-entry["ms"], -entry["total_ms"]))
+
+    def FormatTimingReport(self) -> str:
+        """
+        Format the timing report as a table
+        """
+
+        lines = [f"{'node':<14}{'type':<12}{'ran':>5}{'ms':>10}{'share':>8}{'runs':>7}{'hits':>7}{'total ms':>11}"]
+        for entry in self.GetTimingReport():
+            lines.append(f"{entry['name']:<14}{entry['type']:<12}{'yes' if entry['ran'] else '-':>5}{'{:.3f}'.format(entry['ms']):>10}"
+                         f"{'{:.0f}'.format(100 * entry['share']) + ' %':>8}{entry['runs']:>7}{entry['hits']:>7}{'{:.2f}'.format(entry['total_ms']):>11}")
+
+        return "\n".join(lines)
+
+    def __CheckName(self, name: str) -> None:
+        """
+        Node names have to be unique and free of dots, which select the fields of an output
+        """
+        if name in self.nodes or "." in name:
+            raise ValueError(f"Invalid or duplicate node name: {name}")
+
+@RegisterNodeType("sine")
+def SineNode(samples: int, amplitude: float, height: float, phase: float, frequency: float, length: float = 1.0) -> dict:
+    """
+    Source, samples points of a sine over length seconds as the generator draws it
+    """
+
+    x_data = np.linspace(0, length, samples, endpoint=True)
+
+    return {
+        "x":           x_data,
+        "y":           amplitude * np.sin(2 * np.pi * frequency * x_data + phase) + height,
+        "sample_rate": max(samples - 1, 1) / length,
+    }
+
+@RegisterNodeType("biquad")
+def BiquadNode(signal: np.ndarray, sample_rate: float, filter_type: str, cutoff: float, order: int = 4) -> np.ndarray:
+    """
+    Filter, a butterworth cascade over the whole buffer from a clean state, "None" passes the signal on. The
+    cutoff is kept below nyquist as the controller's filter stage does, so the design stays stable
+    """
+
+    if filter_type in (None, "None"):
+        return signal
+
+    return BiquadFilter(DesignButterworth(filter_type, min(cutoff, 0.45 * sample_rate), sample_rate, order=order)).Process(signal)
+
+@RegisterNodeType("window")
+def WindowNode(signal: np.ndarray, kind: str = "hann") -> np.ndarray:
+    """
+    Window, tapers the signal with a hann, hamming or blackman window
+    """
+
+    windows = {"hann": np.hanning, "hamming": np.hamming, "blackman": np.blackman}
+    if kind not in windows:
+        raise ValueError(f"Unknown window: {kind}")
+
+    return np.asarray(signal, dtype=np.float64) * windows[kind](len(signal))
+
+@RegisterNodeType("spectrum")
+def SpectrumNode(signal: np.ndarray, sample_rate: float, window: bool = True) -> dict:
+    """
+    FFT, the single sided amplitude spectrum, window is false when a window node tapered the signal already
+    """
+    freqs, magnitude = ComputeMagnitudeSpectrum(signal, sample_rate, window=window)
+
+    return {"freqs": freqs, "magnitude": magnitude}
+
+@RegisterNodeType("measure")
+def MeasureNode(signal: np.ndarray, sample_rate: float) -> dict:
+    """
+    Measurement, the time domain measurements of the buffer
+    """
+    return MeasureSignal(signal, sample_rate)
+
+@RegisterNodeType("harmonics")
+def HarmonicsNode(magnitude: np.ndarray) -> dict:
+    """
+    Measurement, the THD and SNR of a spectrum
+    """
+    thd, snr = MeasureHarmonics(magnitude)
+
+    return {"thd": thd, "snr": snr}
+
+@RegisterNodeType("peaks")
+def PeaksNode(freqs: np.ndarray, magnitude: np.ndarray, max_peaks: int = 5) -> np.ndarray:
+    """
+    Measurement, the strongest tones of a spectrum
+    """
+    return FindSpectralPeaks(freqs, magnitude, max_peaks=max_peaks)
+
+@RegisterNodeType("sink")
+def SinkNode(callback: typing.Any, **values: typing.Any) -> None:
+    """
+    Sink, hands its inputs to a callback whenever one of them changed
+    """
+    callback(**values)
+
+def BuildSignalGraph(length: float = 1.0, order: int = 4) -> ProcessingGraph:
+    """
+    The generator chain as a graph: slider parameters, the sine, the filter stage, the spectrum and the
+    measurements taken from both
+    """
+
+    graph = ProcessingGraph()
+    for name, value in (("samples", 101), ("amplitude", 1.0), ("height", 0.0), ("phase", 0.0), ("frequency", 1.0),
+                        ("filter_type", "None"), ("cutoff", 50.0)):
+        graph.AddParameter(name, value)
+
+    graph.AddNode("signal", "sine", samples=Ref("samples"), amplitude=Ref("amplitude"), height=Ref("height"), phase=Ref("phase"),
+                  frequency=Ref("frequency"), length=length)
+    graph.AddNode("filtered", "biquad", signal=Ref("signal.y"), sample_rate=Ref("signal.sample_rate"), filter_type=Ref("filter_type"), cutoff=Ref("cutoff"),
+                  order=order)
+    graph.AddNode("spectrum", "spectrum", signal=Ref("filtered"), sample_rate=Ref("signal.sample_rate"))
+    graph.AddNode("measurements", "measure", signal=Ref("filtered"), sample_rate=Ref("signal.sample_rate"))
+    graph.AddNode("harmonics", "harmonics", magnitude=Ref("spectrum.magnitude"))
+    graph.AddNode("peaks", "peaks", freqs=Ref("spectrum.freqs"), magnitude=Ref("spectrum.magnitude"))
+
+    return graph
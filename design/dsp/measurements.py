@@ -0,0 +1,183 @@
+from typing import Tuple
+import numpy as np
+import collections
+
+def CountZeroCrossings(y_data: np.ndarray, level: float = 0.0) -> int:
+    """
+    Count how many times the signal crosses the given level
+    """
+    above = np.asarray(y_data) >= level
+    return int(np.count_nonzero(above[1:] != above[:-1]))
+
+def MeasureHarmonics(magnitude: np.ndarray, harmonics: int = 5, leakage_bins: int = 2) -> Tuple[float, float]:
+    """
+    Estimate THD and SNR (both in dB) from an amplitude spectrum, the fundamental is the strongest
+    non DC bin and every tone is integrated over a few neighbouring bins to account for window leakage
+    """
+
+    # The fundamental is searched above the DC leakage, a spectrum of only a few bins has nothing there
+    if len(magnitude) <= leakage_bins + 1:
+        return float("nan"), float("nan")
+
+    # Work in power so bins can simply be summed
+    power   = magnitude ** 2
+    bins    = len(power)
+    in_tone = np.zeros(bins, dtype=bool)
+    in_tone[:leakage_bins + 1] = True
+
+    fundamental_bin = int(np.argmax(power[leakage_bins + 1:])) + leakage_bins + 1
+    tone_power      = []
+    for harmonic in range(1, harmonics + 2):
+        center = fundamental_bin * harmonic
+        if center >= bins:
+            break
+        lo, hi = max(center - leakage_bins, 0), min(center + leakage_bins + 1, bins)
+        tone_power.append(power[lo:hi].sum())
+        in_tone[lo:hi] = True
+
+    signal_power     = tone_power[0]
+    distortion_power = sum(tone_power[1:])
+    noise_power      = power[~in_tone].sum()
+
+    with np.errstate(divide="ignore"):
+        thd = 10 * np.log10(distortion_power / signal_power) if signal_power > 0 else float("nan")
+        snr = 10 * np.log10(signal_power / noise_power) if noise_power > 0 else float("inf")
+
+    return float(thd), float(snr)
+
+def MeasureSignal(y_data: np.ndarray, sample_rate: float) -> dict:
+    """
+    Compute the time domain measurements of a whole buffer using NumPy reductions
+    """
+
+    y_data = np.asarray(y_data, dtype=np.float64)
+    if len(y_data) == 0:
+        return {}
+
+    mean      = float(y_data.mean())
+    crossings = CountZeroCrossings(y_data, level=mean)
+
+    return {
+        "rms"          : float(np.sqrt(np.mean(y_data ** 2))),
+        "mean"         : mean,
+        "peak_to_peak" : float(np.ptp(y_data)),
+        "zero_cross"   : crossings * sample_rate / (2 * len(y_data))
+    }
+
+class RunningStatistics():
+
+    """
+    Incremental statistics for streamed data, every chunk is reduced on its own and merged
+    into the totals with the parallel form of Welford's algorithm so each update is O(chunk).
+    Crossings are counted against the running mean as it stood at the previous chunk boundary
+    (the first chunk uses its own mean), so a crossing once counted is never re-judged against
+    a level that moved later
+    """
+
+    def __init__(self) -> None:
+        self.Reset()
+
+    def Reset(self) -> None:
+        """
+        Forget every sample seen so far
+        """
+        self.count       = 0
+        self.mean        = 0.0
+        self.m2          = 0.0
+        self.minimum     = float("inf")
+        self.maximum     = float("-inf")
+        self.crossings   = 0
+        self.last_sample = None
+
+    def Update(self, chunk: np.ndarray) -> None:
+        """
+        Merge a chunk of new samples into the running totals
+        """
+
+        chunk = np.asarray(chunk, dtype=np.float64)
+        if len(chunk) == 0:
+            return
+
+        # Reduce the chunk on its own
+        count = len(chunk)
+        mean  = float(chunk.mean())
+        m2    = float(np.sum((chunk - mean) ** 2))
+
+        # The crossing level is fixed before this chunk is merged in
+        level = self.mean if self.count > 0 else mean
+
+        # Merge the chunk moments with the running moments
+        total      = self.count + count
+        delta      = mean - self.mean
+        self.mean += delta * count / total
+        self.m2   += m2 + delta ** 2 * self.count * count / total
+        self.count = total
+
+        self.minimum = min(self.minimum, float(chunk.min()))
+        self.maximum = max(self.maximum, float(chunk.max()))
+
+        # Carry the previous sample over so a crossing on the chunk boundary is not missed
+        if self.last_sample is not None:
+            chunk = np.concatenate(([self.last_sample], chunk))
+        self.crossings  += CountZeroCrossings(chunk, level=level)
+        self.last_sample = chunk[-1]
+
+    def GetMeasurements(self, sample_rate: float) -> dict:
+        """
+        Get the same measurements as MeasureSignal for everything seen so far
+        """
+
+        if self.count == 0:
+            return {}
+
+        variance = self.m2 / self.count
+
+        return {
+            "rms"          : float(np.sqrt(variance + self.mean ** 2)),
+            "mean"         : self.mean,
+            "peak_to_peak" : self.maximum - self.minimum,
+            "zero_cross"   : self.crossings * sample_rate / (2 * self.count)
+        }
+
+class SlidingRange():
+
+    """
+    Minimum and maximum over the most recent samples of a stream. One extreme pair is kept per chunk,
+    so scrolling a chunk in is O(chunk) and reading the range only reduces over the handful of chunks
+    in the window. The oldest chunk is kept until it has scrolled out completely so the range is never
+    narrower than the data
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = max(int(capacity), 1)
+        self.Reset()
+
+    def Reset(self) -> None:
+        """
+        Forget every chunk seen so far
+        """
+        self.chunks = collections.deque()
+        self.count  = 0
+
+    def Update(self, chunk: np.ndarray) -> None:
+        """
+        Push the extremes of a new chunk and drop the chunks that scrolled out of the window
+        """
+
+        chunk = np.asarray(chunk)
+        if len(chunk) == 0:
+            return
+
+        self.chunks.append((len(chunk), float(chunk.min()), float(chunk.max())))
+        self.count += len(chunk)
+        while self.count - self.chunks[0][0] >= self.capacity:
+            self.count -= self.chunks.popleft()[0]
+
+    def GetRange(self) -> Tuple[float, float]:
+        """
+        Get the (minimum, maximum) over the window, None when nothing was pushed
+        """
+        if not self.chunks:
+            return None
+
+        return min(chunk[1] for chunk in self.chunks), max(chunk[2] for chunk in self.chunks)
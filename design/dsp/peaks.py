@@ -0,0 +1,72 @@
+from typing import Tuple
+import numpy as np
+
+PEAK_DTYPE = np.dtype([("frequency", np.float64), ("magnitude", np.float64), ("bin", np.int64)])
+
+def InterpolatePeaks(magnitude: np.ndarray, bins: np.ndarray, method: str = "gaussian") -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Refine peak bins to sub-bin accuracy by fitting a parabola through each peak and its two
+    neighbours, the gaussian method fits the parabola to the log magnitude instead which is
+    exact for a gaussian shaped main lobe
+    """
+
+    left   = magnitude[bins - 1]
+    center = magnitude[bins]
+    right  = magnitude[bins + 1]
+
+    if method == "gaussian":
+        tiny                = np.finfo(np.float64).tiny
+        left, center, right = np.log(np.maximum(left, tiny)), np.log(np.maximum(center, tiny)), np.log(np.maximum(right, tiny))
+    elif method != "parabolic":
+        raise ValueError(f"Unknown interpolation method: {method}")
+
+    denominator = left - 2 * center + right
+    with np.errstate(divide="ignore", invalid="ignore"):
+        offset = np.where(denominator != 0, 0.5 * (left - right) / denominator, 0.0)
+    peak = center - 0.25 * (left - right) * offset
+
+    return offset, np.exp(peak) if method == "gaussian" else peak
+
+def FindSpectralPeaks(freqs: np.ndarray, magnitude: np.ndarray, max_peaks: int = 5, prominence: float = 0.01,
+                      prominence_bins: int = 8, method: str = "gaussian") -> np.ndarray:
+    """
+    Find the strongest tones in a spectrum, a peak is a local maximum that rises at least
+    prominence (relative to the largest magnitude) above the lowest point within prominence_bins
+    on both sides. Returns a structured array sorted by magnitude, strongest first
+    """
+
+    magnitude = np.asarray(magnitude, dtype=np.float64)
+    if len(magnitude) < 3 or max_peaks <= 0:
+        return np.zeros(0, dtype=PEAK_DTYPE)
+
+    # Local maxima, excluding the end points which have no neighbour on one side
+    middle     = magnitude[1:-1]
+    candidates = np.flatnonzero((middle > magnitude[:-2]) & (middle >= magnitude[2:])) + 1
+
+    # A cheap height test first so the prominence gather only touches plausible peaks
+    threshold  = prominence * magnitude.max()
+    candidates = candidates[magnitude[candidates] >= threshold]
+    if len(candidates) == 0:
+        return np.zeros(0, dtype=PEAK_DTYPE)
+
+    # Gather a window around every candidate at once and compare against the higher of the two floors
+    offsets     = np.arange(1, prominence_bins + 1)
+    left_floor  = magnitude[np.clip(candidates[:, np.newaxis] - offsets, 0, None)].min(axis=1)
+    right_floor = magnitude[np.clip(candidates[:, np.newaxis] + offsets, None, len(magnitude) - 1)].min(axis=1)
+    rise        = magnitude[candidates] - np.maximum(left_floor, right_floor)
+    candidates  = candidates[rise >= threshold]
+
+    # Keep the top K without sorting every candidate
+    if len(candidates) > max_peaks:
+        candidates = candidates[np.argpartition(magnitude[candidates], -max_peaks)[-max_peaks:]]
+    candidates = candidates[np.argsort(magnitude[candidates])[::-1]]
+
+    offset, peak_magnitude = InterpolatePeaks(magnitude, candidates, method=method)
+    bin_width              = freqs[1] - freqs[0]
+
+    peaks              = np.zeros(len(candidates), dtype=PEAK_DTYPE)
+    peaks["frequency"] = freqs[candidates] + offset * bin_width
+    peaks["magnitude"] = peak_magnitude
+    peaks["bin"]       = candidates
+
+    return peaks
@@ -0,0 +1,17 @@
+import numpy as np
+
+def FindNearestIndex(sorted_data: np.ndarray, value: float) -> int:
+    """
+    Find the index of the sample closest to value with a binary search, the data must be sorted
+    ascending. Returns -1 for empty data
+    """
+
+    if sorted_data is None or len(sorted_data) == 0:
+        return -1
+
+    # Pick the closer of the two neighbours around the insertion point
+    index = int(np.searchsorted(sorted_data, value))
+    if index >= len(sorted_data) or (index > 0 and value - sorted_data[index - 1] < sorted_data[index] - value):
+        index -= 1
+
+    return index
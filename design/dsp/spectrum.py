@@ -0,0 +1,74 @@
+from typing import Tuple
+import numpy as np
+import functools
+
+def ComputeMagnitudeSpectrum(y_data: np.ndarray, sample_rate: float, window: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the single sided amplitude spectrum of a real signal, a hann window is applied
+    by default and the magnitudes are scaled so a sine of amplitude A shows a peak of A
+    """
+
+    y_data = np.asarray(y_data, dtype=np.float64)
+    if len(y_data) < 2:
+        return np.zeros(0), np.zeros(0)
+
+    taper     = np.hanning(len(y_data)) if window else np.ones(len(y_data))
+
+    # A two sample hann window is all zeros, leave such a short buffer unwindowed instead
+    if taper.sum() == 0:
+        taper = np.ones(len(y_data))
+
+    magnitude = np.abs(np.fft.rfft(y_data * taper)) * (2 / taper.sum())
+    freqs     = np.fft.rfftfreq(len(y_data), d=1 / sample_rate)
+
+    # The DC bin is not mirrored so it must not be doubled
+    magnitude[0] /= 2
+
+    return freqs, magnitude
+
+@functools.lru_cache(maxsize=8)
+def ChirpZPlan(samples: int, bins: int, start: float, stop: float, sample_rate: float) -> Tuple[int, np.ndarray, np.ndarray, np.ndarray, float]:
+    """
+    Precompute the chirp sequences of bluestein's algorithm for evaluating bins points evenly spaced
+    over [start, stop] Hz, plans are cached per (N, M, band) since the same zoom is redrawn every frame
+    """
+
+    fft_length = 1 << int(np.ceil(np.log2(samples + bins - 1)))
+    step       = (stop - start) / max(bins - 1, 1)
+
+    # The chirp phase pi * step * n^2 / fs is formed from exact integer squares to keep precision for large N
+    n          = np.arange(samples, dtype=np.float64)
+    k          = np.arange(bins, dtype=np.float64)
+    pre_chirp  = np.exp(-2j * np.pi * start * n / sample_rate - 1j * np.pi * step * n ** 2 / sample_rate)
+    post_chirp = np.exp(-1j * np.pi * step * k ** 2 / sample_rate)
+
+    # The chirp filter covers lags -(N - 1) .. M - 1 laid out circularly
+    kernel                            = np.zeros(fft_length, dtype=np.complex128)
+    kernel[:bins]                     = np.exp(1j * np.pi * step * k ** 2 / sample_rate)
+    kernel[fft_length - samples + 1:] = np.exp(1j * np.pi * step * n[1:][::-1] ** 2 / sample_rate)
+
+    # Fold the hann window and the amplitude scaling into the pre chirp
+    taper      = np.hanning(samples)
+    if taper.sum() == 0:
+        taper = np.ones(samples)
+    pre_chirp *= taper
+
+    return fft_length, pre_chirp, np.fft.fft(kernel), post_chirp, 2 / taper.sum()
+
+def ComputeZoomSpectrum(y_data: np.ndarray, sample_rate: float, start: float, stop: float, bins: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the amplitude spectrum over a narrow band only using the chirp-Z transform, this gives
+    bins points of resolution inside [start, stop] without zero padding the whole FFT
+    """
+
+    y_data = np.asarray(y_data, dtype=np.float64)
+    if len(y_data) < 2 or bins < 2 or stop <= start:
+        return np.zeros(0), np.zeros(0)
+
+    fft_length, pre_chirp, kernel_fft, post_chirp, scale = ChirpZPlan(len(y_data), bins, float(start), float(stop), float(sample_rate))
+
+    convolved = np.fft.ifft(np.fft.fft(y_data * pre_chirp, fft_length) * kernel_fft)[:bins]
+    magnitude = np.abs(convolved * post_chirp) * scale
+    freqs     = np.linspace(start, stop, bins)
+
+    return freqs, magnitude
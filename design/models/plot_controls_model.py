@@ -1,5 +1,9 @@
-from typing import Tuple
+from typing import Iterable, Tuple, Union
+import numpy as np
+import collections
 import threading
+import asyncio
+import typing
 
 class PlotControlsModel():
 
@@ -7,9 +11,21 @@ class PlotControlsModel():
     This holds all of the state information of the plot controls
     """
 
+    # Groups of fields that can be subscribed to together, inputs are set from the view
+    # and outputs are the results the controller stores
+    INPUT_FIELDS  = ("gen_waveform_button", "clear_plot_button", "resolution", "amplitude", "height", "phase",
+                     "frequency", "normalize_freq", "stream_waveform", "filter_type", "filter_cutoff",
+                     "zoom_spectrum", "sample_inspector", "robust_fit", "published_samples")
+    OUTPUT_FIELDS = ("time_plot_data", "freq_plot_data", "angular_label", "period_label", "measurements", "spectral_peaks")
+
     def __init__(self) -> None:
+        self.__subscribers               = {}
+        self.__notify_listeners          = []
+        self.__changed_fields            = set()
+        self.__changed_fields_lock       = threading.Lock()
         self.__time_plot_x_data          = None
         self.__time_plot_y_data          = None
+        self.__time_plot_sample_rate     = None
         self.__time_plot_data_lock       = threading.Lock()
         self.__freq_plot_x_data          = None
         self.__freq_plot_y_data          = None
@@ -31,6 +47,84 @@ class PlotControlsModel():
         self.__period_label              = None
         self.__period_label_lock         = threading.Lock()
         self.__normalize_freq_check      = threading.Event()
+        self.__stream_waveform_check     = threading.Event()
+        self.__zoom_spectrum_check       = threading.Event()
+        self.__sample_inspector_check    = threading.Event()
+        self.__robust_fit_check          = threading.Event()
+        self.__filter_type_value         = None
+        self.__filter_type_lock          = threading.Lock()
+        self.__filter_cutoff_value       = None
+        self.__filter_cutoff_lock        = threading.Lock()
+        self.__measurements              = {}
+        self.__measurements_lock         = threading.Lock()
+        self.__spectral_peaks            = None
+        self.__spectral_peaks_lock       = threading.Lock()
+        self.__published_samples         = collections.deque()
+        self.__published_count           = 0
+        self.__published_sample_rate     = None
+        self.__published_dropped         = 0
+        self.__published_lock            = threading.Lock()
+        self.max_published_samples       = 1 << 21
+
+    def Subscribe(self, fields: Union[str, Iterable[str]], handler: typing.Any) -> None:
+        """
+        Register a handler for one field or a group of fields, it is called from DispatchNotifications
+        with the set of its fields that changed. None subscribes to every field
+        """
+
+        # Handlers are indexed by field so a dispatch only visits the fields that changed
+        for field in ([fields] if isinstance(fields, str) or fields is None else fields):
+            self.__subscribers.setdefault(field, []).append(handler)
+
+    def Unsubscribe(self, handler: typing.Any) -> None:
+        """
+        Remove every subscription of a handler
+        """
+        for field, handlers in list(self.__subscribers.items()):
+            handlers[:] = [subscriber for subscriber in handlers if subscriber != handler]
+            if not handlers:
+                del self.__subscribers[field]
+
+    def AddNotifyListener(self, listener: typing.Any) -> None:
+        """
+        Register a listener called right away with the field on the thread that set it, unlike the
+        subscribers it is meant for thread safe signals such as waking the render loop
+        """
+        self.__notify_listeners.append(listener)
+
+    def Notify(self, field: str) -> None:
+        """
+        Mark a field as changed, setters may run on any thread and are coalesced until the next dispatch
+        """
+        with self.__changed_fields_lock:
+            self.__changed_fields.add(field)
+
+        for listener in self.__notify_listeners:
+            listener(field)
+
+    def DispatchNotifications(self) -> bool:
+        """
+        Deliver the fields changed since the last dispatch, every handler is called at most once no matter
+        how many times its fields were set in between. Returns true if anything changed
+        """
+
+        with self.__changed_fields_lock:
+            if not self.__changed_fields:
+                return False
+            changed, self.__changed_fields = self.__changed_fields, set()
+
+        # Gather the changed fields per handler first so each handler runs once
+        relevant = {}
+        for field in changed:
+            for handler in self.__subscribers.get(field, ()):
+                relevant.setdefault(handler, set()).add(field)
+        for handler in self.__subscribers.get(None, ()):
+            relevant[handler] = changed
+
+        for handler, fields in relevant.items():
+            handler(fields)
+
+        return True
 
     def GetTimePlotData(self) -> Tuple[list, list]:
         """
@@ -39,13 +133,22 @@ class PlotControlsModel():
         with self.__time_plot_data_lock:
             return self.__time_plot_x_data, self.__time_plot_y_data
 
-    def SetTimePlotData(self, x_data: list, y_data: list) -> None:
+    def GetTimePlotSampleRate(self) -> float:
+        """
+        Gets the sample rate of the time plot data, None when the data is an envelope rather than samples
+        """
+        with self.__time_plot_data_lock:
+            return self.__time_plot_sample_rate
+
+    def SetTimePlotData(self, x_data: list, y_data: list, sample_rate: float = None) -> None:
         """
-        Sets the time plot data for the time plot
+        Sets the time plot data for the time plot, sample_rate is only given when y_data holds evenly spaced samples
         """
         with self.__time_plot_data_lock:
-            self.__time_plot_x_data = x_data
-            self.__time_plot_y_data = y_data
+            self.__time_plot_x_data      = x_data
+            self.__time_plot_y_data      = y_data
+            self.__time_plot_sample_rate = sample_rate
+        self.Notify("time_plot_data")
 
     def GetFreqPlotData(self) -> Tuple[list, list]:
         """
@@ -61,18 +164,21 @@ class PlotControlsModel():
         with self.__freq_plot_data_lock:
             self.__freq_plot_x_data = x_data
             self.__freq_plot_y_data = y_data
+        self.Notify("freq_plot_data")
 
     def SetGenWaveformButtonPress(self) -> None:
         """
         Set the generate waveform button pressed event
         """
         self.__gen_waveform_button_press.set()
+        self.Notify("gen_waveform_button")
 
     def ClearGenWaveformButtonPress(self) -> None:
         """
         Clear the generate waveform button pressed event
         """
         self.__gen_waveform_button_press.clear()
+        self.Notify("gen_waveform_button")
 
     def IsGenWaveformButtonPressed(self) -> bool:
         """
@@ -85,12 +191,14 @@ class PlotControlsModel():
         Set the clear plot button pressed event
         """
         self.__clear_plot_button_press.set()
+        self.Notify("clear_plot_button")
 
     def ClearClearPlotButtonPress(self) -> None:
         """
         Clear the clear plot button pressed event
         """
         self.__clear_plot_button_press.clear()
+        self.Notify("clear_plot_button")
 
     def IsClearPlotButtonPressed(self) -> bool:
         """
@@ -111,6 +219,7 @@ class PlotControlsModel():
         """
         with self.__resolution_slider_lock:
             self.__resolution_slider_value = value
+        self.Notify("resolution")
 
     def GetAmplitudeSliderValue(self) -> float:
         """
@@ -125,6 +234,7 @@ class PlotControlsModel():
         """
         with self.__amplitude_slider_lock:
             self.__amplitude_slider_value = value
+        self.Notify("amplitude")
 
     def GetHeightSliderValue(self) -> float:
         """
@@ -139,6 +249,7 @@ class PlotControlsModel():
         """
         with self.__height_slider_lock:
             self.__height_slider_value = value
+        self.Notify("height")
 
     def GetPhaseSliderValue(self) -> float:
         """
@@ -153,6 +264,7 @@ class PlotControlsModel():
         """
         with self.__phase_slider_lock:
             self.__phase_slider_value = value
+        self.Notify("phase")
 
     def GetFrequencySliderValue(self) -> float:
         """
@@ -167,6 +279,7 @@ class PlotControlsModel():
         """
         with self.__frequency_slider_lock:
             self.__frequency_slider_value = value
+        self.Notify("frequency")
 
     def GetAngularLabel(self) -> float:
         """
@@ -181,6 +294,7 @@ class PlotControlsModel():
         """
         with self.__angular_label_lock:
             self.__angular_label = label
+        self.Notify("angular_label")
 
     def GetPeriodLabel(self) -> float:
         """
@@ -195,21 +309,217 @@ class PlotControlsModel():
         """
         with self.__period_label_lock:
             self.__period_label = label
+        self.Notify("period_label")
 
     def SetNormalizeFreqCheck(self) -> None:
         """
         Set the normalize check event
         """
         self.__normalize_freq_check.set()
+        self.Notify("normalize_freq")
 
     def ClearNormalizeFreqCheck(self) -> None:
         """
         Clear the normalize check event
         """
         self.__normalize_freq_check.clear()
+        self.Notify("normalize_freq")
 
     def IsNormalizeFreqChecked(self) -> bool:
         """
         Is the normalize check checked
         """
-        return self.__normalize_freq_check.is_set()
\ No newline at end of file
+        return self.__normalize_freq_check.is_set()
+
+    def SetStreamWaveformCheck(self) -> None:
+        """
+        Set the stream waveform check event
+        """
+        self.__stream_waveform_check.set()
+        self.Notify("stream_waveform")
+
+    def ClearStreamWaveformCheck(self) -> None:
+        """
+        Clear the stream waveform check event
+        """
+        self.__stream_waveform_check.clear()
+        self.Notify("stream_waveform")
+
+    def IsStreamWaveformChecked(self) -> bool:
+        """
+        Is the stream waveform check checked
+        """
+        return self.__stream_waveform_check.is_set()
+
+    def GetFilterTypeValue(self) -> str:
+        """
+        Get the selected filter type
+        """
+        with self.__filter_type_lock:
+            return self.__filter_type_value
+
+    def SetFilterTypeValue(self, value: str) -> None:
+        """
+        Set the selected filter type
+        """
+        with self.__filter_type_lock:
+            self.__filter_type_value = value
+        self.Notify("filter_type")
+
+    def GetFilterCutoffSliderValue(self) -> float:
+        """
+        Get the filter cutoff slider value
+        """
+        with self.__filter_cutoff_lock:
+            return self.__filter_cutoff_value
+
+    def SetFilterCutoffSliderValue(self, value: float) -> None:
+        """
+        Set the filter cutoff slider value
+        """
+        with self.__filter_cutoff_lock:
+            self.__filter_cutoff_value = value
+        self.Notify("filter_cutoff")
+
+    def GetMeasurements(self) -> dict:
+        """
+        Get the latest signal measurements
+        """
+        with self.__measurements_lock:
+            return self.__measurements
+
+    def SetMeasurements(self, measurements: dict) -> None:
+        """
+        Set the latest signal measurements
+        """
+        with self.__measurements_lock:
+            self.__measurements = measurements
+        self.Notify("measurements")
+
+    def GetSpectralPeaks(self) -> np.ndarray:
+        """
+        Get the strongest tones found in the spectrum, a structured array with frequency, magnitude and bin fields
+        """
+        with self.__spectral_peaks_lock:
+            return self.__spectral_peaks
+
+    def SetSpectralPeaks(self, peaks: np.ndarray) -> None:
+        """
+        Set the strongest tones found in the spectrum
+        """
+        with self.__spectral_peaks_lock:
+            self.__spectral_peaks = peaks
+        self.Notify("spectral_peaks")
+
+    def SetZoomSpectrumCheck(self) -> None:
+        """
+        Set the zoom spectrum check event
+        """
+        self.__zoom_spectrum_check.set()
+        self.Notify("zoom_spectrum")
+
+    def ClearZoomSpectrumCheck(self) -> None:
+        """
+        Clear the zoom spectrum check event
+        """
+        self.__zoom_spectrum_check.clear()
+        self.Notify("zoom_spectrum")
+
+    def IsZoomSpectrumChecked(self) -> bool:
+        """
+        Is the zoom spectrum check checked
+        """
+        return self.__zoom_spectrum_check.is_set()
+
+    def SetSampleInspectorCheck(self) -> None:
+        """
+        Set the sample inspector check event
+        """
+        self.__sample_inspector_check.set()
+        self.Notify("sample_inspector")
+
+    def ClearSampleInspectorCheck(self) -> None:
+        """
+        Clear the sample inspector check event
+        """
+        self.__sample_inspector_check.clear()
+        self.Notify("sample_inspector")
+
+    def IsSampleInspectorChecked(self) -> bool:
+        """
+        Is the sample inspector check checked
+        """
+        return self.__sample_inspector_check.is_set()
+
+    def SetRobustFitCheck(self) -> None:
+        """
+        Set the robust fit check event
+        """
+        self.__robust_fit_check.set()
+        self.Notify("robust_fit")
+
+    def ClearRobustFitCheck(self) -> None:
+        """
+        Clear the robust fit check event
+        """
+        self.__robust_fit_check.clear()
+        self.Notify("robust_fit")
+
+    def IsRobustFitChecked(self) -> bool:
+        """
+        Is the robust fit check checked
+        """
+        return self.__robust_fit_check.is_set()
+
+    def PublishSamples(self, samples: np.ndarray, sample_rate: float) -> None:
+        """
+        Publish a chunk of samples from an external source, safe to call from any thread. When more than
+        max_published_samples are waiting the oldest chunks are dropped and counted
+        """
+
+        samples = np.asarray(samples, dtype=np.float64)
+        with self.__published_lock:
+            self.__published_samples.append(samples)
+            self.__published_count      += len(samples)
+            self.__published_sample_rate = sample_rate
+            while self.__published_count > self.max_published_samples and len(self.__published_samples) > 1:
+                dropped                   = self.__published_samples.popleft()
+                self.__published_count   -= len(dropped)
+                self.__published_dropped += len(dropped)
+        self.Notify("published_samples")
+
+    async def PublishSamplesAsync(self, samples: np.ndarray, sample_rate: float, poll_interval: float = 0.001) -> None:
+        """
+        Publish a chunk of samples from a coroutine, instead of dropping data the producer is suspended
+        while the backlog is full so the consumer sets the pace
+        """
+        while self.GetPublishedBacklog() + len(samples) > self.max_published_samples and self.GetPublishedBacklog() > 0:
+            await asyncio.sleep(poll_interval)
+
+        self.PublishSamples(samples, sample_rate)
+
+    def TakePublishedSamples(self) -> Tuple[np.ndarray, float]:
+        """
+        Take every published sample in order as one array together with the sample rate of the source
+        """
+        with self.__published_lock:
+            chunks                 = list(self.__published_samples)
+            sample_rate            = self.__published_sample_rate
+            self.__published_count = 0
+            self.__published_samples.clear()
+
+        return (np.concatenate(chunks) if chunks else np.zeros(0)), sample_rate
+
+    def GetPublishedBacklog(self) -> int:
+        """
+        Get the number of published samples waiting to be taken
+        """
+        with self.__published_lock:
+            return self.__published_count
+
+    def GetPublishedDropped(self) -> int:
+        """
+        Get the number of published samples dropped because the backlog was full
+        """
+        with self.__published_lock:
+            return self.__published_dropped
\ No newline at end of file
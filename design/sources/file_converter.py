@@ -0,0 +1,60 @@
+from design.sources.file_export import EXPORT_FORMATS, WAV_SAMPLE_FORMATS, SignalExporter
+from design.sources.file_import import IMPORT_FORMATS, DetectFormat, ReadCaptureLayout, SignalImporter
+import numpy as np
+import argparse
+import sys
+
+def main() -> int:
+
+    parser = argparse.ArgumentParser(description="Export a capture or a generated sine to WAV, CSV or .npy without the UI")
+    parser.add_argument("output",                                                 help="File to write, the format follows the extension")
+    parser.add_argument("--input",         default=None,                          help="CSV, raw binary or .npy capture to export")
+    parser.add_argument("--input-format",  default=None,  choices=IMPORT_FORMATS)
+    parser.add_argument("--input-dtype",   default="<f4",                         help="Sample type of a raw binary capture")
+    parser.add_argument("--channels",      default=1,     type=int,               help="Interleaved channels of a raw binary capture")
+    parser.add_argument("--channel",       default=0,     type=int,               help="Channel to export")
+    parser.add_argument("--sine",          default=1000.0, type=float,            help="Frequency of the sine exported without an input")
+    parser.add_argument("--seconds",       default=10.0,  type=float,             help="Length of the sine exported without an input")
+    parser.add_argument("--sample-rate",   default=48000.0, type=float,           help="Sample rate of a raw capture or the sine")
+    parser.add_argument("--format",        default=None,  choices=EXPORT_FORMATS)
+    parser.add_argument("--sample-format", default="pcm16", choices=list(WAV_SAMPLE_FORMATS), help="Sample format of a WAV export")
+    parser.add_argument("--dtype",         default="<f4",                         help="Sample type of a .npy export")
+    parser.add_argument("--full-scale",    default=1.0,   type=float,             help="Amplitude written as the WAV full scale")
+    parser.add_argument("--chunk",         default=1 << 16, type=int,             help="Samples per chunk")
+    args   = parser.parse_args()
+
+    sample_rate = args.sample_rate
+    if args.input is None:
+
+        # The sine is generated a chunk at a time as well
+        samples = int(args.seconds * sample_rate)
+        signal  = (np.sin(2 * np.pi * args.sine * np.arange(start, min(start + args.chunk, samples)) / sample_rate) for start in range(0, samples, args.chunk))
+    elif (args.input_format or DetectFormat(args.input)) == "csv":
+        importer = SignalImporter(args.input, format="csv", sample_rate=sample_rate).Start()
+        importer.Wait()
+        if importer.error is not None:
+            print(f"Import failed: {importer.error}", file=sys.stderr)
+            return 1
+        signal, sample_rate = importer.GetData(), importer.sample_rate
+    else:
+        format                                   = args.input_format or DetectFormat(args.input)
+        offset, frames, dtype, channels, channel = ReadCaptureLayout(args.input, format, args.input_dtype, args.channels, args.channel)
+        if channel >= channels:
+            print(f"Channel {channel} is out of range for {channels} channel(s)", file=sys.stderr)
+            return 1
+        signal = np.memmap(args.input, dtype=dtype, mode="r", offset=offset, shape=(frames, channels))[:, channel] if frames > 0 else np.zeros(0, dtype=dtype)
+
+    exporter = SignalExporter(args.output, signal, sample_rate, format=args.format, sample_format=args.sample_format, dtype=args.dtype,
+                              full_scale=args.full_scale, chunk_samples=args.chunk)
+    try:
+        exporter.Export()
+    except KeyboardInterrupt:
+        return 1
+
+    progress = exporter.GetProgress()
+    clipped  = f", {progress['clipped']} samples clipped" if progress["clipped"] else ""
+    print(f"Wrote {progress['samples']} samples at {'{:.0f}'.format(sample_rate)} Hz to {args.output} in {'{:.2f}'.format(progress['elapsed'])} s{clipped}")
+
+    return 0
+
+if __name__ == "__main__": sys.exit(main())
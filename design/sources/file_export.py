@@ -0,0 +1,370 @@
+from typing import Iterable, Iterator, Union
+import numpy as np
+import threading
+import typing
+import struct
+import time
+import os
+
+# Formats the exporter writes, a path without a known extension is written as .npy
+EXPORT_FORMATS = ("wav", "csv", "npy")
+
+# WAV sample formats as (format tag, bits per sample), 1 is integer PCM and 3 is IEEE float
+WAV_SAMPLE_FORMATS = {
+    "pcm16":   (1, 16),
+    "pcm24":   (1, 24),
+    "pcm32":   (1, 32),
+    "float32": (3, 32),
+}
+
+# The RIFF sizes are 32 bit, the data chunk has to end before 4 GiB
+WAV_MAX_BYTES = (1 << 32) - 1 - 64
+
+def DetectExportFormat(path: str) -> str:
+    """
+    Pick the export format from the file extension
+    """
+
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".wav":
+        return "wav"
+    if extension in (".csv", ".txt"):
+        return "csv"
+
+    return "npy"
+
+def IterateChunks(signal: Union[np.ndarray, Iterable[np.ndarray]], chunk_samples: int) -> Iterator[np.ndarray]:
+    """
+    Yield a signal chunk_samples at a time. Arrays, memory maps included, are sliced so only the chunk being
+    written is ever read, anything else is taken as an iterable of chunks and passed through
+    """
+
+    if isinstance(signal, np.ndarray):
+        for start in range(0, len(signal), chunk_samples):
+            yield signal[start:start + chunk_samples]
+        return
+
+    for chunk in signal:
+        yield np.asarray(chunk)
+
+class WavWriter():
+
+    """
+    Writes a mono WAV file chunk by chunk. The header goes out first with empty sizes and is patched on close,
+    every chunk is scaled by 1 / full_scale and converted to the sample format on its own. Integer formats are
+    rounded and clipped, the clipped samples are counted
+    """
+
+    def __init__(self, path: str, sample_rate: float, sample_format: str = "pcm16", full_scale: float = 1.0) -> None:
+
+        if sample_format not in WAV_SAMPLE_FORMATS:
+            raise ValueError(f"Unknown WAV sample format: {sample_format}")
+
+        self.path                 = path
+        self.sample_rate          = int(round(sample_rate))
+        self.sample_format        = sample_format
+        self.tag, self.bits       = WAV_SAMPLE_FORMATS[sample_format]
+        self.scale                = 1.0 / full_scale
+        self.samples              = 0
+        self.clipped              = 0
+        self.file                 = open(path, "wb")
+
+        # Float data also needs a fact chunk holding the sample count
+        block_align = self.bits // 8
+        fmt         = struct.pack("<HHIIHH", self.tag, 1, self.sample_rate, self.sample_rate * block_align, block_align, self.bits)
+        if self.tag == 3:
+            fmt += struct.pack("<H", 0)
+        self.file.write(b"RIFF" + struct.pack("<I", 0) + b"WAVE" + b"fmt " + struct.pack("<I", len(fmt)) + fmt)
+        if self.tag == 3:
+            self.file.write(b"fact" + struct.pack("<II", 4, 0))
+            self.fact_offset = self.file.tell() - 4
+        self.file.write(b"data" + struct.pack("<I", 0))
+        self.data_offset = self.file.tell()
+
+    def Write(self, chunk: np.ndarray) -> None:
+        """
+        Convert a chunk to the sample format and append it
+        """
+
+        if (self.samples + len(chunk)) * (self.bits // 8) > WAV_MAX_BYTES:
+            raise ValueError(f"{self.path} would grow past the 4 GiB limit of WAV files")
+
+        chunk = np.asarray(chunk, dtype=np.float64) * self.scale
+        if self.tag == 3:
+            self.file.write(chunk.astype("<f4").tobytes())
+        else:
+            limit         = float(1 << (self.bits - 1))
+            scaled        = np.rint(chunk * limit)
+            self.clipped += int(np.count_nonzero((scaled < -limit) | (scaled > limit - 1)))
+            values        = np.clip(scaled, -limit, limit - 1).astype("<i2" if self.bits == 16 else "<i4")
+
+            # 24 bit samples are the low three bytes of the little endian int32
+            if self.bits == 24:
+                values = values.view(np.uint8).reshape(-1, 4)[:, :3]
+            self.file.write(values.tobytes())
+
+        self.samples += len(chunk)
+
+    def Close(self) -> None:
+        """
+        Patch the sizes into the header and close the file
+        """
+
+        if self.file is None:
+            return
+
+        data_bytes = self.samples * (self.bits // 8)
+        if data_bytes % 2:
+            self.file.write(b"\0")
+
+        self.file.seek(4)
+        self.file.write(struct.pack("<I", self.data_offset - 8 + data_bytes + data_bytes % 2))
+        self.file.seek(self.data_offset - 4)
+        self.file.write(struct.pack("<I", data_bytes))
+        if self.tag == 3:
+            self.file.seek(self.fact_offset)
+            self.file.write(struct.pack("<I", self.samples))
+
+        self.file.close()
+        self.file = None
+
+class CsvWriter():
+
+    """
+    Writes a time,amplitude CSV file chunk by chunk, the time column is taken from the sample index so the
+    importer finds the sample rate again. Rows are formatted a chunk at a time with one string operation
+    """
+
+    def __init__(self, path: str, sample_rate: float, precision: int = 9, write_time: bool = True) -> None:
+        self.path        = path
+        self.sample_rate = sample_rate
+        self.write_time  = write_time
+        self.row         = f"%.{precision}g,%.{precision}g\n" if write_time else f"%.{precision}g\n"
+        self.samples     = 0
+        self.clipped     = 0
+        self.file        = open(path, "w", newline="")
+        self.file.write("time,amplitude\n" if write_time else "amplitude\n")
+
+    def Write(self, chunk: np.ndarray) -> None:
+        """
+        Format a chunk and append it
+        """
+
+        chunk = np.asarray(chunk, dtype=np.float64)
+        if self.write_time:
+            time_data = np.arange(self.samples, self.samples + len(chunk), dtype=np.float64) / self.sample_rate
+            chunk     = np.column_stack((time_data, chunk)).ravel()
+
+        self.file.write(self.row * (len(chunk) // (2 if self.write_time else 1)) % tuple(chunk.tolist()))
+        self.samples += len(chunk) // (2 if self.write_time else 1)
+
+    def Close(self) -> None:
+        """
+        Close the file
+        """
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+class NpyWriter():
+
+    """
+    Writes a 1-D .npy file chunk by chunk. numpy pads the header so the length of the growth axis can be
+    written again in place, the header is written for zero samples first and rewritten on close
+    """
+
+    def __init__(self, path: str, dtype: str = "<f4") -> None:
+        self.path    = path
+        self.dtype   = np.dtype(dtype)
+        self.samples = 0
+        self.clipped = 0
+        self.file    = open(path, "wb")
+        self.__WriteHeader()
+        self.data_offset = self.file.tell()
+
+    def Write(self, chunk: np.ndarray) -> None:
+        """
+        Convert a chunk to the dtype and append it
+        """
+        self.file.write(np.asarray(chunk).astype(self.dtype, copy=False).tobytes())
+        self.samples += len(chunk)
+
+    def Close(self) -> None:
+        """
+        Write the final shape into the header and close the file
+        """
+
+        if self.file is None:
+            return
+
+        self.file.seek(0)
+        self.__WriteHeader()
+        if self.file.tell() != self.data_offset:
+            raise ValueError(f"The header of {self.path} changed size")
+
+        self.file.close()
+        self.file = None
+
+    def __WriteHeader(self) -> None:
+        """
+        Write the header for the samples written so far
+        """
+        np.lib.format.write_array_header_1_0(self.file, {
+            "descr":         np.lib.format.dtype_to_descr(self.dtype),
+            "fortran_order": False,
+            "shape":         (self.samples,),
+        })
+
+def OpenWriter(path: str, format: str, sample_rate: float, sample_format: str = "pcm16", dtype: str = "<f4",
+               full_scale: float = 1.0) -> Union[WavWriter, CsvWriter, NpyWriter]:
+    """
+    Create the writer of an export format
+    """
+
+    if format == "wav":
+        return WavWriter(path, sample_rate, sample_format=sample_format, full_scale=full_scale)
+    if format == "csv":
+        return CsvWriter(path, sample_rate)
+    if format == "npy":
+        return NpyWriter(path, dtype=dtype)
+
+    raise ValueError(f"Unknown export format: {format}")
+
+class SignalExporter():
+
+    """
+    Exports a signal to a WAV, CSV or .npy file chunk_samples at a time, synchronously with Export or on a
+    background thread with Start. The signal is an array or memory map, which is sliced per chunk, or an
+    iterable of chunks, so a recording of any length is written with no more than one chunk in memory.
+    A cancelled or failed export removes the partial file
+    """
+
+    def __init__(self, path: str, signal: Union[np.ndarray, Iterable[np.ndarray]], sample_rate: float, format: str = None,
+                 sample_format: str = "pcm16", dtype: str = "<f4", full_scale: float = 1.0, chunk_samples: int = 1 << 16,
+                 on_progress: typing.Any = None) -> None:
+
+        self.path          = path
+        self.format        = DetectExportFormat(path) if format is None else format
+        if self.format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format: {self.format}")
+        if self.format == "wav" and sample_format not in WAV_SAMPLE_FORMATS:
+            raise ValueError(f"Unknown WAV sample format: {sample_format}")
+
+        self.signal        = signal
+        self.sample_rate   = sample_rate
+        self.sample_format = sample_format
+        self.dtype         = dtype
+        self.full_scale    = full_scale
+        self.chunk_samples = chunk_samples
+        self.on_progress   = on_progress
+
+        # Progress, written by the export thread
+        self.total_samples = len(signal) if isinstance(signal, np.ndarray) else 0
+        self.samples       = 0
+        self.clipped       = 0
+        self.error         = None
+        self.start_time    = None
+        self.end_time      = None
+
+        self.cancel = threading.Event()
+        self.thread = None
+
+    def Start(self) -> "SignalExporter":
+        """
+        Start exporting in the background
+        """
+        self.thread = threading.Thread(target=self.__Run, name="SignalExporter", daemon=True)
+        self.thread.start()
+
+        return self
+
+    def Export(self) -> "SignalExporter":
+        """
+        Export on the calling thread, errors are raised
+        """
+
+        self.start_time = time.perf_counter()
+        writer          = OpenWriter(self.path, self.format, self.sample_rate, sample_format=self.sample_format,
+                                     dtype=self.dtype, full_scale=self.full_scale)
+        try:
+            for chunk in IterateChunks(self.signal, self.chunk_samples):
+                if self.cancel.is_set():
+                    break
+
+                writer.Write(chunk)
+                self.samples  = writer.samples
+                self.clipped  = writer.clipped
+                self.__Report()
+            writer.Close()
+        except BaseException:
+            writer.Close()
+            os.remove(self.path)
+            raise
+        finally:
+            self.end_time = time.perf_counter()
+
+        if self.cancel.is_set():
+            os.remove(self.path)
+
+        return self
+
+    def Cancel(self) -> None:
+        """
+        Stop the export after the chunk being written
+        """
+        self.cancel.set()
+
+    def Wait(self, timeout: float = None) -> bool:
+        """
+        Wait for the export to end, returns whether it did
+        """
+        if self.thread is not None:
+            self.thread.join(timeout)
+
+        return not self.IsRunning()
+
+    def IsRunning(self) -> bool:
+        """
+        Is the export still writing
+        """
+        return self.thread is not None and self.thread.is_alive()
+
+    def IsCancelled(self) -> bool:
+        """
+        Was the export cancelled
+        """
+        return self.cancel.is_set()
+
+    def GetProgress(self) -> dict:
+        """
+        Get how far the export got and how fast it writes, the fraction is None for a signal of unknown length
+        """
+
+        elapsed = ((self.end_time or time.perf_counter()) - self.start_time) if self.start_time is not None else 0.0
+
+        return {
+            "fraction":      self.samples / self.total_samples if self.total_samples > 0 else None,
+            "samples":       self.samples,
+            "total_samples": self.total_samples,
+            "clipped":       self.clipped,
+            "samples_per_s": self.samples / elapsed if elapsed > 0 else 0.0,
+            "elapsed":       elapsed,
+        }
+
+    def __Run(self) -> None:
+        """
+        Export and report the end of it
+        """
+        try:
+            self.Export()
+        except Exception as error:
+            self.error = error
+        finally:
+            self.__Report()
+
+    def __Report(self) -> None:
+        """
+        Tell the listener that there is something new to show
+        """
+        if self.on_progress is not None:
+            self.on_progress()
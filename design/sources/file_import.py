@@ -0,0 +1,398 @@
+from typing import Tuple
+import numpy as np
+import threading
+import typing
+import time
+import io
+import os
+
+# Formats the importer understands, anything not recognised by its extension is read as raw binary
+IMPORT_FORMATS = ("csv", "binary", "npy")
+
+def DetectFormat(path: str) -> str:
+    """
+    Pick the import format from the file extension
+    """
+
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".csv", ".txt"):
+        return "csv"
+    if extension == ".npy":
+        return "npy"
+
+    return "binary"
+
+def ReadCaptureLayout(path: str, format: str, dtype: np.dtype, channels: int, channel: int) -> Tuple[int, int, np.dtype, int, int]:
+    """
+    Get the data offset, frame count, dtype, channel count and channel to read of a raw binary or .npy capture.
+    Raw binary frames are channels interleaved samples of dtype, a partial frame at the end is not counted
+    """
+
+    if format == "binary":
+        dtype = np.dtype(dtype)
+        return 0, os.path.getsize(path) // (dtype.itemsize * channels), dtype, channels, channel
+
+    with open(path, "rb") as file:
+        version = np.lib.format.read_magic(file)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+        offset = file.tell()
+
+    frames   = shape[0] if len(shape) > 0 else 1
+    channels = int(np.prod(shape[1:])) if len(shape) > 1 else 1
+
+    # Column major arrays keep every channel contiguous, so the channel is read as a single channel file
+    if fortran_order and channels > 1:
+        return offset + channel * frames * dtype.itemsize, frames, dtype, 1, 0
+
+    return offset, frames, dtype, channels, channel
+
+class DecimationSummary():
+
+    """
+    Min/max envelope of a signal built while its chunks arrive, every bucket covers bucket_size samples.
+    The envelope of what has been loaded so far can be drawn at any time
+    """
+
+    def __init__(self, bucket_size: int, capacity: int = 1024) -> None:
+        self.bucket_size   = max(int(bucket_size), 1)
+        self.minimum       = np.empty(max(capacity, 1))
+        self.maximum       = np.empty(max(capacity, 1))
+        self.buckets       = 0
+        self.samples       = 0
+        self.partial_min   = np.inf
+        self.partial_max   = -np.inf
+        self.partial_count = 0
+
+    def Update(self, chunk: np.ndarray) -> None:
+        """
+        Fold a chunk into the envelope, buckets may span any number of chunks
+        """
+
+        self.samples += len(chunk)
+
+        # Complete the bucket left open by the previous chunk first
+        if self.partial_count > 0:
+            head                = chunk[:self.bucket_size - self.partial_count]
+            chunk               = chunk[len(head):]
+            self.partial_min    = min(self.partial_min, head.min()) if len(head) else self.partial_min
+            self.partial_max    = max(self.partial_max, head.max()) if len(head) else self.partial_max
+            self.partial_count += len(head)
+            if self.partial_count < self.bucket_size:
+                return
+            self.__Append(np.array([self.partial_min]), np.array([self.partial_max]))
+            self.partial_min, self.partial_max, self.partial_count = np.inf, -np.inf, 0
+
+        # Whole buckets at once, the rest stays open
+        whole = len(chunk) - len(chunk) % self.bucket_size
+        if whole > 0:
+            blocks = chunk[:whole].reshape(-1, self.bucket_size)
+            self.__Append(blocks.min(axis=1), blocks.max(axis=1))
+        if whole < len(chunk):
+            self.partial_min   = chunk[whole:].min()
+            self.partial_max   = chunk[whole:].max()
+            self.partial_count = len(chunk) - whole
+
+    def GetEnvelope(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the envelope as one line running through the minimum and maximum of every bucket, x is the index
+        of the first sample of the bucket
+        """
+
+        minimum, maximum = self.minimum[:self.buckets], self.maximum[:self.buckets]
+        if self.partial_count > 0:
+            minimum, maximum = np.append(minimum, self.partial_min), np.append(maximum, self.partial_max)
+
+        x_data = np.repeat(np.arange(len(minimum), dtype=np.float64) * self.bucket_size, 2)
+        y_data = np.column_stack((minimum, maximum)).ravel()
+
+        return x_data, y_data
+
+    def __Append(self, minimum: np.ndarray, maximum: np.ndarray) -> None:
+        """
+        Append whole buckets, growing the storage when the estimate of the length was short
+        """
+
+        needed = self.buckets + len(minimum)
+        if needed > len(self.minimum):
+            capacity     = max(needed, 2 * len(self.minimum))
+            self.minimum = np.resize(self.minimum, capacity)
+            self.maximum = np.resize(self.maximum, capacity)
+
+        self.minimum[self.buckets:needed] = minimum
+        self.maximum[self.buckets:needed] = maximum
+        self.buckets                      = needed
+
+class SignalImporter():
+
+    """
+    Imports a signal from a CSV, raw binary or .npy file on a background thread, chunk_bytes at a time.
+    CSV blocks are parsed with np.loadtxt, binary and .npy chunks are read with readinto into one buffer.
+    A DecimationSummary of about summary_points buckets is built on the fly so the file can be previewed
+    while it loads, and the import can be cancelled between chunks.
+
+    CSV files use their last column as the signal; with more than one column the first is taken as time
+    and gives the sample rate. Binary files hold channels interleaved samples of dtype and .npy files
+    describe themselves. Binary and .npy data is not copied, the result is a memory map of the channel
+    """
+
+    def __init__(self, path: str, format: str = None, dtype: str = "<f4", channels: int = 1, channel: int = 0,
+                 sample_rate: float = 1.0, chunk_bytes: int = 1 << 24, summary_points: int = 8192, on_progress: typing.Any = None) -> None:
+
+        self.path           = path
+        self.format         = DetectFormat(path) if format is None else format
+        if self.format not in IMPORT_FORMATS:
+            raise ValueError(f"Unknown import format: {self.format}")
+
+        self.dtype          = np.dtype(dtype)
+        self.channels       = channels
+        self.channel        = channel
+        self.sample_rate    = sample_rate
+        self.chunk_bytes    = chunk_bytes
+        self.summary_points = summary_points
+        self.on_progress    = on_progress
+
+        # Progress, written by the import thread
+        self.total_bytes      = os.path.getsize(path)
+        self.bytes_read       = 0
+        self.samples          = 0
+        self.expected_samples = 0
+        self.version          = 0
+        self.summary          = None
+        self.data             = None
+        self.error            = None
+        self.start_time       = None
+        self.end_time         = None
+
+        self.lock   = threading.Lock()
+        self.cancel = threading.Event()
+        self.thread = None
+
+    def Start(self) -> "SignalImporter":
+        """
+        Start importing in the background
+        """
+        self.start_time = time.perf_counter()
+        self.thread     = threading.Thread(target=self.__Run, name="SignalImporter", daemon=True)
+        self.thread.start()
+
+        return self
+
+    def Cancel(self) -> None:
+        """
+        Stop the import after the chunk being read
+        """
+        self.cancel.set()
+
+    def Wait(self, timeout: float = None) -> bool:
+        """
+        Wait for the import to end, returns whether it did
+        """
+        if self.thread is not None:
+            self.thread.join(timeout)
+
+        return not self.IsRunning()
+
+    def IsRunning(self) -> bool:
+        """
+        Is the import still reading
+        """
+        return self.thread is not None and self.thread.is_alive()
+
+    def IsCancelled(self) -> bool:
+        """
+        Was the import cancelled
+        """
+        return self.cancel.is_set()
+
+    def GetProgress(self) -> dict:
+        """
+        Get how far the import got and how fast it reads
+        """
+
+        elapsed = ((self.end_time or time.perf_counter()) - self.start_time) if self.start_time is not None else 0.0
+
+        return {
+            "fraction":    self.bytes_read / self.total_bytes if self.total_bytes > 0 else 1.0,
+            "bytes_read":  self.bytes_read,
+            "total_bytes": self.total_bytes,
+            "samples":     self.samples,
+            "expected":    max(self.expected_samples, self.samples),
+            "bytes_per_s": self.bytes_read / elapsed if elapsed > 0 else 0.0,
+            "elapsed":     elapsed,
+            "version":     self.version,
+        }
+
+    def GetEnvelope(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the decimated envelope of what has been loaded so far, x in seconds
+        """
+
+        with self.lock:
+            if self.summary is None:
+                return np.zeros(0), np.zeros(0)
+            x_data, y_data = self.summary.GetEnvelope()
+
+        return x_data / self.sample_rate, y_data
+
+    def GetData(self) -> np.ndarray:
+        """
+        Get the whole signal once the import completed, None before that or when it failed or was cancelled
+        """
+        return self.data
+
+    def __Run(self) -> None:
+        """
+        Import the file and report the end of it
+        """
+        try:
+            if self.format == "csv":
+                self.__ImportCsv()
+            else:
+                self.__ImportBinary()
+        except Exception as error:
+            self.error = error
+        finally:
+            self.end_time = time.perf_counter()
+            self.__Report()
+
+    def __Report(self) -> None:
+        """
+        Tell the listener that there is something new to show
+        """
+        if self.on_progress is not None:
+            self.on_progress()
+
+    def __Begin(self, expected_samples: int) -> None:
+        """
+        Size the summary buckets for the expected length of the signal
+        """
+        bucket_size = max(int(np.ceil(expected_samples / self.summary_points)), 1)
+        with self.lock:
+            self.expected_samples = expected_samples
+            self.summary = DecimationSummary(bucket_size, capacity=self.summary_points + 1)
+
+    def __Fold(self, samples: np.ndarray, read: int) -> None:
+        """
+        Fold a parsed chunk into the summary and publish the progress
+        """
+
+        with self.lock:
+            self.summary.Update(samples)
+            self.samples    += len(samples)
+            self.bytes_read += read
+            self.version    += 1
+
+        self.__Report()
+
+    def __ImportBinary(self) -> None:
+        """
+        Read binary or .npy frames with readinto into one buffer and keep a memory map of the channel
+        """
+
+        offset, frames, dtype, channels, channel = ReadCaptureLayout(self.path, self.format, self.dtype, self.channels, self.channel)
+        if channel >= channels:
+            raise ValueError(f"Channel {channel} is out of range for {channels} channel(s)")
+
+        self.__Begin(frames)
+        self.bytes_read = offset
+
+        frame_bytes  = dtype.itemsize * channels
+        chunk_frames = max(self.chunk_bytes // frame_bytes, 1)
+        buffer       = bytearray(chunk_frames * frame_bytes)
+        view         = memoryview(buffer)
+        remaining    = frames
+
+        with open(self.path, "rb") as file:
+            file.seek(offset)
+            while remaining > 0:
+                if self.cancel.is_set():
+                    return
+
+                read  = file.readinto(view[:min(chunk_frames, remaining) * frame_bytes])
+                count = read // frame_bytes
+                if count == 0:
+                    break
+
+                chunk = np.frombuffer(buffer, dtype=dtype, count=count * channels).reshape(count, channels)[:, channel]
+                self.__Fold(chunk, read)
+                remaining -= count
+
+        # A truncated file keeps the frames that are complete
+        frames   -= remaining
+        self.data = np.memmap(self.path, dtype=dtype, mode="r", offset=offset, shape=(frames, channels))[:, channel] if frames > 0 else np.zeros(0, dtype=dtype)
+
+    def __ImportCsv(self) -> None:
+        """
+        Parse the CSV in blocks of whole lines, the values are collected in a float64 buffer that grows as needed
+        """
+
+        values  = None
+        stored  = 0
+        carry   = b""
+        columns = None
+
+        with open(self.path, "rb") as file:
+            while True:
+                if self.cancel.is_set():
+                    return
+
+                # A small first block gets the preview on screen early
+                block = file.read(self.chunk_bytes if columns is not None else min(self.chunk_bytes, 1 << 20))
+                read  = len(block)
+                text  = carry + block
+
+                # Keep the partial last line for the next block, the final block is parsed whole
+                if block:
+                    cut = text.rfind(b"\n") + 1
+                    if cut == 0:
+                        carry = text
+                        continue
+                    text, carry = text[:cut], text[cut:]
+
+                if columns is None and text.strip():
+                    text, columns = self.__ReadCsvHeader(text)
+
+                    # The length is estimated from the lines per byte of the first block
+                    rows = max(text.count(b"\n"), 1)
+                    self.__Begin(int(rows * self.total_bytes / max(len(text), 1)))
+                    values = np.empty(int(rows * self.total_bytes / max(len(text), 1) * 1.05) + rows)
+
+                table = np.loadtxt(io.BytesIO(text), delimiter=",", ndmin=2, dtype=np.float64) if text.strip() else np.zeros((0, 1))
+                if len(table) > 0:
+                    chunk = table[:, -1]
+                    if stored + len(chunk) > len(values):
+                        values = np.resize(values, max(stored + len(chunk), int(1.5 * len(values))))
+                    values[stored:stored + len(chunk)] = chunk
+                    stored += len(chunk)
+
+                    self.__Fold(chunk, read)
+                else:
+                    self.bytes_read += read
+
+                if not block:
+                    break
+
+        self.data = values[:stored] if values is not None else np.zeros(0)
+
+    def __ReadCsvHeader(self, text: bytes) -> Tuple[bytes, int]:
+        """
+        Drop a header line if there is one, count the columns and take the sample rate from a time column
+        """
+
+        first_line = text.split(b"\n", 1)[0]
+        try:
+            [float(field) for field in first_line.split(b",")]
+        except ValueError:
+            text       = text[len(first_line) + 1:]
+            first_line = text.split(b"\n", 1)[0]
+
+        columns = first_line.count(b",") + 1
+        if columns > 1:
+            head = np.loadtxt(io.BytesIO(text), delimiter=",", ndmin=2, max_rows=1024, usecols=0)
+            if len(head) > 1 and head[-1, 0] > head[0, 0]:
+                self.sample_rate = (len(head) - 1) / (head[-1, 0] - head[0, 0])
+
+        return text, columns
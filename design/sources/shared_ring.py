@@ -0,0 +1,273 @@
+from design.models.plot_controls_model import PlotControlsModel
+from multiprocessing import shared_memory, resource_tracker
+from typing import List
+import numpy as np
+import asyncio
+import time
+
+# The header sits at the start of the block, the frames follow it at HEADER_SIZE
+HEADER_DTYPE = np.dtype([
+    ("magic",       "<u4"),
+    ("version",     "<u4"),
+    ("write_index", "<u8"),
+    ("capacity",    "<u8"),
+    ("channels",    "<u4"),
+    ("dtype",       "S12"),
+    ("sample_rate", "<f8"),
+])
+HEADER_SIZE  = 64
+RING_MAGIC   = 0x474E4952
+RING_VERSION = 1
+
+class SharedRingBuffer():
+
+    """
+    Single producer, single consumer ring of sample frames in a multiprocessing.shared_memory block. The
+    producer never waits, it only advances the write index (a running count of frames) after the frames are
+    in place. The consumer keeps its own read index and counts the frames it was lapped by as dropped
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory, owner: bool) -> None:
+        self.memory      = memory
+        self.owner       = owner
+        self.header      = np.ndarray((), dtype=HEADER_DTYPE, buffer=memory.buf)
+        if int(self.header["magic"]) != RING_MAGIC or int(self.header["version"]) != RING_VERSION:
+            raise ValueError(f"Shared memory block {memory.name} is not a sample ring")
+
+        self.capacity    = int(self.header["capacity"])
+        self.channels    = int(self.header["channels"])
+        self.dtype       = np.dtype(self.header["dtype"].item().decode())
+        self.sample_rate = float(self.header["sample_rate"])
+        self.data        = np.ndarray((self.capacity, self.channels), dtype=self.dtype, buffer=memory.buf, offset=HEADER_SIZE)
+        self.read_index  = self.GetWriteIndex()
+        self.last_read   = self.read_index
+        self.dropped     = 0
+
+    @classmethod
+    def Create(cls, name: str, capacity: int, channels: int = 1, dtype: str = "<f4", sample_rate: float = 48000.0) -> "SharedRingBuffer":
+        """
+        Create the block as the producer, the producer owns it and unlinks it on close
+        """
+
+        dtype  = np.dtype(dtype)
+        memory = shared_memory.SharedMemory(name=name, create=True, size=HEADER_SIZE + capacity * channels * dtype.itemsize)
+        header = np.ndarray((), dtype=HEADER_DTYPE, buffer=memory.buf)
+
+        header["write_index"] = 0
+        header["capacity"]    = capacity
+        header["channels"]    = channels
+        header["dtype"]       = dtype.str.encode()
+        header["sample_rate"] = sample_rate
+        header["version"]     = RING_VERSION
+        header["magic"]       = RING_MAGIC
+        del header
+
+        return cls(memory, owner=True)
+
+    @classmethod
+    def Attach(cls, name: str, untrack: bool = True) -> "SharedRingBuffer":
+        """
+        Attach to a block created by another process, untrack must be false for processes forked from the
+        creator since they share its resource tracker
+        """
+
+        memory = shared_memory.SharedMemory(name=name)
+
+        # Only the creating process may unlink the block, otherwise the resource tracker removes it when we exit
+        if untrack:
+            resource_tracker.unregister(memory._name, "shared_memory")
+
+        try:
+            return cls(memory, owner=False)
+        except ValueError:
+            memory.close()
+            raise
+
+    def GetWriteIndex(self) -> int:
+        """
+        Get the number of frames written since the ring was created
+        """
+        return int(self.header["write_index"])
+
+    def Write(self, frames: np.ndarray) -> None:
+        """
+        Copy frames into the ring and publish them, a 1-D array is taken as a single channel
+        """
+
+        frames = np.asarray(frames, dtype=self.dtype).reshape(-1, self.channels)
+        index  = self.GetWriteIndex()
+
+        # Only the newest capacity frames can be held, the rest are counted as written and lost
+        if len(frames) > self.capacity:
+            index += len(frames) - self.capacity
+            frames = frames[-self.capacity:]
+
+        start = index % self.capacity
+        first = min(len(frames), self.capacity - start)
+        self.data[start:start + first] = frames[:first]
+        self.data[:len(frames) - first] = frames[first:]
+
+        # The index moves last so the consumer never sees frames that are not in place yet
+        self.header["write_index"] = index + len(frames)
+
+    def Read(self, max_frames: int = None) -> List[np.ndarray]:
+        """
+        Get the frames written since the last read as at most two zero-copy views (two when they wrap
+        around the end of the ring). The views are only valid until the producer laps them, which
+        GetOverwritten reports
+        """
+
+        write     = self.GetWriteIndex()
+        available = write - self.read_index
+        if available > self.capacity:
+            self.dropped    += available - self.capacity
+            self.read_index  = write - self.capacity
+            available        = self.capacity
+        if max_frames is not None:
+            available = min(available, max_frames)
+
+        start          = self.read_index % self.capacity
+        first          = min(available, self.capacity - start)
+        views          = [self.data[start:start + first]]
+        if available > first:
+            views.append(self.data[:available - first])
+
+        self.last_read   = self.read_index
+        self.read_index += available
+
+        return views
+
+    def GetOverwritten(self) -> int:
+        """
+        Get how many frames of the last read the producer has overwritten since, they are counted as dropped
+        when they are reported so call this once after the views were used
+        """
+
+        overwritten = min(max(self.GetWriteIndex() - self.capacity - self.last_read, 0), self.read_index - self.last_read)
+        self.dropped   += overwritten
+        self.last_read += overwritten
+
+        return overwritten
+
+    def Close(self) -> None:
+        """
+        Release the mapping, the producer also removes the block. Views handed out by Read must be gone by now
+        """
+
+        if self.memory is None:
+            return
+
+        del self.header, self.data
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+        self.memory = None
+
+class SharedRingSource():
+
+    """
+    Streams one channel of a shared memory ring into the model, the frames are copied once out of the ring
+    since the slots are reused by the producer
+    """
+
+    def __init__(self, model: PlotControlsModel, name: str, channel: int = 0, poll_interval: float = 0.002,
+                 max_attach_delay: float = 1.0) -> None:
+        self.model            = model
+        self.name             = name
+        self.channel          = channel
+        self.poll_interval    = poll_interval
+        self.max_attach_delay = max_attach_delay
+        self.ring             = None
+        self.frames           = 0
+        self.bytes            = 0
+        self.error            = None
+        self.attach_delay     = poll_interval
+        self.next_attach      = 0.0
+        self.stats_snapshot   = (time.perf_counter(), 0, 0)
+
+    def Attach(self) -> bool:
+        """
+        Try to attach to the ring, a producer that has not created it yet (or not finished writing its header)
+        is retried with an exponential backoff and the reason is kept in error until the attach succeeds
+        """
+
+        now = time.perf_counter()
+        if now < self.next_attach:
+            return False
+
+        try:
+            self.ring = SharedRingBuffer.Attach(self.name)
+        except FileNotFoundError:
+            error = f"no shared memory block named {self.name}"
+        except ValueError as exception:
+            error = str(exception)
+        else:
+            self.error        = None
+            self.attach_delay = self.poll_interval
+            return True
+
+        self.error        = f"waiting for the producer, {error}"
+        self.next_attach  = now + self.attach_delay
+        self.attach_delay = min(self.attach_delay * 2, self.max_attach_delay)
+
+        return False
+
+    def Poll(self) -> int:
+        """
+        Publish whatever is new in the ring, returns the number of frames published
+        """
+
+        if self.ring is None and not self.Attach():
+            return 0
+
+        views = self.ring.Read()
+        if len(views[0]) == 0:
+            return 0
+
+        samples = np.concatenate([view[:, self.channel] for view in views]).astype(np.float64)
+        del views
+
+        # Frames the producer overwrote while they were copied are torn, skip them
+        samples = samples[self.ring.GetOverwritten():]
+        self.model.PublishSamples(samples, self.ring.sample_rate)
+        self.frames += len(samples)
+        self.bytes  += len(samples) * self.ring.channels * self.ring.dtype.itemsize
+
+        return len(samples)
+
+    def GetStats(self) -> dict:
+        """
+        Get the throughput since the previous call together with the running totals and the attach error
+        """
+
+        now                                = time.perf_counter()
+        last_time, last_bytes, last_frames = self.stats_snapshot
+        elapsed                            = max(now - last_time, 1e-9)
+        self.stats_snapshot                = (now, self.bytes, self.frames)
+
+        return {
+            "bytes_per_s":  (self.bytes - last_bytes) / elapsed,
+            "frames_per_s": (self.frames - last_frames) / elapsed,
+            "frames":       self.frames,
+            "dropped":      self.ring.dropped if self.ring is not None else 0,
+            "error":        self.error,
+        }
+
+    async def Run(self) -> None:
+        """
+        Poll the ring between frames until cancelled
+        """
+        try:
+            while True:
+                self.Poll()
+                await asyncio.sleep(self.poll_interval)
+        finally:
+            self.Close()
+
+    def Close(self) -> None:
+        """
+        Detach from the ring
+        """
+        if self.ring is not None:
+            self.ring.Close()
+            self.ring = None
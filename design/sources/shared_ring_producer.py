@@ -0,0 +1,47 @@
+from design.sources.shared_ring import SharedRingBuffer
+import numpy as np
+import argparse
+import time
+
+def Produce(name: str, sample_rate: float, frequency: float, channels: int, capacity: int, chunk_frames: int) -> None:
+    """
+    Create the ring and write a sine per channel (each channel a harmonic of frequency) paced against
+    the clock until interrupted
+    """
+
+    ring       = SharedRingBuffer.Create(name, capacity, channels=channels, dtype="<f4", sample_rate=sample_rate)
+    harmonics  = np.arange(1, channels + 1)
+    phase_step = 2 * np.pi * frequency * harmonics / sample_rate
+    start      = time.perf_counter()
+    written    = 0
+
+    print(f"Writing {channels} channel(s) at {sample_rate:.0f} samples/s to shared memory '{name}', ctrl+c to stop")
+    try:
+        while True:
+            due = int((time.perf_counter() - start) * sample_rate)
+            while written + chunk_frames <= due:
+                n        = np.arange(written, written + chunk_frames)[:, np.newaxis]
+                ring.Write(np.sin(phase_step * n) / harmonics)
+                written += chunk_frames
+            time.sleep(0.001)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        ring.Close()
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description="Stream a test signal into a shared memory sample ring")
+    parser.add_argument("--name",        default="mvc_samples",  help="Name of the shared memory block")
+    parser.add_argument("--sample-rate", default=1_000_000,      type=float)
+    parser.add_argument("--frequency",   default=1000.0,         type=float)
+    parser.add_argument("--channels",    default=1,              type=int)
+    parser.add_argument("--capacity",    default=1 << 22,        type=int, help="Ring size in frames")
+    parser.add_argument("--chunk",       default=4096,           type=int, help="Frames per write")
+    args   = parser.parse_args()
+
+    Produce(args.name, args.sample_rate, args.frequency, args.channels, args.capacity, args.chunk)
+
+    return 0
+
+if __name__ == "__main__": main()
@@ -0,0 +1,21 @@
+from design.sources.socket_source import SendFrames
+import argparse
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description="Send framed sine samples to a socket sample source")
+    parser.add_argument("--address",     default="unix:/tmp/mvc_samples.sock", help="unix:/path or host:port")
+    parser.add_argument("--sample-rate", default=500_000,                      type=float)
+    parser.add_argument("--frequency",   default=1000.0,                       type=float)
+    parser.add_argument("--frame",       default=4096,                         type=int, help="Samples per frame")
+    parser.add_argument("--unpaced",     action="store_true",                  help="Send as fast as possible")
+    args   = parser.parse_args()
+
+    try:
+        SendFrames(args.address, sample_rate=args.sample_rate, frame_samples=args.frame, frequency=args.frequency, paced=not args.unpaced)
+    except KeyboardInterrupt:
+        pass
+
+    return 0
+
+if __name__ == "__main__": main()
@@ -0,0 +1,290 @@
+from design.models.plot_controls_model import PlotControlsModel
+from typing import Callable, Tuple, Union
+import numpy as np
+import threading
+import socket
+import struct
+import time
+import os
+
+# Every frame is a header (magic, sample count, sequence number, sample rate) followed by little endian float32 samples
+FRAME_HEADER = struct.Struct("<4sIQd")
+FRAME_MAGIC  = b"SMPL"
+SAMPLE_DTYPE = np.dtype("<f4")
+
+# What happens to incoming frames while the model still holds more than high_water samples
+BACKPRESSURE_POLICIES = ("drop", "decimate")
+
+def ParseAddress(address: str) -> Tuple[int, Union[str, Tuple[str, int]]]:
+    """
+    Turn "unix:/path/to/socket" or "host:port" into a socket family and address
+    """
+
+    if address.startswith("unix:"):
+        return socket.AF_UNIX, address[len("unix:"):]
+
+    host, _, port = address.rpartition(":")
+    return socket.AF_INET, (host or "127.0.0.1", int(port))
+
+def ReceiveExactly(connection: socket.socket, view: memoryview, running: Callable[[], bool] = None) -> bool:
+    """
+    Fill view from the connection, returns false when the peer closed the connection first or, on a connection
+    with a timeout, when running returns false. A timeout only rechecks running, the bytes received so far are
+    kept so the framing survives a slow producer
+    """
+
+    received = 0
+    while received < len(view):
+        try:
+            count = connection.recv_into(view[received:])
+        except socket.timeout:
+            if running is not None and not running():
+                return False
+            continue
+        if count == 0:
+            return False
+        received += count
+
+    return True
+
+class SocketSampleSource():
+
+    """
+    Listens on a unix domain or localhost TCP socket for framed sample blocks and feeds them to the model from
+    a background thread. Frames are received with recv_into into buffers allocated once, staged into a float64
+    batch and published a batch at a time. While the UI is behind, the drop policy discards every frame and
+    the decimate policy keeps one frame in decimate_factor so the plot still moves, up to the limit of the model
+    """
+
+    def __init__(self, model: PlotControlsModel, address: str, policy: str = "drop", max_frame_samples: int = 1 << 16,
+                 batch_samples: int = 1 << 15, flush_interval: float = 1 / 120, high_water: int = None, decimate_factor: int = 8) -> None:
+
+        if policy not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"Unknown backpressure policy: {policy}")
+
+        self.model             = model
+        self.address           = address
+        self.policy            = policy
+        self.max_frame_samples = max_frame_samples
+        self.flush_interval    = flush_interval
+        self.high_water        = model.max_published_samples // 2 if high_water is None else high_water
+        self.decimate_factor   = decimate_factor
+
+        # Receive and staging buffers, nothing is allocated per frame
+        self.header_buffer  = bytearray(FRAME_HEADER.size)
+        self.payload_buffer = bytearray(max_frame_samples * SAMPLE_DTYPE.itemsize)
+        self.payload        = np.frombuffer(self.payload_buffer, dtype=SAMPLE_DTYPE)
+        self.staging        = np.empty(max(batch_samples, max_frame_samples), dtype=np.float64)
+        self.staged         = 0
+        self.staged_rate    = 0.0
+        self.flush_time     = 0.0
+
+        # Counters, written by the receiving thread only
+        self.bytes          = 0
+        self.frames         = 0
+        self.dropped        = 0
+        self.lost           = 0
+        self.connected      = False
+        self.last_sequence  = None
+        self.decimate_phase = 0
+        self.stats_snapshot = (time.perf_counter(), 0, 0)
+
+        self.running  = False
+        self.listener = None
+        self.thread   = None
+
+    def Start(self) -> "SocketSampleSource":
+        """
+        Bind the socket and start receiving in the background
+        """
+
+        family, address = ParseAddress(self.address)
+        if family == socket.AF_UNIX and os.path.exists(address):
+            os.unlink(address)
+
+        self.listener = socket.socket(family, socket.SOCK_STREAM)
+        if family == socket.AF_INET:
+            self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind(address)
+        self.listener.listen(1)
+
+        # Wake up regularly so Stop does not wait on a blocking call
+        self.listener.settimeout(0.25)
+
+        self.running = True
+        self.thread  = threading.Thread(target=self.__Serve, name="SocketSampleSource", daemon=True)
+        self.thread.start()
+
+        return self
+
+    def Stop(self) -> None:
+        """
+        Stop receiving and close the socket
+        """
+
+        self.running = False
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+        if self.listener is not None:
+            family, address = ParseAddress(self.address)
+            self.listener.close()
+            self.listener = None
+            if family == socket.AF_UNIX and os.path.exists(address):
+                os.unlink(address)
+
+    def IsRunning(self) -> bool:
+        """
+        Get whether the source was started and not stopped yet
+        """
+        return self.running
+
+    def GetStats(self) -> dict:
+        """
+        Get the throughput since the previous call together with the running totals
+        """
+
+        now                                = time.perf_counter()
+        last_time, last_bytes, last_frames = self.stats_snapshot
+        elapsed                            = max(now - last_time, 1e-9)
+        self.stats_snapshot                = (now, self.bytes, self.frames)
+
+        return {
+            "bytes_per_s":  (self.bytes - last_bytes) / elapsed,
+            "frames_per_s": (self.frames - last_frames) / elapsed,
+            "frames":       self.frames,
+            "dropped":      self.dropped,
+            "lost":         self.lost,
+            "connected":    self.connected,
+        }
+
+    def __Serve(self) -> None:
+        """
+        Accept one producer at a time and receive its frames
+        """
+
+        while self.running:
+            try:
+                connection, _ = self.listener.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+
+            with connection:
+                connection.settimeout(0.25)
+                self.connected     = True
+                self.last_sequence = None
+                try:
+                    self.__Receive(connection)
+                except (ConnectionError, ValueError):
+                    pass
+                finally:
+                    self.connected = False
+                    self.__Flush()
+
+    def __Receive(self, connection: socket.socket) -> None:
+        """
+        Receive frames until the producer disconnects or the source is stopped
+        """
+
+        header  = memoryview(self.header_buffer)
+        payload = memoryview(self.payload_buffer)
+        while self.running:
+            try:
+                count = connection.recv_into(header)
+            except socket.timeout:
+
+                # Nothing arrived for a while, do not keep a partial batch back
+                self.__Flush()
+                continue
+            if count == 0:
+                return
+
+            # The rest of the frame is waited for, Stop is still honoured between timeouts
+            complete = ReceiveExactly(connection, header[count:], self.IsRunning)
+            if complete:
+                magic, samples, sequence, sample_rate = FRAME_HEADER.unpack_from(self.header_buffer)
+                if magic != FRAME_MAGIC or samples > self.max_frame_samples:
+                    raise ValueError(f"Malformed frame header from {self.address}")
+                complete = ReceiveExactly(connection, payload[:samples * SAMPLE_DTYPE.itemsize], self.IsRunning)
+            if not complete:
+                return
+
+            self.bytes  += FRAME_HEADER.size + samples * SAMPLE_DTYPE.itemsize
+            self.frames += 1
+
+            # Gaps in the sequence numbers are frames the producer never sent
+            if self.last_sequence is not None and sequence > self.last_sequence + 1:
+                self.lost += sequence - self.last_sequence - 1
+            self.last_sequence = sequence
+
+            if not self.__Admit():
+                self.dropped += 1
+                continue
+
+            if self.staged + samples > len(self.staging) or sample_rate != self.staged_rate:
+                self.__Flush()
+
+            self.staging[self.staged:self.staged + samples] = self.payload[:samples]
+            self.staged     += samples
+            self.staged_rate = sample_rate
+
+            if self.staged >= len(self.staging) // 2 or time.perf_counter() - self.flush_time > self.flush_interval:
+                self.__Flush()
+
+    def __Admit(self) -> bool:
+        """
+        Apply the backpressure policy, returns whether the frame is kept
+        """
+
+        backlog = self.model.GetPublishedBacklog() + self.staged
+        if backlog < self.high_water:
+            self.decimate_phase = 0
+            return True
+
+        # Decimating only slows the backlog down, at the model's limit everything is dropped
+        if self.policy == "drop" or backlog + self.max_frame_samples > self.model.max_published_samples:
+            return False
+
+        self.decimate_phase = (self.decimate_phase + 1) % self.decimate_factor
+        return self.decimate_phase == 1 or self.decimate_factor == 1
+
+    def __Flush(self) -> None:
+        """
+        Publish the staged samples, the model keeps the batch so it is the one copy made
+        """
+
+        self.flush_time = time.perf_counter()
+        if self.staged > 0:
+            self.model.PublishSamples(self.staging[:self.staged].copy(), self.staged_rate)
+            self.staged = 0
+
+def SendFrames(address: str, sample_rate: float = 500_000, frame_samples: int = 4096, frequency: float = 1000.0,
+               duration: float = None, paced: bool = True) -> int:
+    """
+    Stand-in for the acquisition server, connects to the source and sends sine frames paced to sample_rate
+    (or as fast as possible when not paced). Returns the number of frames sent
+    """
+
+    family, address = ParseAddress(address)
+    phase_step      = 2 * np.pi * frequency / sample_rate
+    buffer          = bytearray(FRAME_HEADER.size + frame_samples * SAMPLE_DTYPE.itemsize)
+    samples         = np.frombuffer(buffer, dtype=SAMPLE_DTYPE, offset=FRAME_HEADER.size)
+    start           = time.perf_counter()
+    sent            = 0
+
+    with socket.socket(family, socket.SOCK_STREAM) as connection:
+        connection.connect(address)
+        while duration is None or time.perf_counter() - start < duration:
+            if paced and (sent + 1) * frame_samples > (time.perf_counter() - start) * sample_rate:
+                time.sleep(0.001)
+                continue
+
+            FRAME_HEADER.pack_into(buffer, 0, FRAME_MAGIC, frame_samples, sent, sample_rate)
+            samples[:] = np.sin(phase_step * np.arange(sent * frame_samples, (sent + 1) * frame_samples))
+            connection.sendall(buffer)
+            sent += 1
+
+    return sent
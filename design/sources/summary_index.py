@@ -0,0 +1,442 @@
+from design.sources.file_import import DetectFormat, ReadCaptureLayout
+from typing import Tuple
+import numpy as np
+import threading
+import hashlib
+import typing
+import os
+
+# The sidecar starts with a header, the levels follow it at HEADER_SIZE, finest first
+INDEX_HEADER_DTYPE = np.dtype([
+    ("magic",             "S4"),
+    ("version",           "<u4"),
+    ("dtype",             "S12"),
+    ("channels",          "<u4"),
+    ("channel",           "<u4"),
+    ("base_factor",       "<u4"),
+    ("branching",         "<u4"),
+    ("levels",            "<u4"),
+    ("capacity",          "<u8"),
+    ("indexed",           "<u8"),
+    ("capture_size",      "<u8"),
+    ("capture_mtime",     "<i8"),
+    ("fingerprint_bytes", "<u8"),
+    ("fingerprint",       "S16"),
+])
+HEADER_SIZE   = 128
+INDEX_MAGIC   = b"MMIX"
+INDEX_VERSION = 1
+
+# One summary entry per bucket of the level
+ENTRY_DTYPE = np.dtype([("min", "<f4"), ("max", "<f4"), ("mean", "<f4")])
+
+# The fingerprint covers the start of the capture, so a rewritten capture is noticed even when its size is unchanged
+FINGERPRINT_BYTES = 1 << 16
+
+def ReduceGroups(minimum: np.ndarray, maximum: np.ndarray, total: np.ndarray, count: np.ndarray,
+                 group: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Merge consecutive runs of group entries, the last run may be shorter. Returns the merged entries and the
+    index of the first entry of every run
+    """
+
+    starts = np.arange(0, len(minimum), max(group, 1))
+    if len(starts) == 0 or group <= 1:
+        return minimum, maximum, total, count, np.arange(len(minimum))
+
+    return (np.minimum.reduceat(minimum, starts), np.maximum.reduceat(maximum, starts),
+            np.add.reduceat(total, starts), np.add.reduceat(count, starts), starts)
+
+class SummaryIndex():
+
+    """
+    Hierarchical min/max/mean summary of a raw binary or .npy capture, kept in a sidecar file next to it.
+    Level 0 has one entry per base_factor samples and every further level merges branching entries of the
+    level below, so a viewport of any width is drawn from O(pixels) entries read through a memory map.
+
+    The index is built incrementally, appended samples only summarise the new buckets, and it is rebuilt
+    from scratch when the capture was rewritten or shrank. Levels are laid out for a capacity that doubles
+    as the capture grows. Samples past the last whole bucket are summarised from the capture when queried
+    """
+
+    def __init__(self, path: str, dtype: str = "<f4", channels: int = 1, channel: int = 0, base_factor: int = 256,
+                 branching: int = 16, index_path: str = None, chunk_samples: int = 1 << 22) -> None:
+
+        self.path          = path
+        self.index_path    = path + ".summary" if index_path is None else index_path
+        self.format        = DetectFormat(path)
+        if self.format == "csv":
+            raise ValueError("Only raw binary and .npy captures can be indexed")
+
+        self.dtype         = np.dtype(dtype)
+        self.channels      = channels
+        self.channel       = channel
+        self.base_factor   = base_factor
+        self.branching     = branching
+        self.chunk_samples = max(chunk_samples // base_factor, 1) * base_factor
+
+        # Query at most this many samples past the indexed ones from the capture, beyond it the index is behind
+        self.tail_limit = base_factor * branching
+
+        self.capture      = None
+        self.capture_stat = None
+        self.samples      = 0
+        self.memory       = None
+        self.header       = None
+        self.levels       = []
+        self.rebuilds     = 0
+
+        self.lock     = threading.RLock()
+        self.stop     = threading.Event()
+        self.thread   = None
+        self.Refresh()
+
+    def GetFactor(self, level: int) -> int:
+        """
+        Get the number of samples summarised by one entry of the level
+        """
+        return self.base_factor * self.branching ** level
+
+    def GetIndexed(self) -> int:
+        """
+        Get the number of samples covered by the index
+        """
+        return int(self.header["indexed"]) if self.header is not None else 0
+
+    def IsFresh(self) -> bool:
+        """
+        Does the index cover every whole bucket of the capture
+        """
+        return self.samples - self.GetIndexed() < self.base_factor
+
+    def GetProgress(self) -> float:
+        """
+        Get the fraction of the capture that is indexed
+        """
+        return min(self.GetIndexed() / self.samples, 1.0) if self.samples > 0 else 1.0
+
+    def Refresh(self) -> bool:
+        """
+        Map the capture again if it changed on disk and check the sidecar against it, a stale sidecar is
+        recreated empty and the next Update rebuilds it. Returns whether anything changed
+        """
+
+        stat = os.stat(self.path)
+        if self.capture_stat == (stat.st_size, stat.st_mtime_ns):
+            return False
+
+        with self.lock:
+            offset, frames, dtype, channels, channel = ReadCaptureLayout(self.path, self.format, self.dtype, self.channels, self.channel)
+            self.capture      = np.memmap(self.path, dtype=dtype, mode="r", offset=offset, shape=(frames, channels))[:, channel] if frames > 0 else np.zeros(0, dtype=dtype)
+            self.capture_stat = (stat.st_size, stat.st_mtime_ns)
+            self.samples      = frames
+            self.data_offset  = offset
+            self.capture_key  = (dtype.str.encode(), channels, channel)
+
+            if self.header is None and os.path.exists(self.index_path):
+                self.__Map()
+            if self.header is None or self.__IsStale(stat):
+                self.rebuilds += self.header is not None
+                self.__Create(self.samples)
+            elif self.samples > int(self.header["capacity"]):
+                self.__Grow(self.samples)
+
+            self.header["capture_size"]  = stat.st_size
+            self.header["capture_mtime"] = stat.st_mtime_ns
+
+        return True
+
+    def Update(self, max_samples: int = None) -> int:
+        """
+        Summarise whole buckets of the capture that are not indexed yet, chunk_samples at a time, returns
+        how many samples were indexed
+        """
+
+        self.Refresh()
+
+        start = self.GetIndexed()
+        end   = self.samples - self.samples % self.base_factor
+        if max_samples is not None:
+            end = min(end, start + max(max_samples // self.base_factor, 1) * self.base_factor)
+
+        indexed = start
+        while indexed < end and not self.stop.is_set():
+            stop = min(indexed + self.chunk_samples, end)
+            self.__Summarise(indexed, stop)
+            indexed = stop
+
+        if indexed > start:
+            self.memory.flush()
+
+        return indexed - start
+
+    def StartUpdate(self, on_progress: typing.Any = None, follow: bool = True, poll_interval: float = 0.5) -> "SummaryIndex":
+        """
+        Index in the background, calling on_progress after every chunk. While following, samples appended to
+        the capture are indexed as they arrive until StopUpdate
+        """
+
+        def Run() -> None:
+            while not self.stop.is_set():
+                indexed = self.Update(max_samples=self.chunk_samples)
+                if indexed > 0 and on_progress is not None:
+                    on_progress()
+                if indexed == 0:
+                    if not follow:
+                        break
+                    self.stop.wait(poll_interval)
+
+        self.StopUpdate()
+        self.thread = threading.Thread(target=Run, name="SummaryIndex", daemon=True)
+        self.thread.start()
+
+        return self
+
+    def StopUpdate(self) -> None:
+        """
+        Stop the background indexing after the chunk being summarised
+        """
+        self.stop.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        self.stop.clear()
+
+    def IsUpdating(self) -> bool:
+        """
+        Is the background indexing still catching up with the capture
+        """
+        return self.thread is not None and self.thread.is_alive() and not self.IsFresh()
+
+    def Query(self, first: int, last: int, pixels: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Summarise samples [first, last) in about pixels entries, returns the first sample of every entry and
+        the entry minima, maxima and means. The level is picked so at most branching entries fall on a pixel,
+        which bounds the entries read to O(pixels) whatever the span. Narrow spans read the samples themselves
+        """
+
+        with self.lock:
+            indexed = self.GetIndexed()
+            limit   = self.samples if self.samples - indexed <= self.tail_limit else indexed
+            first   = max(int(first), 0)
+            last    = min(int(last), limit)
+            pixels  = max(int(pixels), 1)
+            if last <= first:
+                empty = np.zeros(0)
+                return empty, empty, empty, empty
+
+            span = last - first
+            if span < self.base_factor * pixels:
+                samples = np.asarray(self.capture[first:last], dtype=np.float64)
+                if span <= 2 * pixels:
+                    return np.arange(first, last, dtype=np.float64), samples, samples, samples
+
+                minimum, maximum, total, count, starts = ReduceGroups(samples, samples, samples, np.ones(span), span // pixels)
+                return (first + starts).astype(np.float64), minimum, maximum, total / count
+
+            # The coarsest level that still gives every pixel at least one entry
+            level = min(int(np.log(span / (self.base_factor * pixels)) / np.log(self.branching) + 1e-9), len(self.levels) - 1)
+            factor                         = self.GetFactor(level)
+            entry_first                    = first // factor
+            entry_last                     = -(-last // factor)
+            minimum, maximum, total, count = self.__Entries(level, entry_first, entry_last, limit)
+
+            minimum, maximum, total, count, starts = ReduceGroups(minimum, maximum, total, count, len(minimum) // pixels)
+            return ((entry_first + starts) * factor).astype(np.float64), minimum, maximum, total / count
+
+    def Close(self) -> None:
+        """
+        Stop indexing and release the memory maps
+        """
+
+        self.StopUpdate()
+        with self.lock:
+            if self.memory is not None:
+                self.memory.flush()
+            self.memory, self.header, self.levels, self.capture = None, None, [], None
+
+    def __Entries(self, level: int, first: int, last: int, limit: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get entries [first, last) of a level as minima, maxima, sums and counts. Stored entries are read from
+        the sidecar and the ones past the index are merged from the level below, down to the capture
+        """
+
+        factor   = self.GetFactor(level)
+        complete = self.GetIndexed() // factor
+        last     = min(last, -(-limit // factor))
+        parts    = []
+
+        if first < min(last, complete):
+            stored = self.levels[level][first:min(last, complete)]
+            parts.append((stored["min"].astype(np.float64), stored["max"].astype(np.float64),
+                          stored["mean"] * np.float64(factor), np.full(len(stored), float(factor))))
+
+        if last > complete:
+            start = max(first, complete)
+            if level == 0:
+                samples = np.asarray(self.capture[start * factor:min(last * factor, limit)], dtype=np.float64)
+                tail    = ReduceGroups(samples, samples, samples, np.ones(len(samples)), factor)[:4]
+            else:
+                lower = self.__Entries(level - 1, start * self.branching, last * self.branching, limit)
+                tail  = ReduceGroups(*lower, self.branching)[:4]
+            parts.append(tail)
+
+        if not parts:
+            empty = np.zeros(0)
+            return empty, empty, empty, empty
+
+        return tuple(np.concatenate(column) for column in zip(*parts))
+
+    def __Summarise(self, start: int, stop: int) -> None:
+        """
+        Summarise samples [start, stop), both whole buckets, into level 0 and merge the new entries upwards.
+        Entries are written before the indexed count moves, so queries never see half written entries
+        """
+
+        blocks = np.asarray(self.capture[start:stop], dtype=np.float32).reshape(-1, self.base_factor)
+        level0 = self.levels[0][start // self.base_factor:stop // self.base_factor]
+        level0["min"]  = blocks.min(axis=1)
+        level0["max"]  = blocks.max(axis=1)
+        level0["mean"] = blocks.mean(axis=1, dtype=np.float64)
+
+        for level in range(1, len(self.levels)):
+            factor = self.GetFactor(level)
+            first  = start // factor
+            last   = stop // factor
+            if last <= first:
+                break
+
+            children = self.levels[level - 1][first * self.branching:last * self.branching].reshape(-1, self.branching)
+            entries  = self.levels[level][first:last]
+            entries["min"]  = children["min"].min(axis=1)
+            entries["max"]  = children["max"].max(axis=1)
+            entries["mean"] = children["mean"].mean(axis=1, dtype=np.float64)
+
+        with self.lock:
+            self.header["indexed"] = stop
+            if int(self.header["fingerprint_bytes"]) < FINGERPRINT_BYTES:
+                self.header["fingerprint_bytes"], self.header["fingerprint"] = self.__Fingerprint()
+
+    def __Fingerprint(self, length: int = None) -> Tuple[int, bytes]:
+        """
+        Hash the start of the capture data, up to FINGERPRINT_BYTES of what is indexed
+        """
+
+        if length is None:
+            length = min(self.GetIndexed() * self.dtype.itemsize * self.channels, FINGERPRINT_BYTES)
+        with open(self.path, "rb") as file:
+            file.seek(self.data_offset)
+            data = file.read(length)
+
+        return len(data), hashlib.blake2b(data, digest_size=16).digest()
+
+    def __IsStale(self, stat: os.stat_result) -> bool:
+        """
+        Was the sidecar built for another layout, or was the capture rewritten or truncated since
+        """
+
+        header = self.header
+        if header["magic"] != INDEX_MAGIC or int(header["version"]) != INDEX_VERSION:
+            return True
+        if (header["dtype"], int(header["channels"]), int(header["channel"])) != self.capture_key:
+            return True
+        if int(header["base_factor"]) != self.base_factor or int(header["branching"]) != self.branching:
+            return True
+        if stat.st_size < int(header["capture_size"]) or int(header["indexed"]) > self.samples:
+            return True
+        if stat.st_size == int(header["capture_size"]) and stat.st_mtime_ns != int(header["capture_mtime"]):
+            return True
+
+        length = int(header["fingerprint_bytes"])
+        return length > 0 and self.__Fingerprint(length) != (length, header["fingerprint"])
+
+    def __Layout(self, capacity: int) -> list:
+        """
+        Get the (offset, entries) of every level for a capacity, levels are added until one entry covers it
+        """
+
+        layout = []
+        offset = HEADER_SIZE
+        level  = 0
+        while True:
+            entries = -(-capacity // self.GetFactor(level))
+            layout.append((offset, entries))
+            offset += entries * ENTRY_DTYPE.itemsize
+            if entries <= 1:
+                return layout
+            level += 1
+
+    def __Map(self) -> None:
+        """
+        Map an existing sidecar, anything unreadable is treated as stale
+        """
+
+        self.memory = np.memmap(self.index_path, dtype=np.uint8, mode="r+")
+        if len(self.memory) < HEADER_SIZE:
+            self.memory, self.header = None, None
+            return
+
+        self.header = self.memory[:INDEX_HEADER_DTYPE.itemsize].view(INDEX_HEADER_DTYPE).reshape(())
+        if self.header["magic"] != INDEX_MAGIC or int(self.header["version"]) != INDEX_VERSION \
+           or int(self.header["base_factor"]) != self.base_factor or int(self.header["branching"]) != self.branching:
+            return
+
+        layout = self.__Layout(int(self.header["capacity"]))
+        if len(self.memory) < layout[-1][0] + layout[-1][1] * ENTRY_DTYPE.itemsize:
+            self.header["magic"] = b""
+            return
+
+        self.levels = [self.memory[offset:offset + entries * ENTRY_DTYPE.itemsize].view(ENTRY_DTYPE) for offset, entries in layout]
+
+    def __Create(self, samples: int, copy_from: "SummaryIndex" = None) -> None:
+        """
+        Write an empty sidecar laid out for at least samples, or one holding the entries of the current one
+        when growing. The file is sparse until the entries are written
+        """
+
+        capacity = self.GetFactor(3)
+        while capacity < samples:
+            capacity *= 2
+
+        layout    = self.__Layout(capacity)
+        size      = layout[-1][0] + layout[-1][1] * ENTRY_DTYPE.itemsize
+        temporary = self.index_path + ".tmp"
+        with open(temporary, "wb") as file:
+            file.truncate(size)
+
+        memory = np.memmap(temporary, dtype=np.uint8, mode="r+")
+        header = memory[:INDEX_HEADER_DTYPE.itemsize].view(INDEX_HEADER_DTYPE).reshape(())
+        levels = [memory[offset:offset + entries * ENTRY_DTYPE.itemsize].view(ENTRY_DTYPE) for offset, entries in layout]
+
+        header["version"]           = INDEX_VERSION
+        header["dtype"], header["channels"], header["channel"] = self.capture_key
+        header["base_factor"]       = self.base_factor
+        header["branching"]         = self.branching
+        header["levels"]            = len(layout)
+        header["capacity"]          = capacity
+        header["indexed"]           = 0
+        header["fingerprint_bytes"] = 0
+
+        # Growing keeps every entry summarised so far
+        if self.header is not None and copy_from is not None:
+            indexed = self.GetIndexed()
+            for level, entries in enumerate(levels[:len(self.levels)]):
+                count          = indexed // self.GetFactor(level)
+                entries[:count] = self.levels[level][:count]
+            header["indexed"]           = indexed
+            header["fingerprint_bytes"] = self.header["fingerprint_bytes"]
+            header["fingerprint"]       = self.header["fingerprint"]
+
+        header["magic"] = INDEX_MAGIC
+        memory.flush()
+
+        self.memory, self.header, self.levels = None, None, []
+        del header, levels, memory
+        os.replace(temporary, self.index_path)
+        self.__Map()
+
+    def __Grow(self, samples: int) -> None:
+        """
+        Lay the sidecar out for a larger capacity, keeping the entries
+        """
+        self.__Create(samples, copy_from=self)
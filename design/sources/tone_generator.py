@@ -0,0 +1,310 @@
+from design.models.plot_controls_model import PlotControlsModel
+from design.sources.file_export import DetectExportFormat, OpenWriter
+from design.sources.socket_source import FRAME_HEADER, FRAME_MAGIC, SAMPLE_DTYPE, ParseAddress
+import numpy as np
+import threading
+import typing
+import socket
+import time
+
+# Sample rates the generator is meant for, any other rate works as well
+GENERATOR_SAMPLE_RATES = (48000, 96000)
+
+class RampedSine():
+
+    """
+    Phase continuous sine generator. The amplitude, height, phase and frequency are moved to their targets
+    with linear ramps lasting ramp_time, interpolated per sample for a whole chunk at once, so changing a
+    parameter never makes the output jump. The phase is accumulated per sample from the ramped frequency
+    """
+
+    def __init__(self, sample_rate: float, chunk_samples: int, ramp_time: float = 0.02) -> None:
+        self.sample_rate   = sample_rate
+        self.chunk_samples = chunk_samples
+        self.ramp_chunks   = max(int(np.ceil(ramp_time * sample_rate / chunk_samples)), 1)
+
+        # Parameters as (amplitude, height, phase, frequency), the ramp ends at target after remaining chunks
+        self.current   = np.zeros(4)
+        self.target    = np.zeros(4)
+        self.remaining = 0
+        self.phase     = 0.0
+
+        # Work buffers, nothing is allocated per chunk
+        self.ramp   = np.arange(1, chunk_samples + 1, dtype=np.float64) / chunk_samples
+        self.values = np.empty((4, chunk_samples))
+        self.step   = np.empty(chunk_samples)
+        self.angle  = np.empty(chunk_samples)
+        self.output = np.empty(chunk_samples)
+
+    def SetTarget(self, amplitude: float, height: float, phase: float, frequency: float) -> None:
+        """
+        Start ramping towards new parameters, a ramp in progress continues from where it got to
+        """
+
+        target = np.array([amplitude, height, phase, frequency], dtype=np.float64)
+        if not np.array_equal(target, self.target):
+            self.target    = target
+            self.remaining = self.ramp_chunks
+
+    def Reset(self, amplitude: float, height: float, phase: float, frequency: float) -> None:
+        """
+        Jump to the parameters without a ramp, used before the first chunk
+        """
+        self.target    = np.array([amplitude, height, phase, frequency], dtype=np.float64)
+        self.current   = self.target.copy()
+        self.remaining = 0
+
+    def Generate(self) -> np.ndarray:
+        """
+        Generate the next chunk, the returned buffer is reused by the next call
+        """
+
+        values = self.values
+        if self.remaining > 0:
+            end = self.current + (self.target - self.current) / self.remaining
+            np.multiply.outer(end - self.current, self.ramp, out=values)
+            values += self.current[:, None]
+            self.current    = end
+            self.remaining -= 1
+        else:
+            values[:] = self.current[:, None]
+
+        # The phase of every sample is the running sum of the per sample steps of the ramped frequency
+        # before it, the accumulator is wrapped once per chunk
+        amplitude, height, phase, frequency = values
+        np.multiply(frequency, 2 * np.pi / self.sample_rate, out=self.step)
+        np.cumsum(self.step, out=self.angle)
+        self.angle -= self.step
+        self.angle += self.phase
+        self.phase  = float(self.angle[-1] + self.step[-1]) % (2 * np.pi)
+
+        self.angle += phase
+        np.sin(self.angle, out=self.output)
+        self.output *= amplitude
+        self.output += height
+
+        return self.output
+
+class NullSink():
+
+    """
+    Discards the chunks, measures the generator and the scheduler on their own
+    """
+
+    def Write(self, chunk: np.ndarray) -> None:
+        pass
+
+    def Close(self) -> None:
+        pass
+
+class ModelSink():
+
+    """
+    Publishes the chunks into the model so the plots show what is being generated
+    """
+
+    def __init__(self, model: PlotControlsModel, sample_rate: float) -> None:
+        self.model       = model
+        self.sample_rate = sample_rate
+
+    def Write(self, chunk: np.ndarray) -> None:
+        self.model.PublishSamples(chunk.copy(), self.sample_rate)
+
+    def Close(self) -> None:
+        pass
+
+class SocketSink():
+
+    """
+    Stand-in for an audio device, sends every chunk as a frame to a SocketSampleSource listening on the
+    address. The send blocks like a device write would, with timeout as the longest wait
+    """
+
+    def __init__(self, address: str, sample_rate: float, chunk_samples: int, timeout: float = 1.0) -> None:
+        family, target   = ParseAddress(address)
+        self.sample_rate = sample_rate
+        self.sequence    = 0
+        self.buffer      = bytearray(FRAME_HEADER.size + chunk_samples * SAMPLE_DTYPE.itemsize)
+        self.samples     = np.frombuffer(self.buffer, dtype=SAMPLE_DTYPE, offset=FRAME_HEADER.size)
+        self.connection  = socket.socket(family, socket.SOCK_STREAM)
+        self.connection.settimeout(timeout)
+        self.connection.connect(target)
+
+    def Write(self, chunk: np.ndarray) -> None:
+        FRAME_HEADER.pack_into(self.buffer, 0, FRAME_MAGIC, len(chunk), self.sequence, self.sample_rate)
+        self.samples[:len(chunk)] = chunk
+        self.connection.sendall(memoryview(self.buffer)[:FRAME_HEADER.size + len(chunk) * SAMPLE_DTYPE.itemsize])
+        self.sequence += 1
+
+    def Close(self) -> None:
+        self.connection.close()
+
+def OpenSink(target: str, sample_rate: float, chunk_samples: int) -> typing.Any:
+    """
+    Create a sink from its description: "null", a socket address (unix:/path or host:port) or a file, whose
+    format follows the extension. Files are written as float samples so the slider range never clips
+    """
+
+    if target == "null":
+        return NullSink()
+    if target.startswith("unix:") or (":" in target and target.rpartition(":")[2].isdigit()):
+        return SocketSink(target, sample_rate, chunk_samples)
+
+    return OpenWriter(target, DetectExportFormat(target), sample_rate, sample_format="float32", dtype="<f4")
+
+class DeadlineScheduler():
+
+    """
+    Runs a RampedSine on a thread and writes its chunks into one or more sinks on a strict schedule. The sinks
+    stand for a device that starts playing after lead chunks were queued and then consumes a chunk every
+    chunk period, so chunk n is due at start + (n + lead) periods. The thread wakes once a period, reads the
+    parameters, generates and writes the chunk. A chunk written after its deadline is an underrun, the clock
+    is moved so the next chunk is lead periods ahead again instead of every following chunk being late.
+    The generation time, the total time per chunk and the slack left before the deadline are kept for the
+    last history chunks
+    """
+
+    def __init__(self, sinks: typing.Any, parameters: typing.Any, sample_rate: float = 48000, chunk_samples: int = 512,
+                 lead: int = 2, ramp_time: float = 0.02, history: int = 4096) -> None:
+
+        self.sinks         = list(sinks) if isinstance(sinks, (list, tuple)) else [sinks]
+        self.parameters    = parameters
+        self.sample_rate   = sample_rate
+        self.chunk_samples = chunk_samples
+        self.period        = chunk_samples / sample_rate
+        self.lead          = lead
+        self.generator     = RampedSine(sample_rate, chunk_samples, ramp_time=ramp_time)
+
+        # Timing of the last history chunks in seconds, written by the scheduler thread only
+        self.generate_times = np.zeros(history)
+        self.write_times    = np.zeros(history)
+        self.slack_times    = np.zeros(history)
+        self.chunks         = 0
+        self.underruns      = 0
+        self.late_time      = 0.0
+        self.error          = None
+        self.stats_snapshot = (time.perf_counter(), 0)
+
+        self.running = False
+        self.thread  = None
+
+    def Start(self) -> "DeadlineScheduler":
+        """
+        Start generating in the background
+        """
+        self.running = True
+        self.thread  = threading.Thread(target=self.__Run, name="DeadlineScheduler", daemon=True)
+        self.thread.start()
+
+        return self
+
+    def Stop(self) -> None:
+        """
+        Stop generating and close the sinks
+        """
+
+        self.running = False
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+        for sink in self.sinks:
+            sink.Close()
+
+    def Run(self, seconds: float) -> "DeadlineScheduler":
+        """
+        Generate for a number of seconds on the calling thread and close the sinks
+        """
+        self.running = True
+        self.__Run(seconds)
+        self.Stop()
+
+        return self
+
+    def GetTimings(self) -> dict:
+        """
+        Get the percentiles of the generation time, the time per chunk including the sink writes and the
+        slack before the deadline over the chunks kept, in milliseconds
+        """
+
+        count = min(self.chunks, len(self.generate_times))
+        if count == 0:
+            return {}
+
+        timings = {}
+        for name, times in (("generate", self.generate_times), ("chunk", self.write_times), ("slack", self.slack_times)):
+            p50, p95, p99             = np.percentile(times[:count], (50, 95, 99)) * 1e3
+            timings[f"{name}_ms_p50"] = p50
+            timings[f"{name}_ms_p95"] = p95
+            timings[f"{name}_ms_p99"] = p99
+        timings["generate_ms_max"] = self.generate_times[:count].max() * 1e3
+        timings["slack_ms_min"]    = self.slack_times[:count].min() * 1e3
+
+        return timings
+
+    def GetStats(self) -> dict:
+        """
+        Get the throughput since the previous call together with the underruns and the timing percentiles, in
+        the shape the view shows for external sources with the underruns as the dropped chunks
+        """
+
+        now                      = time.perf_counter()
+        last_time, last_chunks   = self.stats_snapshot
+        elapsed                  = max(now - last_time, 1e-9)
+        self.stats_snapshot      = (now, self.chunks)
+        chunks                   = self.chunks - last_chunks
+
+        stats = {
+            "bytes_per_s":  chunks * self.chunk_samples * SAMPLE_DTYPE.itemsize / elapsed,
+            "frames_per_s": chunks / elapsed,
+            "frames":       self.chunks,
+            "dropped":      self.underruns,
+            "underruns":    self.underruns,
+            "late_ms":      self.late_time * 1e3,
+        }
+        stats.update(self.GetTimings())
+
+        return stats
+
+    def __Run(self, seconds: float = None) -> None:
+        """
+        Generate and write a chunk every period until stopped
+        """
+
+        history = len(self.generate_times)
+        self.generator.Reset(*self.parameters())
+        start   = time.perf_counter()
+        chunk   = 0
+
+        try:
+            while self.running and (seconds is None or chunk * self.period < seconds):
+
+                # Sleep until the chunk lead periods before its deadline is due
+                wake = start + chunk * self.period
+                now  = time.perf_counter()
+                if wake > now:
+                    time.sleep(wake - now)
+
+                began = time.perf_counter()
+                self.generator.SetTarget(*self.parameters())
+                samples   = self.generator.Generate()
+                generated = time.perf_counter()
+                for sink in self.sinks:
+                    sink.Write(samples)
+                finished  = time.perf_counter()
+
+                deadline                                   = start + (chunk + self.lead) * self.period
+                self.generate_times[self.chunks % history] = generated - began
+                self.write_times[self.chunks % history]    = finished - began
+                self.slack_times[self.chunks % history]    = deadline - finished
+                self.chunks                               += 1
+                chunk                                     += 1
+
+                # The device ran dry, start counting from now with the full lead again
+                if finished > deadline:
+                    self.underruns += 1
+                    self.late_time += finished - deadline
+                    start          += finished - deadline
+        except Exception as error:
+            self.error   = error
+            self.running = False
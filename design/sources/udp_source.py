@@ -0,0 +1,105 @@
+from design.models.plot_controls_model import PlotControlsModel
+import numpy as np
+import asyncio
+import time
+
+# Every datagram is a packet of little endian float32 samples
+SAMPLE_DTYPE = np.dtype("<f4")
+
+class UdpSampleProtocol(asyncio.DatagramProtocol):
+
+    """
+    Decodes the datagrams as they arrive and queues them for the publishing task
+    """
+
+    def __init__(self, queue: asyncio.Queue) -> None:
+        self.queue     = queue
+        self.datagrams = 0
+
+    def datagram_received(self, data: bytes, address: tuple) -> None:
+        self.datagrams += 1
+        self.queue.put_nowait(np.frombuffer(data, dtype=SAMPLE_DTYPE))
+
+class UdpSampleReceiver():
+
+    """
+    Listens on a local UDP port and publishes the received samples into the model. Everything that arrived
+    while the task was waiting is published as one chunk, so the model sees a handful of chunks per frame
+    rather than one per datagram
+    """
+
+    def __init__(self, model: PlotControlsModel, sample_rate: float, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.model       = model
+        self.sample_rate = sample_rate
+        self.host        = host
+        self.port        = port
+        self.samples     = 0
+        self.queue       = None
+        self.transport   = None
+        self.protocol    = None
+
+    async def Open(self) -> "UdpSampleReceiver":
+        """
+        Bind the socket, port 0 picks a free port which is stored in port
+        """
+        self.queue                    = asyncio.Queue()
+        self.transport, self.protocol = await asyncio.get_running_loop().create_datagram_endpoint(
+            lambda: UdpSampleProtocol(self.queue), local_addr=(self.host, self.port)
+        )
+        self.port = self.transport.get_extra_info("sockname")[1]
+
+        return self
+
+    async def Run(self) -> None:
+        """
+        Publish the received samples until cancelled
+        """
+
+        if self.transport is None:
+            await self.Open()
+
+        try:
+            while True:
+                chunks = [await self.queue.get()]
+                while not self.queue.empty():
+                    chunks.append(self.queue.get_nowait())
+
+                samples       = np.concatenate(chunks)
+                self.samples += len(samples)
+                await self.model.PublishSamplesAsync(samples, self.sample_rate)
+        finally:
+            self.Close()
+
+    def Close(self) -> None:
+        """
+        Close the socket
+        """
+        if self.transport is not None:
+            self.transport.close()
+            self.transport = None
+
+async def SendSine(host: str, port: int, sample_rate: float = 500_000, frequency: float = 1000.0, amplitude: float = 1.0,
+                   packet_samples: int = 4096, duration: float = None) -> int:
+    """
+    Stand-in for a real UDP source, sends a sine wave paced against the clock so the long run rate is exactly
+    sample_rate. Packets that fell due while the coroutine was suspended are sent as a burst. Returns the
+    number of samples sent
+    """
+
+    transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(asyncio.DatagramProtocol, remote_addr=(host, port))
+    phase_step   = 2 * np.pi * frequency / sample_rate
+    start        = time.perf_counter()
+    sent         = 0
+
+    try:
+        while duration is None or sent < duration * sample_rate:
+            due = int((time.perf_counter() - start) * sample_rate)
+            while sent + packet_samples <= due:
+                packet = amplitude * np.sin(phase_step * np.arange(sent, sent + packet_samples))
+                transport.sendto(packet.astype(SAMPLE_DTYPE).tobytes())
+                sent += packet_samples
+            await asyncio.sleep(0.002)
+    finally:
+        transport.close()
+
+    return sent
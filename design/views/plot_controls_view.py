@@ -1,6 +1,8 @@
+from design.dsp.biquad_filter import FILTER_TYPES
 import controls as cc
 import tkinter as tk
 import numpy as np
+import asyncio
 import typing
 import os
 
@@ -31,6 +33,21 @@ class PlotControlsView():
 
         # State variables
         self.length_of_plot = 1
+        self.stats_interval = 1.0
+        self.stats_time     = 0.0
+
+        # An external sample source reporting its throughput through GetStats, shown with the frame statistics
+        self.source = None
+
+        # Paces the main loop, any input wakes it from the idle rate
+        self.governor = cc.FrameGovernor(target_fps=60, idle_fps=10)
+        cc.Mouse.RegisterMouseMoveEventHandler(callback=self.governor.Wake)
+        cc.Mouse.RegisterMouseClickEventHandler(callback=self.governor.Wake)
+        cc.Mouse.RegisterMouseWheelEventHandler(callback=self.governor.Wake)
+        cc.Keyboard.RegisterKeyPressEventHandler(callback=self.governor.Wake)
+
+        # View updates posted by other threads, drained on the render thread at the top of every frame
+        self.command_queue = cc.CommandQueue(batch_size=4096, on_post=self.governor.Wake)
 
         # Create the main window
         self.main_window = cc.Window()
@@ -57,7 +74,8 @@ class PlotControlsView():
             width=self.plot_window_width,
             height=int(self.plot_window_height / 2),
             parent=self.plot_window,
-            pos=[0, 0]
+            pos=[0, 0],
+            crosshairs=True
         )
         self.time_plot.SwitchThemeComponent(theme_component=self.time_plot.line_theme_component)
         self.time_plot.SetPlotLineColor(color=[36, 183, 199])
@@ -74,7 +92,8 @@ class PlotControlsView():
             width=self.plot_window_width,
             height=int(self.plot_window_height / 2),
             parent=self.plot_window,
-            pos=[0, self.time_plot.GetPosition()[1] + self.time_plot.GetHeight()]
+            pos=[0, self.time_plot.GetPosition()[1] + self.time_plot.GetHeight()],
+            crosshairs=True
         )
         self.freq_plot.SwitchThemeComponent(theme_component=self.freq_plot.line_theme_component)
         self.freq_plot.SetPlotLineColor(color=[36, 183, 199])
@@ -89,11 +108,25 @@ class PlotControlsView():
             height=self.control_window_height,
             parent=self.main_window,
             pos=[self.plot_window_width, 0],
+            add_menubar=True,
             no_scrollbar=True
         )
 
-        # Create a label to show the controls
-        self.group1         = cc.Group(parent=self.control_window, pos=[0, 0])
+        # Create the file menu, the export items carry the format and the WAV sample format as user data
+        self.file_menu = self.control_window.menu_bar.AddMenu(label="File")
+        self.file_menu.AddMenuItem(label="Export WAV 16-bit...", user_data=("wav", "pcm16"))
+        self.file_menu.AddMenuItem(label="Export WAV 24-bit...", user_data=("wav", "pcm24"))
+        self.file_menu.AddMenuItem(label="Export WAV 32-bit...", user_data=("wav", "pcm32"))
+        self.file_menu.AddMenuItem(label="Export WAV Float...", user_data=("wav", "float32"))
+        self.file_menu.AddMenuItem(label="Export CSV...", user_data=("csv", None))
+        self.file_menu.AddMenuItem(label="Export NPY...", user_data=("npy", None))
+        self.file_menu.AddMenuItem(label="Cancel Export")
+        self.export_menu_items  = self.file_menu.children[:-1]
+        self.cancel_export_item = self.file_menu.children[-1]
+        self.export_dialog = cc.FileDialog(label="Export Signal", extensions=[".wav", ".csv", ".npy"], default_filename="signal")
+
+        # Create a label to show the controls, below the menu bar
+        self.group1         = cc.Group(parent=self.control_window, pos=[0, 20])
         self.group1.ChangePadding(window_pad=[0, 0], frame_pad=[10, 10], item_spacing=[0, 0])
         self.group1.BindTheme()
         self.controls_label = cc.Label(label="   Controls", parent=self.group1)
@@ -124,11 +157,175 @@ class PlotControlsView():
         self.angular_label     = cc.Label(label=f"Angular Freq: {'{:.3f}'.format(2 * np.pi * self.frequency_slider.GetValue())}", parent=self.group3, pos=[20, 190])
         self.period_label      = cc.Label(label=f"Period: {'{:.3f}'.format(1 / self.frequency_slider.GetValue())}", parent=self.group3, pos=[20, 210])
         self.normalize_freq    = cc.CheckBox(label="Normalize Frequency", parent=self.group3, pos=[20, 230])
+        self.stream_waveform   = cc.CheckBox(label="Stream Waveform", parent=self.group3, pos=[20, 250])
+        self.filter_combo      = cc.ComboBox(items=list(FILTER_TYPES), default_value=FILTER_TYPES[0], label="Filter", width=140, parent=self.group3, pos=[20, 270])
+        self.cutoff_slider     = cc.Slider(type=float, label="Filter Cutoff", width=140, height=100, parent=self.group3, pos=[20, 290], min_value=1.0, max_value=1000.0, default_value=50.0)
+
+        # Create labels for the measurements taken from the generated signal
+        self.rms_label          = cc.Label(label="RMS: -", parent=self.group3, pos=[20, 310])
+        self.mean_label         = cc.Label(label="Mean: -", parent=self.group3, pos=[20, 330])
+        self.peak_to_peak_label = cc.Label(label="Peak-to-Peak: -", parent=self.group3, pos=[20, 350])
+        self.zero_cross_label   = cc.Label(label="Zero Cross Freq: -", parent=self.group3, pos=[20, 370])
+        self.thd_label          = cc.Label(label="THD: -", parent=self.group3, pos=[20, 390])
+        self.snr_label          = cc.Label(label="SNR: -", parent=self.group3, pos=[20, 410])
+
+        # Create a table listing the strongest tones found in the spectrum
+        self.max_peaks  = 5
+        self.peak_table = cc.Table(
+            width=self.control_window_width - 40,
+            parent=self.group3,
+            pos=[20, 440],
+            borders_innerH=True, borders_outerH=True,
+            borders_innerV=True, borders_outerV=True
+        )
+        self.peak_table.AddColumn(label="#")
+        self.peak_table.AddColumn(label="Frequency")
+        self.peak_table.AddColumn(label="Magnitude")
+        self.peak_table_cells = []
+        for peak in range(self.max_peaks):
+            row = self.peak_table.AddRow()
+            self.peak_table_cells.append([cc.Label(label=f"{peak + 1}", parent=row), cc.Label(label="-", parent=row), cc.Label(label="-", parent=row)])
+
+        # Create labels for the goertzel tracker following the slider frequency and its harmonics
+        self.tracked_harmonics   = 4
+        self.tone_tracker_labels = [cc.Label(label=f"H{harmonic + 1}: -", parent=self.group3, pos=[20, 560 + 20 * harmonic]) for harmonic in range(self.tracked_harmonics)]
+
+        # Create a checkbox to evaluate the spectrum over the visible frequency band only
+        self.zoom_bins     = self.plot_window_width
+        self.zoom_spectrum = cc.CheckBox(label="Zoom Spectrum", parent=self.group3, pos=[20, 650])
+
+        # Create a floating window to inspect the exact sample values of both plots
+        self.sample_inspector = cc.CheckBox(label="Sample Inspector", parent=self.group3, pos=[20, 670])
+
+        # Create a label showing the sample nearest to the mouse on either plot
+        self.hover_label = cc.Label(label="Cursor: -", parent=self.group3, pos=[20, 690])
+
+        # Create a checkbox to fit the time plot to percentile limits instead of the extremes
+        self.fit_percentile = 1.0
+        self.robust_fit     = cc.CheckBox(label="Robust Y Fit", parent=self.group3, pos=[20, 710])
+
+        # Create a label reporting the frame rate and what each frame costs
+        self.frame_stats_label = cc.Label(label="Frame: -", parent=self.group3, pos=[20, 730])
+        self.queue_stats_label = cc.Label(label="Queue: -", parent=self.group3, pos=[20, 750])
+        self.source_stats_label = cc.Label(label="Source: -", parent=self.group3, pos=[20, 770])
+        self.stage_stats_label  = cc.Label(label="Stages: -", parent=self.group3, pos=[20, 865])
+
+        # Create the controls for importing a signal file, the indicator spins while it loads
+        self.import_button        = cc.Button(label="Import File", width=140, height=20, parent=self.group3, pos=[20, 795])
+        self.cancel_import_button = cc.Button(label="Cancel Import", width=140, height=20, parent=self.group3, pos=[180, 795])
+        self.import_indicator     = cc.LoadingIndicator(parent=self.group3, pos=[20, 820], radius=1.5)
+        self.import_label         = cc.Label(label="Import: -", parent=self.group3, pos=[50, 825])
+        self.import_dialog        = cc.FileDialog(label="Import Signal", extensions=[".csv", ".npy", ".bin", ".*"])
+        self.export_label         = cc.Label(label="Export: -", parent=self.group3, pos=[20, 845])
+        self.cancel_import_button.Hide()
+        self.import_indicator.Hide()
+        self.inspector_window = cc.Window(
+            label="Sample Inspector",
+            width=460,
+            height=560,
+            pos=[self.plot_window_width - 480, 20],
+            no_close=True,
+            no_saved_settings=True
+        )
+        self.inspector_window.Hide()
+        self.inspector_tabs = cc.TabBar(parent=self.inspector_window)
+
+        # Time domain samples
+        self.time_tab         = self.inspector_tabs.AddTab(label="Time")
+        self.time_jump_group  = cc.Group(horizontal=True, parent=self.time_tab)
+        self.time_jump_input  = cc.InputTextBox(hint="Jump to x", width=200, parent=self.time_jump_group, decimal=True, on_enter=True)
+        self.time_jump_button = cc.Button(label="Jump", width=60, parent=self.time_jump_group)
+        self.time_table       = cc.DataTable(
+            columns=["Index", "X", "Y"],
+            formats={"X": "{:.6f}", "Y": "{:.6f}"},
+            parent=self.time_tab,
+            sortable=True,
+            row_background=True,
+            borders_innerV=True
+        )
+
+        # Frequency domain bins
+        self.freq_tab         = self.inspector_tabs.AddTab(label="Spectrum")
+        self.freq_jump_group  = cc.Group(horizontal=True, parent=self.freq_tab)
+        self.freq_jump_input  = cc.InputTextBox(hint="Jump to frequency", width=200, parent=self.freq_jump_group, decimal=True, on_enter=True)
+        self.freq_jump_button = cc.Button(label="Jump", width=60, parent=self.freq_jump_group)
+        self.freq_table       = cc.DataTable(
+            columns=["Bin", "Frequency", "Magnitude"],
+            formats={"Frequency": "{:.6f}", "Magnitude": "{:.6f}"},
+            parent=self.freq_tab,
+            sortable=True,
+            row_background=True,
+            borders_innerV=True
+        )
         #-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 
-    def Run(self, callback: typing.Any = None) -> None:
+    def UpdateFrameStats(self) -> None:
         """
-        Run the main loop for rendering.
+        Show the frame rate and the cpu time per frame reported by the governor, the command queue metrics
+        and the throughput of the external source
+        """
+        stats = self.governor.GetStats()
+        if stats:
+            self.frame_stats_label.BindValue(f"Frame: {'{:.0f}'.format(stats['fps'])} fps{' (idle)' if stats['idle'] else ''}, "
+                                             f"cpu {'{:.2f}'.format(stats['cpu_ms'])} ms, p95 {'{:.2f}'.format(stats['cpu_ms_p95'])} ms")
+
+        stats = self.command_queue.GetStats()
+        self.queue_stats_label.BindValue(f"Queue: depth {stats['depth']} (max {stats['max_depth']}), "
+                                         f"latency {'{:.2f}'.format(stats['latency_ms'])} ms, p95 {'{:.2f}'.format(stats['latency_ms_p95'])} ms")
+
+        if self.source is not None:
+            stats = self.source.GetStats()
+            if stats.get("error") is not None:
+                self.source_stats_label.BindValue(f"Source: {stats['error']}")
+                return
+
+            timing = f", chunk p99 {'{:.2f}'.format(stats['generate_ms_p99'])} ms" if "generate_ms_p99" in stats else ""
+            self.source_stats_label.BindValue(f"Source: {'{:.2f}'.format(stats['bytes_per_s'] / 1e6)} MB/s, "
+                                              f"{'{:.0f}'.format(stats['frames_per_s'])} frames/s, dropped {stats['dropped']}{timing}")
+
+    def Run(self, callback: typing.Any = None, is_dirty: typing.Any = None) -> None:
+        """
+        Run the main loop for rendering. When is_dirty is given the callback is only called on the
+        frames it returns true for
+        """
+
+        self.__ShowViewport()
+
+        # Main loop
+        while cc.dpg.is_dearpygui_running():
+            dirty = self.__RenderFrame(callback, is_dirty)
+
+            # Sleep until the next frame is due
+            self.governor.EndFrame(active=dirty)
+
+        self.__DestroyViewport()
+
+    async def RunAsync(self, callback: typing.Any = None, is_dirty: typing.Any = None, tasks: typing.Iterable[typing.Any] = ()) -> None:
+        """
+        Run the main loop as a task on the running asyncio event loop. Between frames the loop awaits instead
+        of sleeping, so producers and processing stages given as coroutines in tasks run in the gaps. They are
+        cancelled when the window is closed
+        """
+
+        self.__ShowViewport()
+        running = [asyncio.ensure_future(task) for task in tasks]
+
+        try:
+            while cc.dpg.is_dearpygui_running():
+                dirty = self.__RenderFrame(callback, is_dirty)
+
+                # Hand the rest of the frame to the other tasks
+                await self.governor.EndFrameAsync(active=dirty)
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+
+            self.__DestroyViewport()
+
+    def __ShowViewport(self) -> None:
+        """
+        Create, setup and show the viewport
         """
 
         # Set a primary window which will always be drawn in the background
@@ -154,15 +351,37 @@ class PlotControlsView():
         # Show the main window created by the operating system
         cc.dpg.show_viewport()
 
-        # Main loop
-        while cc.dpg.is_dearpygui_running():
+    def __RenderFrame(self, callback: typing.Any, is_dirty: typing.Any) -> bool:
+        """
+        Do the work of one frame and render it, returns true if the frame had any work
+        """
+
+        self.governor.BeginFrame()
 
-            # Call a user defined function here
-            if callback is not None:
-                callback()
+        # Apply the view updates posted by other threads first
+        drained = self.command_queue.Drain()
 
-            # Render the GUI frame
-            cc.dpg.render_dearpygui_frame()
+        # Call a user defined function here, only when the frame has work to do
+        dirty = is_dirty is None or is_dirty() or drained > 0
+        if callback is not None and dirty:
+            callback()
 
-        # Destroy the DearPyGUI context
-        cc.dpg.destroy_context()
\ No newline at end of file
+        # Report the frame statistics about once a second
+        if self.governor.frame_start - self.stats_time > self.stats_interval:
+            self.stats_time = self.governor.frame_start
+            self.UpdateFrameStats()
+
+        # Push the values that changed this frame in one batch
+        cc.ValueBinder.Flush()
+
+        # Render the GUI frame
+        cc.dpg.render_dearpygui_frame()
+
+        return dirty
+
+    def __DestroyViewport(self) -> None:
+        """
+        Destroy the DearPyGUI context
+        """
+        cc.dpg.destroy_context()
+        cc.ValueBinder.Clear()
\ No newline at end of file
@@ -1,8 +1,21 @@
 from design.controllers._controller import MainController
+from design.sources.socket_source import BACKPRESSURE_POLICIES
+from design.sources.tone_generator import GENERATOR_SAMPLE_RATES
+import argparse
 
 def main() -> None:
 
-    MainController()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--udp-demo", action="store_true", help="Stream a 500k samples/s sine from a local UDP source")
+    parser.add_argument("--shared-memory", default=None, metavar="NAME", help="Stream the samples of a shared memory ring producer")
+    parser.add_argument("--socket", default=None, metavar="ADDRESS", help="Receive framed samples on unix:/path or host:port")
+    parser.add_argument("--socket-policy", default="drop", choices=BACKPRESSURE_POLICIES, help="What to do with frames while the UI is behind")
+    parser.add_argument("--generate", default=None, metavar="SINK", help="Run the sliders as an audio rate sine into null, unix:/path, host:port or a .wav/.csv/.npy file")
+    parser.add_argument("--generate-rate", default=48000, type=int, choices=GENERATOR_SAMPLE_RATES, help="Sample rate of the generator")
+    args   = parser.parse_args()
+
+    MainController(udp_demo=args.udp_demo, shared_memory=args.shared_memory, socket=args.socket, socket_policy=args.socket_policy,
+                   generate=args.generate, generate_rate=args.generate_rate)
 
     return 0
 
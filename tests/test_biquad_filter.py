@@ -0,0 +1,65 @@
+from unittest import mock
+import numpy as np
+import pytest
+
+from design.dsp import biquad_filter
+from design.dsp.biquad_filter import BiquadFilter, DesignButterworth
+
+@pytest.fixture(params=["scipy", "numpy"])
+def backend(request):
+    if request.param == "scipy":
+        if biquad_filter.scipy_signal is None:
+            pytest.skip("SciPy is not installed")
+        yield request.param
+    else:
+        with mock.patch.object(biquad_filter, "scipy_signal", None):
+            yield request.param
+
+@pytest.mark.parametrize("filter_type", ["Low Pass", "High Pass", "Band Pass", "Notch"])
+def test_chunked_matches_single_pass(backend, filter_type):
+    rng    = np.random.default_rng(0)
+    signal = rng.standard_normal(4096)
+    sos    = DesignButterworth(filter_type, 1000.0, 48000.0, order=4)
+
+    expected = BiquadFilter(sos).Process(signal)
+
+    chunked  = BiquadFilter(sos)
+    output   = np.concatenate([chunked.Process(chunk) for chunk in np.array_split(signal, 37)])
+
+    np.testing.assert_allclose(output, expected, rtol=1e-12, atol=1e-12)
+
+def test_chunked_matches_single_pass_multichannel(backend):
+    rng    = np.random.default_rng(1)
+    signal = rng.standard_normal((2048, 3))
+    sos    = DesignButterworth("Low Pass", 2000.0, 48000.0, order=6)
+
+    expected = BiquadFilter(sos, channels=3).Process(signal)
+
+    chunked  = BiquadFilter(sos, channels=3)
+    output   = np.concatenate([chunked.Process(chunk) for chunk in np.array_split(signal, 11)])
+
+    np.testing.assert_allclose(output, expected, rtol=1e-12, atol=1e-12)
+
+def test_backends_agree():
+    if biquad_filter.scipy_signal is None:
+        pytest.skip("SciPy is not installed")
+
+    signal = np.random.default_rng(2).standard_normal(1024)
+    sos    = DesignButterworth("High Pass", 500.0, 48000.0)
+
+    with_scipy = BiquadFilter(sos).Process(signal)
+    with mock.patch.object(biquad_filter, "scipy_signal", None):
+        with_numpy = BiquadFilter(sos).Process(signal)
+
+    np.testing.assert_allclose(with_numpy, with_scipy, rtol=1e-9, atol=1e-12)
+
+def test_reset_clears_state(backend):
+    sos    = DesignButterworth("Low Pass", 1000.0, 48000.0)
+    filter = BiquadFilter(sos)
+    signal = np.ones(256)
+
+    first = filter.Process(signal)
+    filter.Reset()
+
+    np.testing.assert_array_equal(filter.GetState(), 0.0)
+    np.testing.assert_allclose(filter.Process(signal), first)
@@ -0,0 +1,76 @@
+import threading
+
+import dearpygui.dearpygui as dpg
+import pytest
+
+from controls import CommandQueue, Label, Plot, ThemeRegistry, ValueBinder, Window
+
+@pytest.fixture
+def window():
+    dpg.create_context()
+    yield Window()
+    ValueBinder.Clear()
+    ThemeRegistry.Clear()
+    dpg.destroy_context()
+
+def test_newest_command_per_target_runs_in_first_post_order():
+    queue = CommandQueue()
+    calls = []
+    for target, value in [("a", 1), ("b", 1), ("a", 2), ("c", 1), ("b", 2), ("a", 3)]:
+        queue.Post(target, calls.append, (target, value))
+
+    assert queue.Drain() == 3
+    assert calls == [("a", 3), ("b", 2), ("c", 1)]
+    assert queue.GetDepth() == 0 and queue.Drain() == 0
+
+    stats = queue.GetStats()
+    assert (stats["executed"], stats["collapsed"], stats["max_depth"]) == (3, 3, 6)
+
+def test_drain_is_bounded_by_the_batch_size():
+    queue = CommandQueue(batch_size=4)
+    calls = []
+    for value in range(10):
+        queue.Post(value, calls.append, value)
+
+    assert queue.Drain() == 4
+    assert queue.GetDepth() == 6
+    assert queue.Drain() == 4 and queue.Drain() == 2
+    assert calls == list(range(10))
+
+def test_posts_from_many_threads_are_all_seen():
+    wakes  = []
+    queue  = CommandQueue(batch_size=10000, on_post=lambda: wakes.append(None))
+    values = {}
+
+    def Produce(thread):
+        for value in range(2000):
+            queue.Post(thread % 3, values.__setitem__, thread % 3, value)
+
+    threads = [threading.Thread(target=Produce, args=(thread,)) for thread in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(wakes) == queue.GetDepth() == 8000
+    queue.Drain()
+
+    # Target 0 gets the posts of threads 0 and 3, whichever finished last wins
+    assert values == {0: 1999, 1: 1999, 2: 1999}
+    assert queue.GetStats()["collapsed"] == 8000 - 3
+
+def test_view_updates_run_on_drain(window):
+    queue = CommandQueue()
+    label = Label(label='', parent=window)
+    plot  = Plot(x_label="x", y_label="y", parent=window)
+
+    queue.PostValue(label, "old")
+    queue.PostValue(label, "new")
+    queue.PostLineSeries(plot, x_data=[0.0, 1.0], y_data=[2.0, 3.0])
+    assert dpg.get_value(label.tag) == ''
+
+    # Values go through the ValueBinder, which writes them on the next flush
+    assert queue.Drain() == 2
+    ValueBinder.Flush()
+    assert dpg.get_value(label.tag) == "new"
+    assert plot.GetDataBounds() == (0.0, 1.0, 2.0, 3.0)
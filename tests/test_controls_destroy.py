@@ -0,0 +1,52 @@
+import gc
+import dearpygui.dearpygui as dpg
+import pytest
+
+from controls import Button, ChildWindow, ControlRegistry, Group, Label, Table, ThemeRegistry, Window
+
+@pytest.fixture
+def window():
+    dpg.create_context()
+    yield Window()
+    ThemeRegistry.Clear()
+    dpg.destroy_context()
+
+def BuildPanel(window: Window) -> ChildWindow:
+    panel = ChildWindow(width=200, height=200, parent=window)
+    panel.ChangeBackgroundColor([20, 20, 20]).BindTheme()
+    group = Group(parent=panel)
+    for index in range(20):
+        Button(label=f"Button {index}", parent=group).ChangeBackgroundColor([index, 0, 0]).BindTheme()
+        Label(label=f"Label {index}", parent=group)
+    table = Table(parent=panel)
+    table.AddColumn(label="Column")
+    table.AddRow().AddEmptyColumnEntry()
+
+    return panel
+
+# Listing every item while a table column exists crashes DearPyGUI, so items are only counted between panels
+def Counts() -> tuple:
+    gc.collect()
+    return len(dpg.get_all_items()), ControlRegistry.Count(), len(ThemeRegistry.themes)
+
+def test_destroy_releases_items_controls_and_themes(window):
+
+    # Warm up so anything created once per context already exists
+    BuildPanel(window).Destroy()
+    before = Counts()
+
+    for _ in range(50):
+        BuildPanel(window).Destroy()
+
+    assert Counts() == before
+
+def test_destroy_removes_the_whole_subtree(window):
+    before = Counts()
+    panel  = BuildPanel(window)
+
+    assert ControlRegistry.Count() > before[1] and len(ThemeRegistry.themes) > before[2]
+
+    panel.Destroy()
+    del panel
+
+    assert Counts() == before
@@ -0,0 +1,71 @@
+import dearpygui.dearpygui as dpg
+import numpy as np
+import pytest
+
+from controls import DataTable, ThemeRegistry, ValueBinder, Window
+
+@pytest.fixture
+def window():
+    dpg.create_context()
+    yield Window()
+    ValueBinder.Clear()
+    ThemeRegistry.Clear()
+    dpg.destroy_context()
+
+def FirstRowIndex(table: DataTable) -> int:
+    return int(dpg.get_value(table.cells[0][0].tag))
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_scroll_to_data_row_in_sorted_table(window, descending):
+    values = np.random.default_rng(0).integers(0, 50, 1000).astype(np.float64)
+    table  = DataTable(["index", "value"], visible_rows=10, parent=window)
+    table.SetData({"index": np.arange(len(values)), "value": values}).SortByColumn("value", descending=descending)
+
+    for data_row in (0, 17, 500, 985):
+        table.ScrollToDataRow(data_row)
+        display_row = int(np.flatnonzero(table.order == data_row)[0])
+        if display_row <= len(values) - 10:
+            assert FirstRowIndex(table) == data_row
+        assert table.first_row == min(display_row, len(values) - 10)
+
+def ScrollTable(monkeypatch, table: DataTable, row: float) -> None:
+    monkeypatch.setattr(dpg, "get_y_scroll", lambda item: row * table.row_height)
+
+@pytest.mark.parametrize("row, expected", [(-5, 0), (0, 0), (89, 89), (90, 90), (95, 90), (1000, 90)])
+def test_scroll_is_clamped_to_the_last_full_page(window, monkeypatch, row, expected):
+    table = DataTable(["index"], visible_rows=10, parent=window).SetData({"index": np.arange(100)})
+
+    ScrollTable(monkeypatch, table, row)
+    table.Update()
+
+    assert table.first_row == expected
+    assert FirstRowIndex(table) == expected
+    assert int(dpg.get_value(table.cells[-1][0].tag)) == expected + 9
+
+def test_short_data_is_shown_from_the_top(window, monkeypatch):
+    table = DataTable(["index"], visible_rows=10, parent=window).SetData({"index": np.arange(4)})
+
+    ScrollTable(monkeypatch, table, 3)
+    table.Update()
+
+    assert table.first_row == 0
+    assert [dpg.get_value(row[0].tag) for row in table.cells] == ["0", "1", "2", "3"] + [""] * 6
+
+def test_update_past_the_end_does_not_rewrite_rows(window, monkeypatch):
+    table = DataTable(["index"], visible_rows=10, parent=window).SetData({"index": np.arange(100)})
+
+    writes = []
+    materialize = table._DataTable__Materialize
+    monkeypatch.setattr(table, "_DataTable__Materialize", lambda first: writes.append(first) or materialize(first))
+
+    # Scrolled to the bottom the raw first row is past the last full page on every frame
+    ScrollTable(monkeypatch, table, 97)
+    for _ in range(5):
+        table.Update()
+
+    assert writes == [90]
+    assert table.first_row == 90
+
+    ScrollTable(monkeypatch, table, 89)
+    table.Update()
+    assert writes == [90, 89]
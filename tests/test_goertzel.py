@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from design.dsp.goertzel import GoertzelMagnitudes, GoertzelTracker
+
+def DirectAmplitudes(y_data, sample_rate, frequencies):
+    n = np.arange(len(y_data))
+    return np.array([2 * np.abs(np.sum(y_data * np.exp(-2j * np.pi * frequency * n / sample_rate))) / len(y_data) for frequency in frequencies])
+
+def test_magnitudes_match_rfft():
+    sample_rate = 4800.0
+    samples     = 4800
+    bins        = np.array([0, 1, 50, 123, 600, 2399, 2400])
+    frequencies = bins * sample_rate / samples
+    y_data      = np.random.default_rng(0).standard_normal(samples)
+
+    expected = 2 * np.abs(np.fft.rfft(y_data))[bins] / samples
+
+    np.testing.assert_allclose(GoertzelMagnitudes(y_data, sample_rate, frequencies), expected, rtol=1e-8, atol=1e-12)
+
+@pytest.mark.parametrize("sub_block", [1, 7, 256, 5000])
+def test_chunked_blocks_match_whole_blocks(sub_block):
+    sample_rate = 48000.0
+    block_size  = 1000
+    frequencies = [0.0, 440.0, 1234.5, 24000.0]
+    y_data      = np.random.default_rng(1).standard_normal(3 * block_size)
+
+    expected = [DirectAmplitudes(block, sample_rate, frequencies) for block in np.split(y_data, 3)]
+
+    tracker = GoertzelTracker(frequencies, sample_rate, block_size, sub_block=sub_block)
+    results = []
+    for chunk in np.array_split(y_data, 41):
+        if tracker.Process(chunk):
+            results.append(tracker.GetMagnitudes())
+
+    assert len(results) == 3
+    np.testing.assert_allclose(results, expected, rtol=1e-9, atol=1e-12)
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from design.dsp.graph import BuildSignalGraph, ProcessingGraph, Ref
+
+def test_strings_are_constants_and_refs_are_references():
+    graph = BuildSignalGraph()
+    graph.SetParameter("samples", 256)
+    graph.AddNode("window", "window", signal=Ref("filtered"), kind="hann")
+
+    output = graph.Evaluate("window")["window"]
+
+    np.testing.assert_allclose(output, graph.Get("signal.y") * np.hanning(256))
+
+def test_reference_to_a_missing_node_is_rejected():
+    graph = ProcessingGraph().AddParameter("signal")
+
+    with pytest.raises(ValueError):
+        graph.AddNode("spectrum", "spectrum", signal=Ref("signal"), sample_rate=Ref("sample_rate"))
+
+def test_only_downstream_nodes_run_again():
+    graph = BuildSignalGraph()
+    graph.SetParameter("samples", 1024)
+    graph.SetParameter("filter_type", "Low Pass")
+    graph.Evaluate()
+
+    graph.SetParameter("cutoff", 20.0)
+    graph.Evaluate()
+    ran = {entry["name"] for entry in graph.GetTimingReport() if entry["ran"]}
+
+    assert ran == {"filtered", "spectrum", "measurements", "harmonics", "peaks"}
+
+    graph.Evaluate()
+    assert not any(entry["ran"] for entry in graph.GetTimingReport())
@@ -0,0 +1,45 @@
+from unittest import mock
+import contextlib
+import pytest
+
+from design.controllers.plot_controls_controller import PlotControlsController
+from design.models.plot_controls_model import PlotControlsModel
+from design.views.plot_controls_view import PlotControlsView
+import controls as cc
+
+# Every DearPyGUI call the controller and the controls use to change items
+WRITERS = ["set_value", "configure_item", "delete_item", "add_line_series", "add_scatter_series",
+           "add_plot_annotation", "set_axis_limits", "fit_axis_data", "hide_item", "show_item"]
+
+@pytest.fixture
+def controller():
+
+    # The view only asks tkinter for the screen size, so no display is needed
+    root = mock.Mock()
+    root.winfo_screenwidth.return_value  = 1920
+    root.winfo_screenheight.return_value = 1080
+    with mock.patch("tkinter.Tk", return_value=root):
+        view = PlotControlsView()
+
+    yield PlotControlsController(view, PlotControlsModel())
+
+    cc.dpg.destroy_context()
+    cc.ValueBinder.Clear()
+    cc.ThemeRegistry.Clear()
+
+def test_idle_frames_do_not_write(controller):
+    controller.GenWaveformButtonCallback()
+
+    # The callback and the flush run without rendering so no viewport is needed
+    writes = []
+    with contextlib.ExitStack() as stack:
+        patched = {name: stack.enter_context(mock.patch.object(cc.dpg, name, wraps=getattr(cc.dpg, name))) for name in WRITERS}
+        for _ in range(10):
+            for writer in patched.values():
+                writer.reset_mock()
+            controller.UpdatePlotCallback()
+            cc.ValueBinder.Flush()
+            writes.append({name: writer.call_count for name, writer in patched.items() if writer.call_count})
+
+    assert writes[0], "The first frame should draw the waveform"
+    assert writes[1:] == [{}] * 9
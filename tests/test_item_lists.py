@@ -0,0 +1,74 @@
+import dearpygui.dearpygui as dpg
+import numpy as np
+import pytest
+
+from controls import ComboBox, ItemCollection, ListBox, ThemeRegistry, ValueBinder, Window
+
+@pytest.fixture
+def window():
+    dpg.create_context()
+    yield Window()
+    ValueBinder.Clear()
+    ThemeRegistry.Clear()
+    dpg.destroy_context()
+
+def ShownItems(control) -> 'list[str]':
+    return list(dpg.get_item_configuration(control.tag)["items"])
+
+def test_items_keep_insertion_order_without_duplicates():
+    items = ItemCollection(["b", "a"])
+
+    assert items.Add(["c", "a", "", "d", "c"])
+    assert not items.Add(["a", "b", ""])
+    assert items.GetItems() == ["b", "a", "c", "d"]
+
+    assert items.Remove(["a", "missing"])
+    assert not items.Remove(["missing"])
+    assert items.GetItems() == ["b", "c", "d"]
+    assert len(items) == 3 and "c" in items and "a" not in items
+
+def test_filter_matches_brute_force():
+    rng   = np.random.default_rng(0)
+    words = ["".join(rng.choice(list("abcAB"), rng.integers(1, 6))) for _ in range(500)]
+    items = ItemCollection(words)
+
+    for text in ("a", "AB", "bca", "cc", "zz", "b"):
+        expected = [item for item in dict.fromkeys(words) if text.lower() in item.lower()]
+        assert items.Filter(text) == expected
+
+    assert items.Filter("") == items.GetItems()
+
+def test_filter_sees_added_and_removed_items():
+    items = ItemCollection(["alpha", "beta"])
+    assert items.Filter("a") == ["alpha", "beta"]
+
+    items.Add(["gamma"])
+    items.Remove(["alpha"])
+    assert items.Filter("a") == ["beta", "gamma"]
+
+@pytest.mark.parametrize("control_type", [ListBox, ComboBox])
+def test_bulk_updates_reach_the_control(window, control_type):
+    control = control_type(items=["one", "two"], parent=window)
+
+    control.AddItems(["three", "two", "four"]).RemoveItems(["one"])
+    assert control.GetItems() == ["two", "three", "four"]
+    assert ShownItems(control) == ["two", "three", "four"]
+
+    control.ShowFilteredItems("T")
+    assert ShownItems(control) == ["two", "three"]
+    assert control.FilterItems("f") == ["four"]
+
+    # Items added while filtered only show if they match the filter
+    control.AddItems(["ten", "five"])
+    assert ShownItems(control) == ["two", "three", "ten"]
+    assert control.GetItems() == ["two", "three", "four", "ten", "five"]
+
+    control.ShowFilteredItems("")
+    assert ShownItems(control) == control.GetItems()
+
+def test_single_item_helpers(window):
+    list_box  = ListBox(items=["a"], parent=window).AddToListBox("b").AddToListBox("a").DeleteFromListBox("a")
+    combo_box = ComboBox(items=["a"], parent=window).AddToComboBox("b").AddToComboBox("a").DeleteFromComboBox("a")
+
+    assert ShownItems(list_box) == list_box.GetItems() == ["b"]
+    assert ShownItems(combo_box) == combo_box.GetItems() == ["b"]
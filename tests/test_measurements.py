@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from design.dsp.measurements import MeasureHarmonics, MeasureSignal, RunningStatistics
+from design.dsp.spectrum import ComputeMagnitudeSpectrum, ComputeZoomSpectrum
+
+@pytest.mark.parametrize("samples", [2, 3, 4, 5])
+def test_tiny_buffers(samples):
+    sample_rate = 48000.0
+    y_data      = np.sin(2 * np.pi * 1000.0 * np.arange(samples) / sample_rate)
+
+    freqs, magnitude = ComputeMagnitudeSpectrum(y_data, sample_rate)
+    assert len(freqs) == len(magnitude) == samples // 2 + 1
+    assert np.all(np.isfinite(magnitude))
+
+    freqs, magnitude = ComputeZoomSpectrum(y_data, sample_rate, 0.0, sample_rate / 2, 16)
+    assert np.all(np.isfinite(magnitude))
+
+    # Three bins or fewer leave nothing above the DC leakage to call the fundamental
+    thd, snr = MeasureHarmonics(ComputeMagnitudeSpectrum(y_data, sample_rate)[1])
+    assert np.isnan(thd) and np.isnan(snr)
+
+    assert all(np.isfinite(value) for value in MeasureSignal(y_data, sample_rate).values())
+
+def test_running_statistics_match_whole_buffer():
+    sample_rate = 48000.0
+    y_data      = 0.5 + np.sin(2 * np.pi * 440.0 * np.arange(48000) / sample_rate)
+    y_data     += np.random.default_rng(0).normal(0, 1e-3, len(y_data))
+
+    statistics = RunningStatistics()
+    for chunk in np.array_split(y_data, 37):
+        statistics.Update(chunk)
+
+    expected = MeasureSignal(y_data, sample_rate)
+    measured = statistics.GetMeasurements(sample_rate)
+    for name in ("rms", "mean", "peak_to_peak"):
+        assert measured[name] == pytest.approx(expected[name], rel=1e-12)
+
+    # The streamed crossings use the mean as it stood at each chunk boundary, allow a crossing either way
+    assert measured["zero_cross"] == pytest.approx(expected["zero_cross"], abs=sample_rate / len(y_data))
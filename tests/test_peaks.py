@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from design.dsp.peaks import FindSpectralPeaks
+from design.dsp.spectrum import ComputeMagnitudeSpectrum
+
+def BruteForcePeaks(magnitude, max_peaks, prominence, prominence_bins):
+    threshold = prominence * magnitude.max()
+    peaks     = []
+    for index in range(1, len(magnitude) - 1):
+        if not (magnitude[index] > magnitude[index - 1] and magnitude[index] >= magnitude[index + 1]):
+            continue
+        left  = min(magnitude[max(index - offset, 0)] for offset in range(1, prominence_bins + 1))
+        right = min(magnitude[min(index + offset, len(magnitude) - 1)] for offset in range(1, prominence_bins + 1))
+        if magnitude[index] >= threshold and magnitude[index] - max(left, right) >= threshold:
+            peaks.append(index)
+
+    return sorted(peaks, key=lambda index: magnitude[index], reverse=True)[:max_peaks]
+
+@pytest.mark.parametrize("max_peaks", [1, 5, 50])
+def test_peaks_match_brute_force(max_peaks):
+    magnitude = np.abs(np.random.default_rng(0).standard_normal(2000)) ** 3
+    freqs     = np.arange(len(magnitude)) * 0.5
+
+    peaks = FindSpectralPeaks(freqs, magnitude, max_peaks=max_peaks, prominence=0.05, prominence_bins=4)
+
+    assert list(peaks["bin"]) == BruteForcePeaks(magnitude, max_peaks, 0.05, 4)
+    assert np.all(np.diff(magnitude[peaks["bin"]]) <= 0)
+
+def test_tones_are_found_between_bins():
+    sample_rate = 48000.0
+    n           = np.arange(4800)
+    tones       = [(1234.5, 1.0), (3333.3, 0.5), (7000.2, 0.25)]
+    y_data      = sum(amplitude * np.sin(2 * np.pi * frequency * n / sample_rate) for frequency, amplitude in tones)
+
+    freqs, magnitude = ComputeMagnitudeSpectrum(y_data, sample_rate)
+    peaks            = FindSpectralPeaks(freqs, magnitude, max_peaks=3)
+
+    bin_width = freqs[1] - freqs[0]
+    np.testing.assert_allclose(peaks["frequency"], [frequency for frequency, _ in tones], atol=0.05 * bin_width)
+
+    # The hann main lobe is close to but not exactly gaussian, half a bin off it reads a few percent high
+    np.testing.assert_allclose(peaks["magnitude"], [amplitude for _, amplitude in tones], rtol=0.05)
+
+def test_short_spectra_have_no_peaks():
+    assert len(FindSpectralPeaks(np.arange(2.0), np.ones(2))) == 0
+    assert len(FindSpectralPeaks(np.arange(10.0), np.zeros(10))) == 0
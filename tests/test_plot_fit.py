@@ -0,0 +1,86 @@
+import dearpygui.dearpygui as dpg
+import numpy as np
+import pytest
+
+from controls import Plot, ThemeRegistry, ValueBinder, Window
+from design.dsp.measurements import SlidingRange
+
+@pytest.fixture
+def plot():
+    dpg.create_context()
+    yield Plot(x_label="x", y_label="y", parent=Window())
+    ValueBinder.Clear()
+    ThemeRegistry.Clear()
+    dpg.destroy_context()
+
+@pytest.mark.parametrize("percentile", [None, 0, 1, 5, 25])
+def test_data_range_matches_sorting(percentile):
+    data     = np.random.default_rng(0).standard_normal(1001)
+    ordered  = np.sort(data)
+    low      = int(len(data) * (percentile or 0) / 100)
+
+    assert Plot.ComputeDataRange(data, percentile) == (ordered[low], ordered[len(data) - 1 - low])
+    assert Plot.ComputeDataRange([]) is None
+
+def test_series_bounds_are_taken_on_upload(plot):
+    plot.PlotLineSeriesData(x_data=[0.0, 1.0, 2.0], y_data=[-1.0, 3.0, 2.0])
+    plot.PlotMarkerSeriesData(x_data=[5.0], y_data=[-4.0])
+    assert plot.GetDataBounds() == (0.0, 5.0, -4.0, 3.0)
+
+    # A known range is used as is, an empty series drops out of the union
+    plot.PlotLineSeriesData(x_data=[0.0, 1.0], y_data=[0.0, 1.0], x_range=(0.0, 10.0), y_range=(-2.0, 2.0))
+    plot.PlotMarkerSeriesData(x_data=[], y_data=[])
+    assert plot.GetDataBounds() == (0.0, 10.0, -2.0, 2.0)
+
+def test_y_fit_grows_at_once_and_shrinks_with_hysteresis(plot, monkeypatch):
+    updates = []
+    monkeypatch.setattr(plot, "SetYAxisLimits", lambda low, high: updates.append((low, high)))
+
+    def Fit(low, high):
+        plot.PlotLineSeriesData(x_data=[0.0, 1.0], y_data=[low, high])
+        plot.AutoFitYAxis(margin=0.0)
+
+    Fit(-1.0, 1.0)
+    assert updates == [(-1.0, 1.0)]
+
+    # Data inside the limits and spanning at least 75% of them leaves the axis alone
+    Fit(-0.9, 0.8)
+    Fit(-0.75, 0.75)
+    assert len(updates) == 1
+
+    # Leaving the limits on either side grows them immediately
+    Fit(-0.5, 1.2)
+    assert updates[-1] == (-0.5, 1.2)
+
+    # Spanning less than 75% of the limits shrinks them, just above it does not
+    Fit(-0.4, 1.0)
+    assert len(updates) == 2
+    Fit(-0.5, 0.5)
+    assert updates[-1] == (-0.5, 0.5)
+
+def test_flat_line_gets_a_visible_range(plot):
+    plot.PlotLineSeriesData(x_data=[0.0, 1.0], y_data=[2.0, 2.0])
+    plot.AutoFitYAxis()
+
+    low, high = plot.fit_limits["y"]
+    assert low < 2.0 < high
+
+def test_sliding_range_matches_the_window():
+    rng      = np.random.default_rng(0)
+    capacity = 1000
+    stream   = np.empty(0)
+    sliding  = SlidingRange(capacity)
+    assert sliding.GetRange() is None
+
+    for size in rng.integers(1, 200, 100):
+        chunk     = rng.standard_normal(size) * rng.uniform(0.1, 10.0)
+        stream    = np.concatenate([stream, chunk])
+        sliding.Update(chunk)
+        window    = stream[-capacity:]
+        low, high = sliding.GetRange()
+
+        # Never narrower than the window, and no wider than the window plus the chunk scrolling out
+        assert low <= window.min() and high >= window.max()
+        assert sliding.count - sliding.chunks[0][0] < capacity
+        kept = stream[-sliding.count:]
+        assert (low, high) == (kept.min(), kept.max())
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from design.dsp.spectrum import ChirpZPlan, ComputeMagnitudeSpectrum, ComputeZoomSpectrum
+
+@pytest.mark.parametrize("oversample", [1, 4])
+def test_zoom_matches_rfft_on_aligned_bins(oversample):
+    sample_rate = 8000.0
+    samples     = 3000
+    y_data      = np.random.default_rng(0).standard_normal(samples)
+    first, last = 120, 480
+
+    freqs, magnitude = ComputeMagnitudeSpectrum(y_data, sample_rate)
+    zoom_freqs, zoom = ComputeZoomSpectrum(y_data, sample_rate, freqs[first], freqs[last], oversample * (last - first) + 1)
+
+    np.testing.assert_allclose(zoom_freqs[::oversample], freqs[first:last + 1])
+    np.testing.assert_allclose(zoom[::oversample], magnitude[first:last + 1], rtol=1e-7, atol=1e-12)
+
+def test_zoom_resolves_a_tone_between_bins():
+    sample_rate = 48000.0
+    frequency   = 1003.7
+    y_data      = np.sin(2 * np.pi * frequency * np.arange(4800) / sample_rate)
+
+    freqs, magnitude = ComputeZoomSpectrum(y_data, sample_rate, 950.0, 1050.0, 1001)
+
+    assert abs(freqs[np.argmax(magnitude)] - frequency) <= freqs[1] - freqs[0]
+    assert magnitude.max() == pytest.approx(1.0, rel=1e-3)
+
+def test_zoom_plan_is_reused():
+    y_data = np.random.default_rng(1).standard_normal(1000)
+
+    ChirpZPlan.cache_clear()
+    for _ in range(3):
+        ComputeZoomSpectrum(y_data, 1000.0, 100.0, 200.0, 256)
+
+    assert ChirpZPlan.cache_info().hits == 2